@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+Desplazamiento virtual compartido por las ventanas de los ejercicios.
+
+La ventana solo crea los widgets de las filas visibles y los vuelve a llenar al
+moverse; la barra de desplazamiento y la rueda del ratón se manejan aquí.
+"""
+
+
+class DesplazamientoVirtual:
+    """
+    Mezcla para ventanas Tk. La clase que la usa define FILAS_VISIBLES,
+    self.barra (ttk.Scrollbar creada con command=self._onScroll), _totalFilas()
+    y _pintarFilas(), que llena los widgets a partir de la fila self.desde.
+    """
+
+    def _totalFilas(self) -> int:
+        raise NotImplementedError
+
+    def _pintarFilas(self):
+        raise NotImplementedError
+
+    def _enlazarRueda(self, *widgets):
+        for widget in widgets:
+            for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                widget.bind(evento, self._onRueda)
+
+    def _maxDesde(self) -> int:
+        return max(0, self._totalFilas() - self.FILAS_VISIBLES)
+
+    def _moverA(self, desde: int, forzar: bool = False):
+        desde = min(max(0, desde), self._maxDesde())
+        if desde != self.desde or forzar:
+            self.desde = desde
+            self._pintar()
+
+    def _pintar(self):
+        self._pintarFilas()
+        n = self._totalFilas()
+        if n:
+            self.barra.set(self.desde / n, min(1.0, (self.desde + self.FILAS_VISIBLES) / n))
+        else:
+            self.barra.set(0.0, 1.0)
+
+    def _onScroll(self, accion, cantidad, unidad=None):
+        if accion == "moveto":
+            self._moverA(int(float(cantidad) * self._totalFilas()))
+        elif unidad == "pages":
+            self._moverA(self.desde + int(cantidad) * self.FILAS_VISIBLES)
+        else:
+            self._moverA(self.desde + int(cantidad))
+
+    def _onRueda(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self._moverA(self.desde - 1)
+        else:
+            self._moverA(self.desde + 1)
+        return "break"
@@ -4,6 +4,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from enum import Enum
+from array import array
+import csv
+import gzip
+import io
+import itertools
+import os
+import queue
+import threading
+from typing import Callable, Iterator, Optional, Sequence
+
+from Desplazamiento import DesplazamientoVirtual
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se calcula con arreglos de la librería estándar
+    np = None
 
 
 class TipoCargo(Enum):
@@ -19,6 +35,10 @@ class TipoGenero(Enum):
 class Empleado:
 
 
+    # Una nómina cargada de CSV puede tener cientos de miles de empleados: sin __dict__ por objeto
+    __slots__ = ("nombre", "apellidos", "cargo", "genero", "salarioDia", "diasTrabajados",
+                 "otrosIngresos", "pagosSalud", "aportePensiones")
+
     def __init__(self, nombre: str, apellidos: str, cargo: TipoCargo,
                  genero: TipoGenero, salarioDia: float, diasTrabajados: int,
                  otrosIngresos: float, pagosSalud: float, aportePensiones: float):
@@ -48,35 +68,261 @@ class Empleado:
         return (self.salarioDia * self.diasTrabajados) + self.otrosIngresos - self.pagosSalud - self.aportePensiones
 
 
+CARGOS = list(TipoCargo)
+GENEROS = list(TipoGenero)
+
+
+class ColumnasEmpleados:
+    """
+    Almacenamiento columnar de empleados: cada campo numérico vive en un
+    arreglo tipado contiguo y cargo/género se guardan como códigos enteros.
+    La nómina de todos los empleados se calcula en una sola pasada.
+    """
+
+    def __init__(self):
+        self.nombres: list[str] = []
+        self.apellidos: list[str] = []
+        self.cargos = array("B")
+        self.generos = array("B")
+        self.salarioDia = array("d")
+        self.diasTrabajados = array("i")
+        self.otrosIngresos = array("d")
+        self.pagosSalud = array("d")
+        self.aportePensiones = array("d")
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def agregar(self, e: Empleado):
+        self.nombres.append(e.getNombre())
+        self.apellidos.append(e.getApellidos())
+        self.cargos.append(CARGOS.index(e.getCargo()))
+        self.generos.append(GENEROS.index(e.getGenero()))
+        self.salarioDia.append(e.getSalarioDia())
+        self.diasTrabajados.append(e.getDiasTrabajados())
+        self.otrosIngresos.append(e.getOtrosIngresos())
+        self.pagosSalud.append(e.getPagosSalud())
+        self.aportePensiones.append(e.getAportePensiones())
+
+    def extender(self, otras: "ColumnasEmpleados"):
+        """Agrega al final todas las filas de otro almacén columnar."""
+        self.nombres.extend(otras.nombres)
+        self.apellidos.extend(otras.apellidos)
+        self.cargos.extend(otras.cargos)
+        self.generos.extend(otras.generos)
+        self.salarioDia.extend(otras.salarioDia)
+        self.diasTrabajados.extend(otras.diasTrabajados)
+        self.otrosIngresos.extend(otras.otrosIngresos)
+        self.pagosSalud.extend(otras.pagosSalud)
+        self.aportePensiones.extend(otras.aportePensiones)
+
+    def reemplazar(self, i: int, e: Empleado):
+        self.nombres[i] = e.getNombre()
+        self.apellidos[i] = e.getApellidos()
+        self.cargos[i] = CARGOS.index(e.getCargo())
+        self.generos[i] = GENEROS.index(e.getGenero())
+        self.salarioDia[i] = e.getSalarioDia()
+        self.diasTrabajados[i] = e.getDiasTrabajados()
+        self.otrosIngresos[i] = e.getOtrosIngresos()
+        self.pagosSalud[i] = e.getPagosSalud()
+        self.aportePensiones[i] = e.getAportePensiones()
+
+    def eliminar(self, i: int):
+        for columna in (self.nombres, self.apellidos, self.cargos, self.generos,
+                        self.salarioDia, self.diasTrabajados, self.otrosIngresos,
+                        self.pagosSalud, self.aportePensiones):
+            del columna[i]
+
+    def empleado(self, i: int) -> Empleado:
+        """Construye bajo demanda un Empleado con los datos de la fila i (copia, no referencia)."""
+        return Empleado(self.nombres[i], self.apellidos[i],
+                        CARGOS[self.cargos[i]], GENEROS[self.generos[i]],
+                        self.salarioDia[i], self.diasTrabajados[i],
+                        self.otrosIngresos[i], self.pagosSalud[i], self.aportePensiones[i])
+
+    def nomina(self, i: int) -> float:
+        return (self.salarioDia[i] * self.diasTrabajados[i]) + self.otrosIngresos[i] - self.pagosSalud[i] - self.aportePensiones[i]
+
+    def calcularNominas(self) -> Sequence[float]:
+        """Nómina de cada fila calculada en una pasada vectorizada."""
+        if len(self) == 0:
+            return array("d")
+        if np is not None:
+            # frombuffer no copia: opera directamente sobre la memoria de los arreglos
+            s = np.frombuffer(self.salarioDia, dtype=np.float64)
+            d = np.frombuffer(self.diasTrabajados, dtype=np.intc)
+            o = np.frombuffer(self.otrosIngresos, dtype=np.float64)
+            p = np.frombuffer(self.pagosSalud, dtype=np.float64)
+            a = np.frombuffer(self.aportePensiones, dtype=np.float64)
+            return s * d + o - p - a
+        return array("d", map(lambda s, d, o, p, a: s * d + o - p - a,
+                              self.salarioDia, self.diasTrabajados, self.otrosIngresos,
+                              self.pagosSalud, self.aportePensiones))
+
+
 class ListaEmpleados:
   
-    def __init__(self):
+    def __init__(self, columnar: bool = False, verificarConsistencia: bool = False):
         self.lista: list[Empleado] = []
+        # Totales mantenidos de forma incremental en cada alta, cambio y baja. Todo cambio debe
+        # pasar por agregarEmpleado/actualizarEmpleado/eliminarEmpleado: asignar directamente un
+        # atributo de un Empleado ya agregado no ajusta los totales (llamar recalcularTotales).
         self.totalNomina: float = 0.0
+        self.subtotalesCargo: dict[TipoCargo, float] = {c: 0.0 for c in TipoCargo}
+        self.subtotalesGenero: dict[TipoGenero, float] = {g: 0.0 for g in TipoGenero}
+        # Modo columnar: los empleados se guardan en arreglos tipados en lugar de objetos
+        self.columnas: Optional[ColumnasEmpleados] = ColumnasEmpleados() if columnar else None
+        # Modo de verificación (para pruebas): compara los totales con un recálculo completo tras cada cambio
+        self.verificarConsistencia = verificarConsistencia
+
+    def __len__(self) -> int:
+        if self.columnas is not None:
+            return len(self.columnas)
+        return len(self.lista)
+
+    def obtenerEmpleado(self, i: int) -> Empleado:
+        if self.columnas is not None:
+            return self.columnas.empleado(i)
+        return self.lista[i]
+
+    def empleados(self) -> Iterator[Empleado]:
+        if self.columnas is not None:
+            return (self.columnas.empleado(i) for i in range(len(self.columnas)))
+        return iter(self.lista)
+
+    def _acumular(self, e: Empleado, signo: int):
+        sueldo = signo * e.calcularNomina()
+        self.totalNomina += sueldo
+        self.subtotalesCargo[e.getCargo()] += sueldo
+        self.subtotalesGenero[e.getGenero()] += sueldo
+        if len(self) == 0:
+            # Lista vacía: se descarta el error de redondeo acumulado
+            self._reiniciarTotales()
+
+    def _reiniciarTotales(self):
+        self.totalNomina = 0.0
+        self.subtotalesCargo = {c: 0.0 for c in TipoCargo}
+        self.subtotalesGenero = {g: 0.0 for g in TipoGenero}
 
     def agregarEmpleado(self, a: Empleado):
-        self.lista.append(a)
+        if self.columnas is not None:
+            self.columnas.agregar(a)
+        else:
+            self.lista.append(a)
+        self._acumular(a, +1)
+        if self.verificarConsistencia:
+            self.verificarTotales()
+
+    def agregarBloque(self, bloque: ColumnasEmpleados):
+        """Agrega de una vez un bloque de empleados ya convertidos a columnas."""
+        nominas = bloque.calcularNominas()
+        if self.columnas is not None:
+            self.columnas.extender(bloque)
+        else:
+            self.lista.extend(bloque.empleado(i) for i in range(len(bloque)))
+        if np is not None and len(nominas):
+            porCargo = np.bincount(np.frombuffer(bloque.cargos, dtype=np.uint8), weights=nominas, minlength=len(CARGOS))
+            porGenero = np.bincount(np.frombuffer(bloque.generos, dtype=np.uint8), weights=nominas, minlength=len(GENEROS))
+        else:
+            porCargo = [0.0] * len(CARGOS)
+            porGenero = [0.0] * len(GENEROS)
+            for cargo, genero, sueldo in zip(bloque.cargos, bloque.generos, nominas):
+                porCargo[cargo] += sueldo
+                porGenero[genero] += sueldo
+        for k, c in enumerate(CARGOS):
+            self.subtotalesCargo[c] += float(porCargo[k])
+        for k, g in enumerate(GENEROS):
+            self.subtotalesGenero[g] += float(porGenero[k])
+        self.totalNomina += float(sum(porCargo))
+        if self.verificarConsistencia:
+            self.verificarTotales()
+
+    def actualizarEmpleado(self, i: int, a: Empleado):
+        """Reemplaza el empleado de la posición i ajustando los totales (a debe ser un objeto nuevo)."""
+        anterior = self.obtenerEmpleado(i)
+        if self.columnas is not None:
+            self.columnas.reemplazar(i, a)
+        else:
+            self.lista[i] = a
+        self._acumular(anterior, -1)
+        self._acumular(a, +1)
+        if self.verificarConsistencia:
+            self.verificarTotales()
+
+    def eliminarEmpleado(self, i: int) -> Empleado:
+        anterior = self.obtenerEmpleado(i)
+        if self.columnas is not None:
+            self.columnas.eliminar(i)
+        else:
+            del self.lista[i]
+        self._acumular(anterior, -1)
+        if self.verificarConsistencia:
+            self.verificarTotales()
+        return anterior
+
+    def calcularNominas(self) -> Sequence[float]:
+        """Nómina de cada empleado en orden de inserción."""
+        if self.columnas is not None:
+            return self.columnas.calcularNominas()
+        return [e.calcularNomina() for e in self.lista]
 
     def calcularTotalNomina(self) -> float:
-        # En Java se acumulaba sin reset, aquí lo corregimos para evitar doble conteo.
-        self.totalNomina = sum(e.calcularNomina() for e in self.lista)
+        # El total se mantiene al día en cada cambio, consultarlo es O(1).
         return self.totalNomina
 
+    def recalcularTotales(self):
+        """Recalcula total y subtotales recorriendo todos los empleados."""
+        self._reiniciarTotales()
+        if self.columnas is not None:
+            c = self.columnas
+            for cargo, genero, sueldo in zip(c.cargos, c.generos, c.calcularNominas()):
+                self.totalNomina += sueldo
+                self.subtotalesCargo[CARGOS[cargo]] += sueldo
+                self.subtotalesGenero[GENEROS[genero]] += sueldo
+        else:
+            for e in self.lista:
+                sueldo = e.calcularNomina()
+                self.totalNomina += sueldo
+                self.subtotalesCargo[e.getCargo()] += sueldo
+                self.subtotalesGenero[e.getGenero()] += sueldo
+
+    def verificarTotales(self, tolerancia: float = 1e-6):
+        """Compara los totales incrementales con un recálculo completo; lanza ValueError si difieren."""
+        actuales = (self.totalNomina, self.subtotalesCargo, self.subtotalesGenero)
+        self.recalcularTotales()
+        esperados = (self.totalNomina, self.subtotalesCargo, self.subtotalesGenero)
+        self.totalNomina, self.subtotalesCargo, self.subtotalesGenero = actuales
+        pares = [("total", actuales[0], esperados[0])]
+        pares += [(c.value, actuales[1][c], esperados[1][c]) for c in TipoCargo]
+        pares += [(g.value, actuales[2][g], esperados[2][g]) for g in TipoGenero]
+        for nombre, actual, esperado in pares:
+            if abs(actual - esperado) > tolerancia * max(1.0, abs(esperado)):
+                raise ValueError(f"Total '{nombre}' inconsistente: {actual} (esperado {esperado})")
+
     def obtenerMatriz(self):
       
-        datos = []
-        self.totalNomina = 0.0
-        for e in self.lista:
-            sueldo = e.calcularNomina()
-            datos.append([e.getNombre(), e.getApellidos(), f"{sueldo:.2f}"])
-            self.totalNomina += sueldo
-        return datos
+        if self.columnas is not None:
+            c = self.columnas
+            return [[n, a, f"{sueldo:.2f}"] for n, a, sueldo in zip(c.nombres, c.apellidos, c.calcularNominas())]
+
+        return [[e.getNombre(), e.getApellidos(), f"{e.calcularNomina():.2f}"] for e in self.lista]
+
+    def obtenerFila(self, i: int) -> list:
+        """Fila i de la matriz de la nómina, formateada bajo demanda."""
+        if self.columnas is not None:
+            c = self.columnas
+            return [c.nombres[i], c.apellidos[i], f"{c.nomina(i):.2f}"]
+        e = self.lista[i]
+        return [e.getNombre(), e.getApellidos(), f"{e.calcularNomina():.2f}"]
 
     def convertirTexto(self) -> str:
      
-        texto = ""
-        for e in self.lista:
-            texto += (
+        return "".join(self.bloquesTexto())
+
+    def bloquesTexto(self) -> Iterator[str]:
+        """Genera el reporte de la nómina bloque a bloque: uno por empleado y al final el total."""
+        for e in self.empleados():
+            yield (
                 f"Nombre = {e.getNombre()}\n"
                 f"Apellidos = {e.getApellidos()}\n"
                 f"Cargo = {e.getCargo().value}\n"
@@ -87,9 +333,220 @@ class ListaEmpleados:
                 f"Pagos salud = ${e.getPagosSalud():.2f}\n"
                 f"Aportes pensiones = ${e.getAportePensiones():.2f}\n---------\n"
             )
-        total = self.calcularTotalNomina()
-        texto += f"Total nómina = ${total:.2f}"
-        return texto
+        yield f"Total nómina = ${self.totalNomina:.2f}"
+
+    def escribirArchivo(self, ruta: str, comprimir: bool = False, tamañoBuffer: int = 1 << 20,
+                        progreso: Optional[Callable[[int, int], None]] = None,
+                        cancelado: Optional[threading.Event] = None,
+                        intervaloProgreso: int = 1000) -> bool:
+        """
+        Escribe el reporte por bloques (gzip si comprimir=True).
+        Si se cancela o falla, borra el archivo parcial; al cancelar retorna False.
+        """
+        total = len(self)
+        if comprimir:
+            f = io.TextIOWrapper(io.BufferedWriter(gzip.open(ruta, "wb"), buffer_size=tamañoBuffer), encoding="utf-8")
+        else:
+            f = open(ruta, "w", encoding="utf-8", buffering=tamañoBuffer)
+        try:
+            with f:
+                if progreso is None and cancelado is None:
+                    f.writelines(self.bloquesTexto())
+                    return True
+                for hechos, bloque in enumerate(self.bloquesTexto()):
+                    if cancelado is not None and cancelado.is_set():
+                        break
+                    f.write(bloque)
+                    if progreso is not None and hechos % intervaloProgreso == 0:
+                        progreso(hechos, total)
+                else:
+                    if progreso is not None:
+                        progreso(total, total)
+                    return True
+        except BaseException:
+            if os.path.exists(ruta):
+                os.remove(ruta)
+            raise
+        os.remove(ruta)
+        return False
+
+
+class ExportacionNomina(threading.Thread):
+    """
+    Hilo que escribe el archivo de la nómina y publica su avance en una cola,
+    para que la ventana la consulte con after() sin bloquear el ciclo de eventos.
+    Mensajes: ("progreso", hechos, total), ("fin", completo) y ("error", excepcion).
+    """
+
+    def __init__(self, lista: ListaEmpleados, ruta: str, comprimir: bool = False):
+        super().__init__(daemon=True)
+        self.lista = lista
+        self.ruta = ruta
+        self.comprimir = comprimir
+        self.cola: queue.Queue = queue.Queue()
+        self.cancelado = threading.Event()
+
+    def run(self):
+        try:
+            completo = self.lista.escribirArchivo(
+                self.ruta, self.comprimir,
+                progreso=lambda hechos, total: self.cola.put(("progreso", hechos, total)),
+                cancelado=self.cancelado)
+            self.cola.put(("fin", completo))
+        except Exception as e:
+            self.cola.put(("error", e))
+
+    def cancelar(self):
+        self.cancelado.set()
+
+
+class ResultadoCarga:
+    """Resumen de una carga masiva: filas agregadas y filas rechazadas (línea, motivo)."""
+
+    def __init__(self):
+        self.cargados = 0
+        self.errores: list[tuple[int, str]] = []
+
+
+class CargadorEmpleados:
+    """Carga masiva desde CSV o Parquet por bloques; las filas con errores se reportan sin detener la carga."""
+
+    COLUMNAS = ("nombre", "apellidos", "cargo", "genero", "salarioDia",
+                "diasTrabajados", "otrosIngresos", "pagosSalud", "aportePensiones")
+
+    # Se aceptan el valor ("Estratégico"), el nombre ("ESTRATEGICO") y sus minúsculas
+    CODIGOS_CARGO = {clave: k for k, c in enumerate(CARGOS)
+                     for clave in (c.value, c.name, c.value.lower(), c.name.lower())}
+    CODIGOS_GENERO = {clave: k for k, g in enumerate(GENEROS)
+                      for clave in (g.value, g.name, g.value.lower(), g.name.lower())}
+
+    def __init__(self, lista: ListaEmpleados, tamañoBloque: int = 50_000):
+        self.lista = lista
+        self.tamañoBloque = tamañoBloque
+
+    def cargarCSV(self, ruta: str, delimitador: str = ",", encoding: str = "utf-8-sig") -> ResultadoCarga:
+        # utf-8-sig: Excel guarda los CSV con BOM, que de otro modo quedaría pegado a la primera columna
+        resultado = ResultadoCarga()
+        with open(ruta, newline="", encoding=encoding) as f:
+            lector = csv.reader(f, delimiter=delimitador)
+            encabezado = next(lector, None)
+            if encabezado is None:
+                return resultado
+            orden = self._ordenColumnas(encabezado)
+            ancho = len(encabezado)
+            reordenar = ancho != len(self.COLUMNAS) or orden != list(range(ancho))
+            linea = 2  # la línea 1 es el encabezado
+            while True:
+                filas = list(itertools.islice(lector, self.tamañoBloque))
+                if not filas:
+                    break
+                lineas = range(linea, linea + len(filas))
+                linea += len(filas)
+                if reordenar:
+                    # Se llevan las columnas al orden esperado; las filas de otro ancho se reportan aquí
+                    validas, lineasValidas = [], []
+                    for numero, fila in zip(lineas, filas):
+                        if len(fila) != ancho:
+                            resultado.errores.append((numero, f"Se esperaban {ancho} columnas y hay {len(fila)}"))
+                        else:
+                            validas.append([fila[k] for k in orden])
+                            lineasValidas.append(numero)
+                    filas, lineas = validas, lineasValidas
+                self._procesarBloque(filas, lineas, resultado)
+        return resultado
+
+    def cargarParquet(self, ruta: str) -> ResultadoCarga:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("La carga de archivos Parquet requiere el paquete 'pyarrow'") from None
+        resultado = ResultadoCarga()
+        archivo = pq.ParquetFile(ruta)
+        orden = self._ordenColumnas(archivo.schema_arrow.names)
+        nombres = [archivo.schema_arrow.names[k] for k in orden]
+        linea = 1
+        for lote in archivo.iter_batches(batch_size=self.tamañoBloque, columns=nombres):
+            # Las columnas de texto se pasan a str; las numéricas conservan su tipo
+            columnas = [["" if v is None else (str(v) if k < 4 else v) for v in lote.column(k).to_pylist()]
+                        for k in range(len(nombres))]
+            filas = [list(fila) for fila in zip(*columnas)]
+            self._procesarBloque(filas, range(linea, linea + len(filas)), resultado)
+            linea += len(filas)
+        return resultado
+
+    def _ordenColumnas(self, encabezado: Sequence[str]) -> list[int]:
+        """Posición de cada columna esperada dentro del encabezado del archivo."""
+        nombres = [n.strip() for n in encabezado]
+        faltantes = [c for c in self.COLUMNAS if c not in nombres]
+        if faltantes:
+            raise ValueError(f"Faltan columnas en el archivo: {', '.join(faltantes)}")
+        return [nombres.index(c) for c in self.COLUMNAS]
+
+    def _procesarBloque(self, filas: list, lineas: Sequence[int], resultado: ResultadoCarga):
+        n = len(self.COLUMNAS)
+        bloque = ColumnasEmpleados()
+        try:
+            # Camino rápido: se convierte el bloque completo columna por columna
+            if set(map(len, filas)) != {n}:
+                raise ValueError("fila incompleta")
+            cols = list(zip(*filas))
+            nombres = list(map(str.strip, cols[0]))
+            apellidos = list(map(str.strip, cols[1]))
+            if not all(nombres) or not all(apellidos):
+                raise ValueError("nombre vacío")
+            bloque.cargos = array("B", map(self.CODIGOS_CARGO.__getitem__, map(str.strip, cols[2])))
+            bloque.generos = array("B", map(self.CODIGOS_GENERO.__getitem__, map(str.strip, cols[3])))
+            bloque.salarioDia = array("d", map(float, cols[4]))
+            bloque.diasTrabajados = array("i", map(self._entero, cols[5]))
+            bloque.otrosIngresos = array("d", map(float, cols[6]))
+            bloque.pagosSalud = array("d", map(float, cols[7]))
+            bloque.aportePensiones = array("d", map(float, cols[8]))
+            if min(bloque.diasTrabajados) < 0 or max(bloque.diasTrabajados) > 31:
+                raise ValueError("días fuera de rango")
+            bloque.nombres = nombres
+            bloque.apellidos = apellidos
+        except (KeyError, TypeError, ValueError, OverflowError):
+            # Hay al menos una fila inválida: se revisa fila por fila para reportarla
+            bloque = ColumnasEmpleados()
+            for numero, fila in zip(lineas, filas):
+                try:
+                    bloque.agregar(self._convertirFila(fila))
+                except ValueError as e:
+                    resultado.errores.append((numero, str(e)))
+        if len(bloque):
+            self.lista.agregarBloque(bloque)
+            resultado.cargados += len(bloque)
+
+    @staticmethod
+    def _entero(valor) -> int:
+        """int() sin truncar: en Parquet los días pueden venir como float y 2.5 no es válido."""
+        if isinstance(valor, float):
+            if not valor.is_integer():
+                raise ValueError(f"No es un número entero: {valor}")
+            return int(valor)
+        if isinstance(valor, bool):
+            raise ValueError(f"No es un número entero: {valor}")
+        return int(valor)
+
+    def _convertirFila(self, fila: list) -> Empleado:
+        if len(fila) != len(self.COLUMNAS):
+            raise ValueError(f"Se esperaban {len(self.COLUMNAS)} columnas y hay {len(fila)}")
+        nombre, apellidos, cargo, genero = (v.strip() for v in fila[:4])
+        if not nombre or not apellidos:
+            raise ValueError("Nombre o apellidos vacíos")
+        if cargo not in self.CODIGOS_CARGO:
+            raise ValueError(f"Cargo desconocido: {cargo!r}")
+        if genero not in self.CODIGOS_GENERO:
+            raise ValueError(f"Género desconocido: {genero!r}")
+        try:
+            salarioDia, otrosIngresos, pagosSalud, aportePensiones = (float(fila[k]) for k in (4, 6, 7, 8))
+            diasTrabajados = self._entero(fila[5])
+        except (TypeError, ValueError):
+            raise ValueError("Error en formato de número") from None
+        if diasTrabajados < 0 or diasTrabajados > 31:
+            raise ValueError(f"Días trabajados fuera de rango: {diasTrabajados}")
+        return Empleado(nombre, apellidos, CARGOS[self.CODIGOS_CARGO[cargo]], GENEROS[self.CODIGOS_GENERO[genero]],
+                        salarioDia, diasTrabajados, otrosIngresos, pagosSalud, aportePensiones)
 
 
 # ==========================
@@ -225,11 +682,17 @@ class VentanaAgregarEmpleado(tk.Toplevel):
 
 
 
-class VentanaNomina(tk.Toplevel):
+class VentanaNomina(DesplazamientoVirtual, tk.Toplevel):
 
-    def __init__(self, lista: ListaEmpleados, master=None):
+    # A partir de este número de empleados la tabla se muestra en modo virtual
+    UMBRAL_VIRTUAL = 1000
+    FILAS_VISIBLES = 4
+    FILAS_EXTRA = 2
+
+    def __init__(self, lista: ListaEmpleados, master=None, virtual: Optional[bool] = None):
         super().__init__(master)
         self.lista = lista
+        self.virtual = len(lista) > self.UMBRAL_VIRTUAL if virtual is None else virtual
         self.inicio()
         self.title("Nómina de Empleados")
         self.geometry("350x250+120+120")
@@ -242,7 +705,6 @@ class VentanaNomina(tk.Toplevel):
         self.empleados = tk.Label(self.contenedor, text="Lista de empleados:")
         self.empleados.place(x=20, y=10, width=135, height=23)
 
-        datos = self.lista.obtenerMatriz()
         titulos = ("NOMBRE", "APELLIDOS", "SUELDO")
 
         # Tabla (Treeview)
@@ -250,14 +712,100 @@ class VentanaNomina(tk.Toplevel):
         for t in titulos:
             self.tabla.heading(t, text=t)
             self.tabla.column(t, width=100, anchor="w")
-        for fila in datos:
-            self.tabla.insert("", "end", values=fila)
-        self.tabla.place(x=20, y=50, width=310, height=100)
+        if self.virtual:
+            self._iniciarVirtual()
+        else:
+            for fila in self.lista.obtenerMatriz():
+                self.tabla.insert("", "end", values=fila)
+            self.tabla.place(x=20, y=50, width=310, height=100)
 
-        # Total nómina mensual
+        # Total nómina mensual (mantenido por ListaEmpleados, no se recalcula)
         self.nomina = tk.Label(self.contenedor, text=f"Total nómina mensual = $ {self.lista.totalNomina:.2f}")
         self.nomina.place(x=20, y=160, width=250, height=23)
 
+    # --- Modo virtual: la tabla solo contiene las filas visibles (más unas pocas de margen) ---
+    def _iniciarVirtual(self):
+        self.desde = 0
+        self.items = [self.tabla.insert("", "end", values=("", "", ""))
+                      for _ in range(self.FILAS_VISIBLES + self.FILAS_EXTRA)]
+        self.tabla.place(x=20, y=50, width=293, height=100)
+
+        self.barra = ttk.Scrollbar(self.contenedor, orient="vertical", command=self._onScroll)
+        self.barra.place(x=313, y=50, width=17, height=100)
+
+        self._enlazarRueda(self.tabla)
+        self._pintar()
+
+    def _totalFilas(self) -> int:
+        return len(self.lista)
+
+    def _pintarFilas(self):
+        n = len(self.lista)
+        for k, item in enumerate(self.items):
+            i = self.desde + k
+            if i < n:
+                self.tabla.item(item, values=self.lista.obtenerFila(i))
+                self.tabla.move(item, "", k)
+            else:
+                self.tabla.detach(item)
+
+
+
+class VentanaProgreso(tk.Toplevel):
+
+    def __init__(self, exportacion: ExportacionNomina, carpeta: str, master=None):
+        super().__init__(master)
+        self.exportacion = exportacion
+        self.carpeta = carpeta
+        self.inicio()
+        self.title("Guardando nómina")
+        self.geometry("300x120+120+120")
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self._accionCancelar)
+        self.after(50, self._revisarCola)
+
+    def inicio(self):
+        self.contenedor = tk.Frame(self)
+        self.contenedor.place(x=0, y=0, relwidth=1, relheight=1)
+
+        self.estado = tk.Label(self.contenedor, text="Escribiendo Nómina.txt...", anchor="w")
+        self.estado.place(x=20, y=10, width=260, height=23)
+
+        self.barra = ttk.Progressbar(self.contenedor, mode="determinate", maximum=max(1, len(self.exportacion.lista)))
+        self.barra.place(x=20, y=40, width=260, height=20)
+
+        self.cancelar = tk.Button(self.contenedor, text="Cancelar", command=self._accionCancelar)
+        self.cancelar.place(x=200, y=75, width=80, height=23)
+
+    def _accionCancelar(self):
+        self.exportacion.cancelar()
+        self.cancelar.config(state="disabled")
+        self.estado.config(text="Cancelando...")
+
+    def _revisarCola(self):
+        # Se vacía la cola en cada visita para no atrasarse respecto al hilo
+        try:
+            while True:
+                mensaje = self.exportacion.cola.get_nowait()
+                if mensaje[0] == "progreso":
+                    _, hechos, total = mensaje
+                    self.barra.config(maximum=max(1, total), value=hechos)
+                    self.estado.config(text=f"Escribiendo Nómina.txt... {hechos}/{total}")
+                elif mensaje[0] == "fin":
+                    self.destroy()
+                    if mensaje[1]:
+                        messagebox.showinfo("Mensaje", f"El archivo de la nómina 'Nómina.txt' se ha creado en:\n{self.carpeta}")
+                    else:
+                        messagebox.showinfo("Mensaje", "Se canceló la creación del archivo")
+                    return
+                else:
+                    self.destroy()
+                    messagebox.showerror("Error", f"Ocurrió un error al crear el archivo:\n{mensaje[1]}")
+                    return
+        except queue.Empty:
+            pass
+        self.after(50, self._revisarCola)
+
 
 
 class VentanaPrincipal(tk.Tk):
@@ -280,11 +828,13 @@ class VentanaPrincipal(tk.Tk):
         self.itemMenu1 = "Agregar empleado"
         self.itemMenu2 = "Calcular nómina"
         self.itemMenu3 = "Guardar archivo"
+        self.itemMenu4 = "Cargar empleados (CSV)"
 
         self.menuOpciones.add_command(label=self.itemMenu1, command=self._accionAgregar)
         self.menuOpciones.add_command(label=self.itemMenu2, command=self._accionCalcular)
         self.menuOpciones.add_separator()
         self.menuOpciones.add_command(label=self.itemMenu3, command=self._accionGuardar)
+        self.menuOpciones.add_command(label=self.itemMenu4, command=self._accionCargar)
 
         self.barraMenu.add_cascade(label="Menú", menu=self.menuOpciones)
         self.config(menu=self.barraMenu)
@@ -304,16 +854,31 @@ class VentanaPrincipal(tk.Tk):
         carpeta = filedialog.askdirectory(title="Selecciona el directorio destino")
         if not carpeta:
             return
-        try:
-            contenido = self.empleados.convertirTexto()
-            ruta = f"{carpeta}/Nómina.txt"
-            with open(ruta, "w", encoding="utf-8") as f:
-                f.write(contenido)
+        # La escritura corre en un hilo aparte; la ventana de progreso informa el resultado
+        exportacion = ExportacionNomina(self.empleados, f"{carpeta}/Nómina.txt")
+        ventanaProgreso = VentanaProgreso(exportacion, carpeta, master=self)
+        ventanaProgreso.grab_set()
+        exportacion.start()
 
-            messagebox.showinfo("Mensaje", f"El archivo de la nómina 'Nómina.txt' se ha creado en:\n{carpeta}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Ocurrió un error al crear el archivo:\n{e}")
 
+    def _accionCargar(self):
+        ruta = filedialog.askopenfilename(title="Selecciona el archivo de empleados",
+                                          filetypes=[("CSV", "*.csv"), ("Parquet", "*.parquet")])
+        if not ruta:
+            return
+        try:
+            cargador = CargadorEmpleados(self.empleados)
+            if ruta.lower().endswith(".parquet"):
+                resultado = cargador.cargarParquet(ruta)
+            else:
+                resultado = cargador.cargarCSV(ruta)
+            mensaje = f"Se cargaron {resultado.cargados} empleados"
+            if resultado.errores:
+                detalle = "\n".join(f"Línea {linea}: {motivo}" for linea, motivo in resultado.errores[:10])
+                mensaje += f"\n{len(resultado.errores)} filas con errores:\n{detalle}"
+            messagebox.showinfo("Mensaje", mensaje)
+        except Exception as e:
+            messagebox.showerror("Error", f"Ocurrió un error al cargar el archivo:\n{e}")
 
 
 class Principal:
@@ -4,13 +4,31 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from datetime import datetime, date
-from typing import Optional
+from datetime import date
+from typing import Callable, Iterable, Optional, Sequence
+from array import array
+import bisect
+import collections
+import itertools
+import json
+import os
+import threading
+import time
+
+from Desplazamiento import DesplazamientoVirtual
+from Fechas import ErrorFecha, parsearFecha
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él los indicadores se calculan con la librería estándar
+    np = None
 
 
 
 class Huesped:
 
+    __slots__ = ("nombres", "apellidos", "documentoIdentidad", "fechaIngreso", "fechaSalida")
+
     def __init__(self, nombres: str, apellidos: str, documentoIdentidad: int):
         self.nombres = nombres
         self.apellidos = apellidos
@@ -38,11 +56,16 @@ class Huesped:
 
 class Habitacion:
 
+    # observador lo asigna Hotel.agregarHabitacion; con __slots__ no se pueden agregar otros atributos
+    __slots__ = ("numeroHabitacion", "disponible", "precioDia", "huesped", "observador")
+
     def __init__(self, numeroHabitacion: int, disponible: bool, precioDia: float):
         self.numeroHabitacion = numeroHabitacion
         self.disponible = disponible
         self.precioDia = precioDia
         self.huesped: Optional[Huesped] = None
+        # Quien debe enterarse de los cambios (el Hotel): observador(habitacion, campo)
+        self.observador: Optional[Callable[["Habitacion", str], None]] = None
 
     # --- GETTERS (como en Java) ---
     def getNumeroHabitacion(self) -> int:
@@ -60,48 +83,753 @@ class Habitacion:
     # --- SETTERS ---
     def setHuesped(self, huesped: Optional[Huesped]):
         self.huesped = huesped
+        if self.observador is not None:
+            self.observador(self, "huesped")
 
     def setDisponible(self, disponible: bool):
         self.disponible = disponible
+        if self.observador is not None:
+            self.observador(self, "disponible")
 
 
-class Hotel:
+class Reserva:
+    """Estadía reservada en una habitación, en el intervalo [fechaIngreso, fechaSalida)."""
+
+    __slots__ = ("numeroHabitacion", "huesped", "fechaIngreso", "fechaSalida")
+
+    def __init__(self, numeroHabitacion: int, huesped: Huesped, fechaIngreso: date, fechaSalida: date):
+        self.numeroHabitacion = numeroHabitacion
+        self.huesped = huesped
+        self.fechaIngreso = fechaIngreso
+        self.fechaSalida = fechaSalida
+
+    def getNumeroHabitacion(self) -> int:
+        return self.numeroHabitacion
+
+    def getHuesped(self) -> Huesped:
+        return self.huesped
+
+    def getFechaIngreso(self) -> date:
+        return self.fechaIngreso
+
+    def getFechaSalida(self) -> date:
+        return self.fechaSalida
+
+
+class CalendarioHabitacion:
+    """Reservas de una habitación ordenadas por ingreso; como no se solapan, un bisect dice si hay choque."""
 
+    def __init__(self):
+        self.ingresos: list[int] = []   # fechas como ordinales, para comparar rápido
+        self.salidas: list[int] = []
+        self.reservas: list[Reserva] = []
+
+    def __len__(self) -> int:
+        return len(self.reservas)
+
+    def estaLibre(self, ingreso: date, salida: date) -> bool:
+        i = bisect.bisect_left(self.ingresos, salida.toordinal())
+        return i == 0 or self.salidas[i - 1] <= ingreso.toordinal()
+
+    def agregar(self, reserva: Reserva):
+        if not self.estaLibre(reserva.fechaIngreso, reserva.fechaSalida):
+            raise ValueError(f"La habitación {reserva.numeroHabitacion} ya está reservada en esas fechas.")
+        i = bisect.bisect_left(self.ingresos, reserva.fechaIngreso.toordinal())
+        self.ingresos.insert(i, reserva.fechaIngreso.toordinal())
+        self.salidas.insert(i, reserva.fechaSalida.toordinal())
+        self.reservas.insert(i, reserva)
+
+    def quitar(self, reserva: Reserva):
+        i = bisect.bisect_left(self.ingresos, reserva.fechaIngreso.toordinal())
+        if i == len(self.reservas) or self.reservas[i] is not reserva:
+            raise ValueError("La reserva no pertenece a esta habitación.")
+        del self.ingresos[i], self.salidas[i], self.reservas[i]
+
+    def reservasEntre(self, desde: date, hasta: date) -> list[Reserva]:
+        """Reservas que se cruzan con [desde, hasta)."""
+        inicio = bisect.bisect_right(self.salidas, desde.toordinal())
+        fin = bisect.bisect_left(self.ingresos, hasta.toordinal())
+        return self.reservas[inicio:fin]
+
+
+class HistorialEstancias:
+    """
+    Registro de estadías terminadas, solo de agregado y guardado por columnas
+    (arreglos tipados), para calcular indicadores sin recorrer objetos Huesped.
+    Las fechas se guardan como ordinales (date.toordinal()).
+    """
 
     def __init__(self):
+        self.numeros = array("i")
+        self.ingresos = array("i")
+        self.salidas = array("i")
+        self.precios = array("d")
+        self.importes = array("d")
+
+    def __len__(self) -> int:
+        return len(self.numeros)
+
+    def registrar(self, numero: int, fechaIngreso: date, fechaSalida: date, precioDia: float, importe: float):
+        self.numeros.append(numero)
+        self.ingresos.append(fechaIngreso.toordinal())
+        self.salidas.append(fechaSalida.toordinal())
+        self.precios.append(precioDia)
+        self.importes.append(importe)
+
+    def nochesPorDia(self, desde: date, hasta: date, precio: Optional[float] = None):
+        """Habitaciones ocupadas e ingresos de cada noche de [desde, hasta), con arreglos de diferencias."""
+        a, b = desde.toordinal(), hasta.toordinal()
+        dias = max(0, b - a)
+        if np is not None and len(self):
+            ingresos = np.frombuffer(self.ingresos, dtype=np.intc)
+            salidas = np.frombuffer(self.salidas, dtype=np.intc)
+            importes = np.frombuffer(self.importes, dtype=np.float64)
+            incluir = (salidas > a) & (ingresos < b) & (salidas > ingresos)
+            if precio is not None:
+                incluir &= np.frombuffer(self.precios, dtype=np.float64) == precio
+            porNoche = importes[incluir] / (salidas[incluir] - ingresos[incluir])
+            inicio = np.clip(ingresos[incluir], a, b) - a
+            fin = np.clip(salidas[incluir], a, b) - a
+            ocupadas = np.zeros(dias + 1)
+            dinero = np.zeros(dias + 1)
+            np.add.at(ocupadas, inicio, 1)
+            np.add.at(ocupadas, fin, -1)
+            np.add.at(dinero, inicio, porNoche)
+            np.add.at(dinero, fin, -porNoche)
+            return np.cumsum(ocupadas)[:dias].tolist(), np.cumsum(dinero)[:dias].tolist()
+
+        ocupadas = [0.0] * (dias + 1)
+        dinero = [0.0] * (dias + 1)
+        for ingreso, salida, precioDia, importe in zip(self.ingresos, self.salidas, self.precios, self.importes):
+            if salida <= a or ingreso >= b or salida <= ingreso or (precio is not None and precioDia != precio):
+                continue
+            porNoche = importe / (salida - ingreso)
+            inicio, fin = max(ingreso, a) - a, min(salida, b) - a
+            ocupadas[inicio] += 1
+            ocupadas[fin] -= 1
+            dinero[inicio] += porNoche
+            dinero[fin] -= porNoche
+        return list(itertools.accumulate(ocupadas[:dias])), list(itertools.accumulate(dinero[:dias]))
+
+
+class Tarifario:
+    """
+    Precio por noche según temporada, fin de semana y duración. Por tipo (precio base)
+    se guardan sumas acumuladas por día: una estadía es la resta de dos posiciones.
+    """
+
+    # Noches de viernes y sábado (date.weekday())
+    FIN_DE_SEMANA = (4, 5)
+
+    def __init__(self, desde: date, hasta: date):
+        if desde >= hasta:
+            raise ValueError("El horizonte del tarifario debe tener al menos un día.")
+        self.desde = desde
+        self.hasta = hasta
+        self.temporadas: list[tuple[date, date, float, Optional[float]]] = []
+        self.factorFinDeSemana = 1.0
+        self.diasFinDeSemana = self.FIN_DE_SEMANA
+        # Descuentos por duración: nochesMinimas ordenadas y su descuento (0.1 = 10 %)
+        self.nochesMinimas: list[int] = []
+        self.descuentos: list[float] = []
+        self.candado = threading.Lock()
+        # (ordinal del primer día, cantidad de días, tipo -> sumas acumuladas). Se
+        # reemplaza completo al cambiar las reglas; quien lo leyó sigue con una copia coherente.
+        self.vigente: tuple[int, int, dict[float, array]] = (desde.toordinal(), (hasta - desde).days, {})
+
+    # --- Reglas (cada cambio invalida las tablas) ---
+    def agregarTemporada(self, desde: date, hasta: date, factor: float, tipo: Optional[float] = None):
+        """Multiplica por factor las noches de [desde, hasta), de un tipo o de todos."""
+        with self.candado:
+            self.temporadas.append((desde, hasta, factor, tipo))
+            self._invalidar()
+
+    def setFinDeSemana(self, factor: float, dias: tuple[int, ...] = FIN_DE_SEMANA):
+        with self.candado:
+            self.factorFinDeSemana = factor
+            self.diasFinDeSemana = tuple(dias)
+            self._invalidar()
+
+    def setDescuentoDuracion(self, nochesMinimas: int, descuento: float):
+        """Desde nochesMinimas noches, toda la estadía tiene este descuento."""
+        with self.candado:
+            k = bisect.bisect_left(self.nochesMinimas, nochesMinimas)
+            if k < len(self.nochesMinimas) and self.nochesMinimas[k] == nochesMinimas:
+                self.descuentos[k] = descuento
+            else:
+                self.nochesMinimas.insert(k, nochesMinimas)
+                self.descuentos.insert(k, descuento)
+
+    def _invalidar(self):
+        base, dias, _ = self.vigente
+        self.vigente = (base, dias, {})
+
+    # --- Tablas ---
+    def _construirTabla(self, base: int, dias: int, tipo: float) -> array:
+        factores = [1.0] * dias
+        if self.factorFinDeSemana != 1.0:
+            primerDia = date.fromordinal(base).weekday()
+            for dia in self.diasFinDeSemana:
+                for k in range((dia - primerDia) % 7, dias, 7):
+                    factores[k] *= self.factorFinDeSemana
+        for desde, hasta, factor, tipoTemporada in self.temporadas:
+            if tipoTemporada is not None and tipoTemporada != tipo:
+                continue
+            for k in range(max(0, desde.toordinal() - base), min(dias, hasta.toordinal() - base)):
+                factores[k] *= factor
+        return array("d", itertools.accumulate((tipo * f for f in factores), initial=0.0))
+
+    def _tablas(self, primero: int, ultimo: int, tipos: Iterable[float]) -> tuple[int, dict[float, array]]:
+        """Tablas que cubren las noches [primero, ultimo); amplía el horizonte si hace falta."""
+        base, dias, tablas = self.vigente
+        if primero >= base and ultimo <= base + dias and all(t in tablas for t in tipos):
+            return base, tablas
+        with self.candado:
+            base, dias, tablas = self.vigente
+            if primero < base or ultimo > base + dias:
+                # Se amplía con margen para no reconstruir en cada reserva nueva, sin salir del rango de date
+                nuevoBase = max(date.min.toordinal(), min(base, primero - (dias if primero < base else 0)))
+                nuevoFin = min(date.max.toordinal(), max(base + dias, ultimo + (dias if ultimo > base + dias else 0)))
+                base, dias, tablas = nuevoBase, nuevoFin - nuevoBase, {}
+                self.desde, self.hasta = date.fromordinal(base), date.fromordinal(base + dias)
+            faltantes = [t for t in tipos if t not in tablas]
+            if faltantes:
+                tablas = dict(tablas)
+                for tipo in faltantes:
+                    tablas[tipo] = self._construirTabla(base, dias, tipo)
+            self.vigente = (base, dias, tablas)
+            return base, tablas
+
+    # --- Precios ---
+    def descuento(self, noches: int) -> float:
+        k = bisect.bisect_right(self.nochesMinimas, noches) - 1
+        return self.descuentos[k] if k >= 0 else 0.0
+
+    def precioEstadia(self, tipo: float, fechaIngreso: date, fechaSalida: date) -> float:
+        """Valor de las noches de [fechaIngreso, fechaSalida) en una habitación del tipo dado."""
+        i, s = fechaIngreso.toordinal(), fechaSalida.toordinal()
+        if s <= i:
+            return 0.0
+        base, tablas = self._tablas(i, s, (tipo,))
+        tabla = tablas[tipo]
+        return (tabla[s - base] - tabla[i - base]) * (1.0 - self.descuento(s - i))
+
+    def precioEstadias(self, tipos: Sequence[float], ingresos: Sequence[int], salidas: Sequence[int]) -> Sequence[float]:
+        """
+        Precio de muchas estadías a la vez (p. ej. al cambiar las tarifas). Las
+        fechas van como ordinales, igual que en HistorialEstancias, así que sus
+        columnas precios/ingresos/salidas se pueden pasar directamente.
+        """
+        if len(ingresos) == 0:
+            return array("d")
+        if np is not None:
+            tipos = np.asarray(tipos, dtype=np.float64)
+            ingresos = np.asarray(ingresos, dtype=np.int64)
+            salidas = np.maximum(np.asarray(salidas, dtype=np.int64), ingresos)
+            unicos = np.unique(tipos)
+            base, tablas = self._tablas(int(ingresos.min()), int(salidas.max()), unicos.tolist())
+            total = np.empty(len(ingresos))
+            for tipo in unicos:
+                m = tipos == tipo
+                tabla = np.frombuffer(tablas[float(tipo)], dtype=np.float64)
+                total[m] = tabla[salidas[m] - base] - tabla[ingresos[m] - base]
+            if self.nochesMinimas:
+                k = np.searchsorted(self.nochesMinimas, salidas - ingresos, side="right") - 1
+                descuentos = np.asarray(self.descuentos)[np.maximum(k, 0)]
+                total *= 1.0 - np.where(k >= 0, descuentos, 0.0)
+            return total
+        salidas = [max(s, i) for i, s in zip(ingresos, salidas)]
+        base, tablas = self._tablas(min(ingresos), max(salidas), set(tipos))
+        return array("d", ((tablas[t][s - base] - tablas[t][i - base]) * (1.0 - self.descuento(s - i))
+                           for t, i, s in zip(tipos, ingresos, salidas)))
+
+
+class Hotel:
+
+    FRANJAS_CANDADOS = 64
+
+    def __init__(self, inventario: Optional[Iterable[tuple[int, float]]] = None):
+        """
+        inventario: pares (número de habitación, precio por día). Sin inventario se
+        crean las 10 habitaciones originales. Los números no tienen que ser contiguos.
+        """
         self.listaHabitaciones: list[Habitacion] = []
-        # Crear 10 habitaciones con disponibilidad True y sus precios
-        for n in range(1, 11):
-            precio = 120_000 if n <= 5 else 160_000
-            self.listaHabitaciones.append(Habitacion(n, True, precio))
+        # Funciones avisadas de cada cambio de huésped o disponibilidad
+        self.suscriptores: list[Callable[[Habitacion, str], None]] = []
+        # Índice número de habitación -> Habitacion; toda búsqueda por número pasa por aquí
+        self.indiceHabitaciones: dict[int, Habitacion] = {}
+        # Mapa de bits de disponibilidad: el bit i vale 1 si listaHabitaciones[i] está libre.
+        # Se mantiene uno general y uno por cada precio por día (tarifa).
+        self.posiciones: dict[int, int] = {}
+        self.libres = 0
+        self.libresPorPrecio: dict[float, int] = {}
+        # Reservas futuras de cada habitación
+        self.calendarios: dict[int, CalendarioHabitacion] = {}
+        # Estadías terminadas, para los indicadores de ocupación e ingresos
+        self.historial = HistorialEstancias()
+        # Sin tarifario la cuenta es días * precioDia, como siempre
+        self.tarifario: Optional[Tarifario] = None
+        # Concurrencia: un candado por franja de habitaciones (no uno global) para
+        # ingresos, salidas y reservas, más candados cortos para los mapas de bits
+        # y el historial, que son compartidos por todas las habitaciones.
+        self.candados = [threading.Lock() for _ in range(self.FRANJAS_CANDADOS)]
+        self.candadoMapas = threading.Lock()
+        self.candadoHistorial = threading.Lock()
+        if inventario is None:
+            # Crear 10 habitaciones con disponibilidad True y sus precios
+            inventario = [(n, 120_000 if n <= 5 else 160_000) for n in range(1, 11)]
+        for numero, precio in sorted(inventario):
+            self.agregarHabitacion(Habitacion(numero, True, precio))
+
+    @classmethod
+    def porPisos(cls, cantidad: int, habitacionesPorPiso: int = 20) -> "Hotel":
+        """Hotel de prueba numerado por pisos (101..120, 201..), mitad a cada tarifa."""
+        return cls((100 * (1 + k // habitacionesPorPiso) + k % habitacionesPorPiso + 1,
+                    120_000 if k < cantidad // 2 else 160_000) for k in range(cantidad))
+
+    def agregarHabitacion(self, hab: Habitacion):
+        numero = hab.getNumeroHabitacion()
+        if numero in self.indiceHabitaciones:
+            raise ValueError(f"La habitación {numero} ya existe.")
+        self.posiciones[numero] = len(self.listaHabitaciones)
+        self.listaHabitaciones.append(hab)
+        self.indiceHabitaciones[numero] = hab
+        self.calendarios[numero] = CalendarioHabitacion()
+        self.libresPorPrecio.setdefault(hab.getPrecioDia(), 0)
+        hab.observador = self._onCambioHabitacion
+        self._actualizarLibre(hab)
+
+    def suscribir(self, funcion: Callable[[Habitacion, str], None]):
+        """Registra una función que se llama con (habitacion, campo) en cada cambio de estado."""
+        self.suscriptores.append(funcion)
+
+    def desuscribir(self, funcion: Callable[[Habitacion, str], None]):
+        self.suscriptores.remove(funcion)
+
+    def _onCambioHabitacion(self, hab: Habitacion, campo: str):
+        if campo == "disponible":
+            self._actualizarLibre(hab)
+        for funcion in self.suscriptores:
+            funcion(hab, campo)
+
+    def _actualizarLibre(self, hab: Habitacion):
+        bit = 1 << self.posiciones[hab.getNumeroHabitacion()]
+        precio = hab.getPrecioDia()
+        with self.candadoMapas:
+            if hab.getDisponible():
+                self.libres |= bit
+                self.libresPorPrecio[precio] |= bit
+            else:
+                self.libres &= ~bit
+                self.libresPorPrecio[precio] &= ~bit
+
+    def _mapaLibres(self, precio: Optional[float]) -> int:
+        if precio is None:
+            return self.libres
+        return self.libresPorPrecio.get(precio, 0)
+
+    def contarLibres(self, precio: Optional[float] = None) -> int:
+        """Cantidad de habitaciones disponibles, en total o de un precio por día."""
+        return self._mapaLibres(precio).bit_count()
+
+    def contarLibresPorPrecio(self) -> dict[float, int]:
+        return {precio: mapa.bit_count() for precio, mapa in self.libresPorPrecio.items()}
+
+    def primeraLibre(self, precio: Optional[float] = None) -> Optional[Habitacion]:
+        """
+        Habitación disponible de menor posición en listaHabitaciones, o None. El
+        inventario inicial queda ordenado por número, pero agregarHabitacion agrega
+        al final, así que después de agregar el orden es el de inserción.
+        """
+        mapa = self._mapaLibres(precio)
+        if not mapa:
+            return None
+        return self.listaHabitaciones[(mapa & -mapa).bit_length() - 1]
+
+    def siguientesLibres(self, cantidad: int, precio: Optional[float] = None) -> list[Habitacion]:
+        """Hasta 'cantidad' habitaciones disponibles, en el orden de listaHabitaciones (ver primeraLibre)."""
+        mapa = self._mapaLibres(precio)
+        encontradas = []
+        while mapa and len(encontradas) < cantidad:
+            bajo = mapa & -mapa
+            encontradas.append(self.listaHabitaciones[bajo.bit_length() - 1])
+            mapa ^= bajo
+        return encontradas
+
+    def existeHabitacion(self, numero: int) -> bool:
+        return numero in self.indiceHabitaciones
 
     def buscarFechaIngresoHabitacion(self, numero: int) -> str:
       
-        for hab in self.listaHabitaciones:
-            if hab.getNumeroHabitacion() == numero:
-                hue = hab.getHuesped()
-                if hue and hue.getFechaIngreso():
-                    fecha = hue.getFechaIngreso()
-                    return fecha.strftime("%Y/%m/%d")
+        hab = self.indiceHabitaciones.get(numero)
+        if hab is not None:
+            hue = hab.getHuesped()
+            if hue and hue.getFechaIngreso():
+                fecha = hue.getFechaIngreso()
+                return fecha.strftime("%Y/%m/%d")
         return ""
 
     def buscarHabitacionOcupada(self, numero: int) -> bool:
        
-        for hab in self.listaHabitaciones:
-            if hab.getNumeroHabitacion() == numero and not hab.getDisponible():
-                return True
-        return False
+        hab = self.indiceHabitaciones.get(numero)
+        return hab is not None and not hab.getDisponible()
 
     def getHabitacion(self, numero: int) -> Habitacion:
-        if numero < 1 or numero > 10:
-            raise ValueError("El número de habitación debe estar entre 1 y 10.")
-        return self.listaHabitaciones[numero - 1]
+        hab = self.indiceHabitaciones.get(numero)
+        if hab is None:
+            raise ValueError(f"La habitación {numero} no existe.")
+        return hab
 
+    # --- Operaciones seguras entre hilos ---
+    def candado(self, numero: int) -> threading.Lock:
+        """Candado de la franja a la que pertenece la habitación."""
+        return self.candados[hash(numero) % len(self.candados)]
 
+    def registrarIngreso(self, numero: int, huesped: Huesped) -> bool:
+        """
+        Ocupa la habitación solo si sigue disponible (comparar y asignar atómico).
+        Retorna False si otro cliente la ocupó primero.
+        """
+        hab = self.getHabitacion(numero)
+        with self.candado(numero):
+            if not hab.getDisponible():
+                return False
+            hab.setHuesped(huesped)
+            hab.setDisponible(False)
+            return True
+
+    def asignarPrimeraLibre(self, huesped: Huesped, precio: Optional[float] = None) -> Optional[Habitacion]:
+        """Ocupa la primera habitación libre (del precio dado); reintenta si otro cliente gana la carrera."""
+        while True:
+            hab = self.primeraLibre(precio)
+            if hab is None:
+                return None
+            if self.registrarIngreso(hab.getNumeroHabitacion(), huesped):
+                return hab
+
+    def registrarSalida(self, numero: int, fechaSalida: Optional[date] = None) -> float:
+        """
+        Libera la habitación y guarda la estadía en el historial. El huésped debe
+        tener fecha de salida (o recibirla aquí). Retorna el valor cobrado.
+        """
+        hab = self.getHabitacion(numero)
+        with self.candado(numero):
+            huesped = hab.getHuesped()
+            if huesped is not None and fechaSalida is not None:
+                huesped.setFechaSalida(fechaSalida)
+            if huesped is None or huesped.getFechaIngreso() is None or huesped.fechaSalida is None:
+                raise ValueError("La habitación no tiene huésped con fechas de ingreso y salida.")
+            importe = self._importe(hab, huesped.getFechaIngreso(), huesped.fechaSalida)
+            with self.candadoHistorial:
+                self.historial.registrar(numero, huesped.getFechaIngreso(), huesped.fechaSalida,
+                                         hab.getPrecioDia(), importe)
+            hab.setHuesped(None)
+            hab.setDisponible(True)
+            return importe
+
+    def configurarTarifario(self, tarifario: Optional[Tarifario]):
+        """Usa el tarifario para las cuentas y cotizaciones (None vuelve al precio plano)."""
+        self.tarifario = tarifario
+
+    def _importe(self, hab: Habitacion, fechaIngreso: date, fechaSalida: date) -> float:
+        if self.tarifario is not None:
+            return self.tarifario.precioEstadia(hab.getPrecioDia(), fechaIngreso, fechaSalida)
+        return (fechaSalida - fechaIngreso).days * hab.getPrecioDia()
+
+    def calcularCuenta(self, numero: int, fechaSalida: date) -> tuple[int, float]:
+        """Días de alojamiento y valor a pagar si el huésped sale en fechaSalida (no modifica nada)."""
+        hab = self.getHabitacion(numero)
+        huesped = hab.getHuesped()
+        if huesped is None:
+            raise ValueError("La habitación no tiene huésped.")
+        fechaIngreso = huesped.getFechaIngreso()
+        if fechaIngreso is None:
+            raise ValueError("No hay fecha de ingreso registrada.")
+        if fechaIngreso >= fechaSalida:
+            raise ValueError("La fecha de salida es menor que la de ingreso")
+        return (fechaSalida - fechaIngreso).days, self._importe(hab, fechaIngreso, fechaSalida)
+
+    # --- Indicadores de ocupación e ingresos ---
+    def indicadores(self, desde: date, hasta: date, periodo: str = "dia", porPrecio: bool = False) -> list[dict]:
+        """
+        Ocupación, ADR y RevPAR de las estadías en [desde, hasta) por "dia", "semana" o "mes"
+        (porPrecio=True: separado por precio por día).
+        """
+        if periodo not in ("dia", "semana", "mes"):
+            raise ValueError("El periodo debe ser 'dia', 'semana' o 'mes'.")
+        if porPrecio:
+            habitacionesPorPrecio = collections.Counter(h.getPrecioDia() for h in self.listaHabitaciones)
+            grupos = sorted(habitacionesPorPrecio.items())
+        else:
+            grupos = [(None, len(self.listaHabitaciones))]
+
+        a = desde.toordinal()
+        claves = []
+        for k in range(max(0, hasta.toordinal() - a)):
+            dia = date.fromordinal(a + k)
+            if periodo == "semana":
+                dia = date.fromordinal(dia.toordinal() - dia.weekday())
+            elif periodo == "mes":
+                dia = dia.replace(day=1)
+            claves.append(dia)
+
+        filas = []
+        for precio, habitaciones in grupos:
+            ocupadas, dinero = self.historial.nochesPorDia(desde, hasta, precio)
+            k = 0
+            for clave, grupo in itertools.groupby(claves):
+                n = len(list(grupo))
+                noches = sum(ocupadas[k:k + n])
+                ingresos = sum(dinero[k:k + n])
+                disponibles = habitaciones * n
+                k += n
+                filas.append({
+                    "periodo": clave, "precio": precio,
+                    "nochesOcupadas": int(round(noches)), "nochesDisponibles": disponibles,
+                    "ingresos": ingresos,
+                    "ocupacion": noches / disponibles if disponibles else 0.0,
+                    "adr": ingresos / noches if noches else 0.0,
+                    "revpar": ingresos / disponibles if disponibles else 0.0,
+                })
+        return filas
+
+    # --- Reservas por rango de fechas ---
+    def _calendario(self, numero: int) -> CalendarioHabitacion:
+        self.getHabitacion(numero)
+        return self.calendarios[numero]
+
+    def reservar(self, numero: int, huesped: Huesped, fechaIngreso: date, fechaSalida: date) -> Reserva:
+        if fechaIngreso >= fechaSalida:
+            raise ValueError("La fecha de salida es menor que la de ingreso")
+        reserva = Reserva(numero, huesped, fechaIngreso, fechaSalida)
+        calendario = self._calendario(numero)
+        with self.candado(numero):
+            calendario.agregar(reserva)
+        return reserva
+
+    def cancelarReserva(self, reserva: Reserva):
+        calendario = self._calendario(reserva.getNumeroHabitacion())
+        with self.candado(reserva.getNumeroHabitacion()):
+            calendario.quitar(reserva)
+
+    def habitacionLibreEntre(self, numero: int, fechaIngreso: date, fechaSalida: date) -> bool:
+        return self._calendario(numero).estaLibre(fechaIngreso, fechaSalida)
+
+    def buscarDisponiblesEntre(self, fechaIngreso: date, fechaSalida: date,
+                               precio: Optional[float] = None, cantidad: Optional[int] = None) -> list[Habitacion]:
+        """Habitaciones sin reservas en [fechaIngreso, fechaSalida), opcionalmente de un precio por día."""
+        disponibles = []
+        for hab in self.listaHabitaciones:
+            if precio is not None and hab.getPrecioDia() != precio:
+                continue
+            if self.calendarios[hab.getNumeroHabitacion()].estaLibre(fechaIngreso, fechaSalida):
+                disponibles.append(hab)
+                if cantidad is not None and len(disponibles) >= cantidad:
+                    break
+        return disponibles
+
+    def cotizarReservas(self) -> list[tuple[Reserva, float]]:
+        """Valor de todas las reservas con las tarifas actuales, calculado en bloque."""
+        reservas, tipos, ingresos, salidas = [], [], [], []
+        # Los calendarios ya guardan las fechas como ordinales
+        for numero, calendario in self.calendarios.items():
+            reservas += calendario.reservas
+            tipos += [self.indiceHabitaciones[numero].getPrecioDia()] * len(calendario)
+            ingresos += calendario.ingresos
+            salidas += calendario.salidas
+        if self.tarifario is None:
+            precios = [(s - i) * t for t, i, s in zip(tipos, ingresos, salidas)]
+        else:
+            precios = self.tarifario.precioEstadias(tipos, ingresos, salidas)
+        return list(zip(reservas, map(float, precios)))
+
+    def reservasHabitacion(self, numero: int, desde: date, hasta: date) -> list[Reserva]:
+        return self._calendario(numero).reservasEntre(desde, hasta)
+
+
+
+class PersistenciaHotel:
+    """
+    Instantánea JSON más registro de cambios (WAL) con una línea por cambio; el fsync
+    se hace por lotes y cada cambiosPorInstantanea cambios se reescribe la instantánea.
+    """
+
+    INSTANTANEA = "hotel.json"
+    REGISTRO = "hotel.wal"
+
+    def __init__(self, hotel: Hotel, directorio: str, loteFsync: int = 32,
+                 intervaloFsync: float = 1.0, cambiosPorInstantanea: int = 10_000):
+        self.hotel = hotel
+        self.directorio = directorio
+        self.loteFsync = loteFsync
+        self.intervaloFsync = intervaloFsync
+        self.cambiosPorInstantanea = cambiosPorInstantanea
+        self.secuencia = 0
+        self.cambiosEnRegistro = 0
+        self.pendientes = 0
+        self.ultimoFsync = time.monotonic()
+        self.reproduciendo = False
+        # Los cambios pueden llegar desde varios hilos a la vez
+        self.candado = threading.RLock()
+
+        os.makedirs(directorio, exist_ok=True)
+        self.registro = None
+        self._cargar()
+        # Si al cargar se escribió una instantánea, el registro ya quedó abierto (y vacío)
+        if self.registro is None:
+            self.registro = open(self._ruta(self.REGISTRO), "a", encoding="utf-8")
+        hotel.suscribir(self._onCambio)
+
+    def _ruta(self, nombre: str) -> str:
+        return os.path.join(self.directorio, nombre)
+
+    # --- Serialización ---
+    @staticmethod
+    def _huespedADict(huesped: Optional[Huesped]) -> Optional[dict]:
+        if huesped is None:
+            return None
+        return {"nombres": huesped.nombres, "apellidos": huesped.apellidos,
+                "documento": huesped.documentoIdentidad,
+                "ingreso": huesped.fechaIngreso.isoformat() if huesped.fechaIngreso else None,
+                "salida": huesped.fechaSalida.isoformat() if huesped.fechaSalida else None}
+
+    @staticmethod
+    def _dictAHuesped(datos: Optional[dict]) -> Optional[Huesped]:
+        if datos is None:
+            return None
+        huesped = Huesped(datos["nombres"], datos["apellidos"], datos["documento"])
+        if datos.get("ingreso"):
+            huesped.setFechaIngreso(parsearFecha(datos["ingreso"]))
+        if datos.get("salida"):
+            huesped.setFechaSalida(parsearFecha(datos["salida"]))
+        return huesped
+
+    # --- Arranque: instantánea + cola del registro ---
+    def _cargar(self):
+        self.reproduciendo = True
+        try:
+            rutaInstantanea = self._ruta(self.INSTANTANEA)
+            if os.path.exists(rutaInstantanea):
+                with open(rutaInstantanea, encoding="utf-8") as f:
+                    instantanea = json.load(f)
+                self.secuencia = instantanea["secuencia"]
+                for datos in instantanea["habitaciones"]:
+                    if not self.hotel.existeHabitacion(datos["numero"]):
+                        self.hotel.agregarHabitacion(Habitacion(datos["numero"], True, datos["precio"]))
+                    hab = self.hotel.getHabitacion(datos["numero"])
+                    hab.setHuesped(self._dictAHuesped(datos["huesped"]))
+                    hab.setDisponible(datos["disponible"])
+
+            rutaRegistro = self._ruta(self.REGISTRO)
+            colaRota = False
+            if os.path.exists(rutaRegistro):
+                with open(rutaRegistro, encoding="utf-8") as f:
+                    lineas = f.readlines()
+                # Una última línea sin salto quedó a medio escribir; hay que quitarla del
+                # archivo, o el próximo cambio se escribiría pegado a ella
+                colaRota = bool(lineas) and not lineas[-1].endswith("\n")
+                for k, linea in enumerate(lineas):
+                    try:
+                        cambio = json.loads(linea)
+                    except json.JSONDecodeError:
+                        if k == len(lineas) - 1:
+                            colaRota = True
+                            break  # última línea a medio escribir por una caída: se descarta
+                        raise
+                    if cambio["secuencia"] <= self.secuencia:
+                        continue  # ya incluido en la instantánea
+                    self._aplicar(cambio)
+                    self.secuencia = cambio["secuencia"]
+                    self.cambiosEnRegistro += 1
+        finally:
+            self.reproduciendo = False
+        if self.cambiosEnRegistro or colaRota:
+            # Se deja el estado recuperado en una instantánea y el registro vacío
+            self.escribirInstantanea()
+
+    def _aplicar(self, cambio: dict):
+        if not self.hotel.existeHabitacion(cambio["habitacion"]):
+            return
+        hab = self.hotel.getHabitacion(cambio["habitacion"])
+        if cambio["campo"] == "huesped":
+            hab.setHuesped(self._dictAHuesped(cambio["valor"]))
+        else:
+            hab.setDisponible(cambio["valor"])
+
+    # --- Escritura ---
+    def _onCambio(self, hab: Habitacion, campo: str):
+        if self.reproduciendo:
+            return
+        valor = self._huespedADict(hab.getHuesped()) if campo == "huesped" else hab.getDisponible()
+        with self.candado:
+            self.secuencia += 1
+            self.registro.write(json.dumps({"secuencia": self.secuencia, "habitacion": hab.getNumeroHabitacion(),
+                                            "campo": campo, "valor": valor}, ensure_ascii=False) + "\n")
+            self.cambiosEnRegistro += 1
+            self.pendientes += 1
+            if self.pendientes >= self.loteFsync or time.monotonic() - self.ultimoFsync >= self.intervaloFsync:
+                self.sincronizar()
+            if self.cambiosEnRegistro >= self.cambiosPorInstantanea:
+                self.escribirInstantanea()
+
+    def sincronizar(self):
+        """Fuerza a disco los cambios escritos en el registro."""
+        with self.candado:
+            if self.pendientes:
+                self.registro.flush()
+                os.fsync(self.registro.fileno())
+                self.pendientes = 0
+            self.ultimoFsync = time.monotonic()
+
+    def escribirInstantanea(self):
+        """Escribe el estado completo de forma atómica y vacía el registro."""
+        with self.candado:
+            habitaciones = [{"numero": h.getNumeroHabitacion(), "precio": h.getPrecioDia(),
+                             "disponible": h.getDisponible(), "huesped": self._huespedADict(h.getHuesped())}
+                            for h in self.hotel.listaHabitaciones]
+            temporal = self._ruta(self.INSTANTANEA + ".tmp")
+            with open(temporal, "w", encoding="utf-8") as f:
+                json.dump({"secuencia": self.secuencia, "habitaciones": habitaciones}, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporal, self._ruta(self.INSTANTANEA))
+            self._sincronizarDirectorio()
+            # Si hay una caída antes de vaciar el registro, sus cambios se saltan por la secuencia
+            if self.registro is not None:
+                self.registro.close()
+            self.registro = open(self._ruta(self.REGISTRO), "w", encoding="utf-8")
+            self.cambiosEnRegistro = 0
+            self.pendientes = 0
+            self.ultimoFsync = time.monotonic()
+
+    def _sincronizarDirectorio(self):
+        # El os.replace solo es durable cuando se sincroniza el directorio (no se puede en Windows)
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        descriptor = os.open(self.directorio, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
 
-class VentanaHabitaciones(tk.Toplevel):
+    def cerrar(self):
+        self.sincronizar()
+        self.registro.close()
+        self.hotel.desuscribir(self._onCambio)
 
 
+
+class VentanaHabitaciones(DesplazamientoVirtual, tk.Toplevel):
+
+    # Rejilla de habitaciones: solo existen etiquetas para las filas visibles y se
+    # reutilizan al desplazarse, así la ventana no crece con el tamaño del hotel.
+    COLUMNAS = 5
+    FILAS_VISIBLES = 2
+    ANCHO_CELDA = 140
+    ALTO_CELDA = 70
+    # Cada cuánto se aplican los cambios recibidos del hotel (ms)
+    INTERVALO_CAMBIOS = 100
+
     def __init__(self, hotel: Hotel, master=None):
         super().__init__(master)
         self.hotel = hotel
@@ -113,54 +841,132 @@ class VentanaHabitaciones(tk.Toplevel):
         self.contenedor = tk.Frame(self)
         self.contenedor.place(x=0, y=0, relwidth=1, relheight=1)
 
+        # Números de habitación cambiados desde el último repintado. El hotel puede
+        # avisar desde cualquier hilo; Tk solo se toca en _revisarCambios.
+        self.cambios: collections.deque[int] = collections.deque()
+        self.escuchando = False
+
         self._build()
+        self._escuchar()
 
     def _build(self):
-        # Posiciones para etiquetas (como en Java)
-        posiciones = [
-            (20, 30), (160, 30), (300, 30), (440, 30), (580, 30),
-            (20, 120), (160, 120), (300, 120), (440, 120), (580, 120)
-        ]
-        posDisp = [
-            (20, 50), (160, 50), (300, 50), (440, 50), (580, 50),
-            (20, 140), (160, 140), (300, 140), (440, 140), (580, 140)
-        ]
-
+        self.desde = 0
         self.labelsHab = []
         self.labelsDisp = []
 
-        for i in range(10):
-            num = i + 1
-            lblHab = tk.Label(self.contenedor, text=f"Habitación {num}")
-            x, y = posiciones[i]
+        for k in range(self.COLUMNAS * self.FILAS_VISIBLES):
+            x = 20 + self.ANCHO_CELDA * (k % self.COLUMNAS)
+            y = 30 + self.ALTO_CELDA * (k // self.COLUMNAS)
+            lblHab = tk.Label(self.contenedor, text="")
             lblHab.place(x=x, y=y, width=130, height=23)
             self.labelsHab.append(lblHab)
 
-            habObj = self.hotel.listaHabitaciones[i]
-            estado = "Disponible" if habObj.getDisponible() else "No disponible"
-            lblDisp = tk.Label(self.contenedor, text=estado)
-            xd, yd = posDisp[i]
-            lblDisp.place(x=xd, y=yd, width=100, height=23)
+            lblDisp = tk.Label(self.contenedor, text="")
+            lblDisp.place(x=x, y=y + 20, width=100, height=23)
             self.labelsDisp.append(lblDisp)
 
+        self.barra = ttk.Scrollbar(self.contenedor, orient="vertical", command=self._onScroll)
+        self.barra.place(x=720, y=30, width=17, height=self.ALTO_CELDA * self.FILAS_VISIBLES)
+        self._enlazarRueda(self.contenedor, *self.labelsHab, *self.labelsDisp)
+
+        # Resumen de disponibilidad (consultado al mapa de bits del hotel)
+        self.resumenDisponibles = tk.Label(self.contenedor, text="")
+        self.resumenDisponibles.place(x=20, y=180, width=150, height=23)
+
         # Selector y botón
         self.habitacionSeleccionada = tk.Label(self.contenedor, text="Habitación a reservar:")
         self.habitacionSeleccionada.place(x=250, y=180, width=135, height=23)
 
-        self.campoHabitacionSeleccionadaVar = tk.StringVar(value="1")
+        numeros = [str(n) for n in self.hotel.indiceHabitaciones]
+        self.campoHabitacionSeleccionadaVar = tk.StringVar(value=numeros[0] if numeros else "")
         self.campoHabitacionSeleccionada = tk.Spinbox(
-            self.contenedor, from_=1, to=10, textvariable=self.campoHabitacionSeleccionadaVar, width=5
+            self.contenedor, values=numeros, textvariable=self.campoHabitacionSeleccionadaVar, width=5
         )
         self.campoHabitacionSeleccionada.place(x=380, y=180, width=40, height=23)
+        # Se propone la primera habitación libre
+        primera = self.hotel.primeraLibre()
+        if primera is not None:
+            self.campoHabitacionSeleccionadaVar.set(str(primera.getNumeroHabitacion()))
 
         self.botonAceptar = tk.Button(self.contenedor, text="Aceptar", command=self._onAceptar)
         self.botonAceptar.place(x=500, y=180, width=100, height=23)
 
+        self.totalPintado = len(self.hotel.listaHabitaciones)
+        self._pintar()
+        self._pintarResumen()
+
+    # --- Suscripción a los cambios del hotel ---
+    def _escuchar(self):
+        self.hotel.suscribir(self._onCambioHabitacion)
+        self.escuchando = True
+        self.bind("<Destroy>", self._onDestroy)
+        self.after(self.INTERVALO_CAMBIOS, self._revisarCambios)
+
+    def _dejarDeEscuchar(self):
+        if self.escuchando:
+            self.escuchando = False
+            self.hotel.desuscribir(self._onCambioHabitacion)
+
+    def _onDestroy(self, event):
+        if event.widget is self:
+            self._dejarDeEscuchar()
+
+    def _onCambioHabitacion(self, hab: Habitacion, campo: str):
+        if campo == "disponible":
+            self.cambios.append(hab.getNumeroHabitacion())
+
+    def _revisarCambios(self):
+        if not self.escuchando:
+            return
+        numeros = set()
+        while self.cambios:
+            numeros.add(self.cambios.popleft())
+        if len(self.hotel.listaHabitaciones) != self.totalPintado:
+            # Llegaron habitaciones nuevas: cambia la cantidad de filas
+            self.totalPintado = len(self.hotel.listaHabitaciones)
+            self._pintar()
+        else:
+            for numero in numeros:
+                self._pintarHabitacion(numero)
+        if numeros:
+            self._pintarResumen()
+        self.after(self.INTERVALO_CAMBIOS, self._revisarCambios)
+
+    # --- Pintado de la parte visible ---
+    def _totalFilas(self) -> int:
+        return -(-len(self.hotel.listaHabitaciones) // self.COLUMNAS)
+
+    def _pintarCelda(self, k: int, hab: Habitacion):
+        self.labelsDisp[k].config(text="Disponible" if hab.getDisponible() else "No disponible")
+
+    def _pintarHabitacion(self, numero: int):
+        """Actualiza solo la etiqueta de la habitación, si está a la vista."""
+        k = self.hotel.posiciones[numero] - self.desde * self.COLUMNAS
+        if 0 <= k < len(self.labelsDisp):
+            self._pintarCelda(k, self.hotel.indiceHabitaciones[numero])
+
+    def _pintarFilas(self):
+        habitaciones = self.hotel.listaHabitaciones
+        inicio = self.desde * self.COLUMNAS
+        for k in range(len(self.labelsHab)):
+            i = inicio + k
+            if i < len(habitaciones):
+                self.labelsHab[k].config(text=f"Habitación {habitaciones[i].getNumeroHabitacion()}")
+                self._pintarCelda(k, habitaciones[i])
+            else:
+                self.labelsHab[k].config(text="")
+                self.labelsDisp[k].config(text="")
+
+    def _pintarResumen(self):
+        total = len(self.hotel.listaHabitaciones)
+        self.resumenDisponibles.config(text=f"Disponibles: {self.hotel.contarLibres()} de {total}")
+
     def _onAceptar(self):
         try:
             numero = int(self.campoHabitacionSeleccionadaVar.get())
             if not self.hotel.buscarHabitacionOcupada(numero):
                 # Cierra esta y abre Ingreso
+                self._dejarDeEscuchar()
                 self.withdraw()
                 VentanaIngreso(self.hotel, numero, master=self.master)
             else:
@@ -227,46 +1033,37 @@ class VentanaIngreso(tk.Toplevel):
         contenedor.columnconfigure(1, weight=1)
 
     def _onAceptar(self):
-        posicion = -1
-        for i, hab in enumerate(self.hotel.listaHabitaciones):
-            if hab.getNumeroHabitacion() == self.numeroHabitacionReservada:
-                posicion = i
-                try:
-                    # Fecha
-                    fechaIngresada = self.campoFechaIngreso.get().strip()
-                    fecha = datetime.strptime(fechaIngresada, "%Y-%m-%d").date()
-
-                    # Huesped
-                    nombres = self.campoNombre.get().strip()
-                    apellidos = self.campoApellidos.get().strip()
-                    docTxt = self.campoDocumentoIdentidad.get().strip()
-                    if not nombres or not apellidos or not docTxt:
-                        # En Java se usa un mensaje genérico
-                        raise Exception("Campos obligatorios vacíos")
-                    documento = int(docTxt)
-
-                    huesped = Huesped(nombres, apellidos, documento)
-                    huesped.setFechaIngreso(fecha)
-
-                    hab.setHuesped(huesped)
-                    hab.setDisponible(False)
-
-                    # Actualiza lista
-                    self.hotel.listaHabitaciones[posicion] = hab
-
-                    messagebox.showinfo("Mensaje", "El huésped ha sido registrado", parent=self)
-                    self.withdraw()
-                    break
+        if not self.hotel.existeHabitacion(self.numeroHabitacionReservada):
+            return
+        try:
+            # Fecha
+            fecha = parsearFecha(self.campoFechaIngreso.get())
+
+            # Huesped
+            nombres = self.campoNombre.get().strip()
+            apellidos = self.campoApellidos.get().strip()
+            docTxt = self.campoDocumentoIdentidad.get().strip()
+            if not nombres or not apellidos or not docTxt:
+                # En Java se usa un mensaje genérico
+                raise Exception("Campos obligatorios vacíos")
+            documento = int(docTxt)
+
+            huesped = Huesped(nombres, apellidos, documento)
+            huesped.setFechaIngreso(fecha)
+
+            # Otro puesto de recepción pudo ocuparla mientras se llenaba el formulario
+            if not self.hotel.registrarIngreso(self.numeroHabitacionReservada, huesped):
+                messagebox.showinfo("Mensaje", "La habitación está ocupada", parent=self)
+                self.withdraw()
+                return
+
+            messagebox.showinfo("Mensaje", "El huésped ha sido registrado", parent=self)
+            self.withdraw()
 
-                except ValueError as ve:
-                    # Error al convertir fecha o documento
-                    if "unconverted data" in str(ve) or "does not match format" in str(ve):
-                        messagebox.showerror("Mensaje", "La fecha no está en el formato solicitado", parent=self)
-                    else:
-                        messagebox.showerror("Error", "Campo nulo o error en formato de numero", parent=self)
-                except Exception:
-                    messagebox.showerror("Error", "Campo nulo o error en formato de numero", parent=self)
-                break
+        except ErrorFecha as ef:
+            messagebox.showerror("Mensaje", str(ef), parent=self)
+        except Exception:
+            messagebox.showerror("Error", "Campo nulo o error en formato de numero", parent=self)
 
     def _onCancelar(self):
         self.withdraw()
@@ -279,7 +1076,6 @@ class VentanaSalida(tk.Toplevel):
         super().__init__(master)
         self.hotel = hotel
         self.numeroHabitacion = numero
-        self.posicionHabitacion = -1
         self.habitacionOcupada: Optional[Habitacion] = None
 
         self.title("Salida huéspedes")
@@ -329,15 +1125,10 @@ class VentanaSalida(tk.Toplevel):
 
     def _onCalcular(self):
         try:
-            fechaS_txt = self.campoFechaSalida.get().strip()
-            fechaS = datetime.strptime(fechaS_txt, "%Y-%m-%d").date()
+            fechaS = parsearFecha(self.campoFechaSalida.get())
 
             # Buscar habitación por número
-            for i, hab in enumerate(self.hotel.listaHabitaciones):
-                if hab.getNumeroHabitacion() == self.numeroHabitacion:
-                    self.posicionHabitacion = i
-                    self.habitacionOcupada = hab
-                    break
+            self.habitacionOcupada = self.hotel.indiceHabitaciones.get(self.numeroHabitacion)
 
             if not self.habitacionOcupada or not self.habitacionOcupada.getHuesped():
                 raise ValueError("La habitación no tiene huésped.")
@@ -355,29 +1146,25 @@ class VentanaSalida(tk.Toplevel):
 
             # Set fecha salida y calcular
             huesped.setFechaSalida(fechaS)
-            cantidad = huesped.obtenerDiasAlojamiento()
+            cantidad, valor = self.hotel.calcularCuenta(self.numeroHabitacion, fechaS)
             self.cantidadDias.config(text=f"Cantidad de días: {cantidad}")
-            valor = cantidad * self.habitacionOcupada.getPrecioDia()
             self.totalPago.config(text=f"Total: ${valor:,.0f}")
 
             # Habilitar registrar salida
             self.btnRegistrarSalida.config(state="normal")
 
+        except ErrorFecha as ef:
+            messagebox.showerror("Mensaje", str(ef), parent=self)
         except ValueError as ve:
-            if "time data" in str(ve) or "does not match format" in str(ve):
-                messagebox.showerror("Mensaje", "La fecha no está en el formato solicitado", parent=self)
-            else:
-                messagebox.showerror("Error", str(ve), parent=self)
+            messagebox.showerror("Error", str(ve), parent=self)
         except Exception:
             messagebox.showerror("Error", "La fecha no está en el formato solicitado", parent=self)
 
     def _onRegistrarSalida(self):
         # Liberar habitación
         if self.habitacionOcupada:
-            self.habitacionOcupada.setHuesped(None)
-            self.habitacionOcupada.setDisponible(True)
-            # Actualizar vector
-            self.hotel.listaHabitaciones[self.posicionHabitacion] = self.habitacionOcupada
+            # El hotel libera la habitación y guarda la estadía en su historial
+            self.hotel.registrarSalida(self.numeroHabitacion)
 
             messagebox.showinfo("Mensaje", "Se ha registrado la salida del huésped", parent=self)
             self.withdraw()
@@ -385,13 +1172,21 @@ class VentanaSalida(tk.Toplevel):
 
 class VentanaPrincipal(tk.Tk):
 
-    def __init__(self, hotel: Hotel):
+    def __init__(self, hotel: Hotel, persistencia: Optional[PersistenciaHotel] = None):
         super().__init__()
         self.hotel = hotel
+        self.persistencia = persistencia
         self.title("Hotel")
         self.geometry("280x380")
         self.resizable(False, False)
         self._build()
+        if persistencia is not None:
+            self.after(1000, self._sincronizar)
+
+    def _sincronizar(self):
+        # Asegura en disco los cambios de un lote que quedó incompleto
+        self.persistencia.sincronizar()
+        self.after(1000, self._sincronizar)
 
     def _build(self):
         # Menú
@@ -414,8 +1209,8 @@ class VentanaPrincipal(tk.Tk):
             if numeroHabitacion is None:
                 return
             numero = int(numeroHabitacion)
-            if numero < 1 or numero > 10:
-                messagebox.showinfo("Mensaje", "El número de habitación debe estar entre 1 y 10", parent=self)
+            if not self.hotel.existeHabitacion(numero):
+                messagebox.showinfo("Mensaje", f"La habitación {numero} no existe", parent=self)
             elif self.hotel.buscarHabitacionOcupada(numero):
                 VentanaSalida(self.hotel, numero, master=self)
             else:
@@ -427,8 +1222,13 @@ class Principal:
     @staticmethod
     def main():
         hotel = Hotel()
-        miVentanaPrincipal = VentanaPrincipal(hotel)
-        miVentanaPrincipal.mainloop()
+        directorio = os.path.join(os.path.dirname(os.path.abspath(__file__)), "datos_hotel")
+        persistencia = PersistenciaHotel(hotel, directorio)
+        try:
+            miVentanaPrincipal = VentanaPrincipal(hotel, persistencia)
+            miVentanaPrincipal.mainloop()
+        finally:
+            persistencia.cerrar()
 
 
 if __name__ == "__main__":
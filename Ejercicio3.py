@@ -9,14 +9,34 @@ VentanaContacto en Python con Tkinter.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from datetime import date, datetime
-from typing import Optional, List
+from tkinter import ttk, messagebox, filedialog
+from datetime import date, timedelta
+from typing import Iterable, Iterator, Optional, List
+from array import array
+from functools import lru_cache
+import bisect
 import calendar
+import collections
+import concurrent.futures
+import csv
+import heapq
+import itertools
+import json
+import os
+import re
+import sqlite3
+import sys
+import unicodedata
+
+from Desplazamiento import DesplazamientoVirtual
+from Fechas import ErrorFecha, parsearFecha, parsearFechaOpcional
 
 
 class Contacto:
     
+    # AlmacenContactos crea un Contacto por cada fila que lee de la base: sin __dict__ por objeto
+    __slots__ = ("nombres", "apellidos", "fechaNacimiento", "direccion", "telefono", "correo")
+
     def __init__(self, nombres: str, apellidos: str, fechaNacimiento: date,
                  direccion: str, telefono: str, correo: str):
         self.nombres = nombres
@@ -28,20 +48,1084 @@ class Contacto:
 
     def toString(self) -> str:
         # Formato similar al JavaFX: a-b-c-d-e-f
-        return f"{self.nombres} - {self.apellidos} - {self.fechaNacimiento.strftime('%Y-%m-%d')} - {self.direccion} - {self.telefono} - {self.correo}"
+        fecha = self.fechaNacimiento.strftime('%Y-%m-%d') if self.fechaNacimiento else ""
+        return f"{self.nombres} - {self.apellidos} - {fecha} - {self.direccion} - {self.telefono} - {self.correo}"
 
 
-class ListaContactos:
- 
+def normalizar(texto: str) -> str:
+    """Minúsculas y sin tildes, para que 'José' se encuentre escribiendo 'jose'."""
+    texto = texto.strip().lower()
+    if texto.isascii():
+        return texto
+    return "".join(c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c))
+
+
+_NO_DIGITOS = re.compile(r"[^0-9]")
+
+
+def soloDigitos(texto: str) -> str:
+    if texto.isdigit() and texto.isascii():
+        return texto
+    return _NO_DIGITOS.sub("", texto)
+
+
+def esTelefono(texto: str) -> bool:
+    """Texto de búsqueda que parece un teléfono: solo dígitos y separadores."""
+    return bool(soloDigitos(texto)) and all(c.isdigit() or c in " -+()" for c in texto)
+
+
+class IndicePrefijos:
+    """
+    Lista ordenada de textos clave + nulo + posición: un prefijo es un rango de bisect.
+    Las altas se fusionan por lotes.
+    """
+
+    MAX_PENDIENTES = 4096
+
+    def __init__(self):
+        self.claves: list[str] = []
+        self.pendientes: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.claves) + len(self.pendientes)
+
+    def agregar(self, clave: str, posicion: int):
+        bisect.insort(self.pendientes, f"{clave}\0{posicion}")
+        if len(self.pendientes) > self.MAX_PENDIENTES:
+            self.fusionar()
+
+    def agregarBloque(self, pares: Iterable[tuple[str, int]]):
+        self.pendientes.extend(f"{clave}\0{posicion}" for clave, posicion in pares)
+        self.fusionar()
+
+    def fusionar(self):
+        # sort detecta los dos tramos ya ordenados y los mezcla en tiempo lineal
+        self.claves += self.pendientes
+        self.claves.sort()
+        self.pendientes = []
+
+    @staticmethod
+    def _rango(claves: list[str], prefijo: str) -> list[str]:
+        return claves[bisect.bisect_left(claves, prefijo):bisect.bisect_left(claves, prefijo + "\uffff")]
+
+    def buscar(self, prefijo: str) -> Iterator[int]:
+        """Posiciones cuyas claves empiezan por prefijo, en orden alfabético de la clave."""
+        for entrada in heapq.merge(self._rango(self.claves, prefijo), self._rango(self.pendientes, prefijo)):
+            yield int(entrada[entrada.rindex("\0") + 1:])
+
+
+class IndiceTrigramas:
+    """Postings de trigramas (posiciones por cada grupo de 3 letras) para búsqueda aproximada."""
+
+    def __init__(self):
+        self.postings: dict[str, array] = {}
+        self.cantidad = 0
+
+    @staticmethod
+    def trigramas(texto: str) -> set[str]:
+        texto = f"  {texto} "
+        return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+    def agregar(self, texto: str, posicion: int):
+        self.cantidad += 1
+        for t in self.trigramas(texto):
+            lista = self.postings.get(t)
+            if lista is None:
+                lista = self.postings[t] = array("i")
+            lista.append(posicion)
+
+    def candidatos(self, texto: str, cantidad: int) -> list[int]:
+        """
+        Posiciones con más trigramas en común con el texto. Los trigramas muy
+        frecuentes (presentes en más de un 5 % de los registros) casi no
+        distinguen y cuestan mucho de contar, así que se omiten si hay otros.
+        """
+        grupos = self.trigramas(texto)
+        frecuente = max(1000, self.cantidad // 20)
+        listas = [self.postings[t] for t in grupos if t in self.postings]
+        raras = [lista for lista in listas if len(lista) <= frecuente]
+        coincidencias = collections.Counter()
+        for lista in raras or listas:
+            coincidencias.update(lista)
+        return [pos for pos, _ in heapq.nlargest(cantidad, coincidencias.items(), key=lambda par: par[1])]
+
+    def puntaje(self, grupos: set[str], texto: str) -> float:
+        """Similitud de Jaccard entre dos conjuntos de trigramas."""
+        otros = self.trigramas(texto)
+        comunes = len(grupos & otros)
+        return comunes / (len(grupos) + len(otros) - comunes)
+
+
+class IndiceFechas:
+    """Claves enteras distintas ordenadas (toordinal o MMDD) y, por cada una, sus posiciones en un array."""
+
     def __init__(self):
+        self.claves: list[int] = []
+        self.posiciones: dict[int, array] = {}
+        self.cantidad = 0
+
+    def __len__(self) -> int:
+        return self.cantidad
+
+    def agregar(self, clave: int, posicion: int):
+        posiciones = self.posiciones.get(clave)
+        if posiciones is None:
+            bisect.insort(self.claves, clave)
+            posiciones = self.posiciones[clave] = array("i")
+        posiciones.append(posicion)
+        self.cantidad += 1
+
+    def rango(self, desde: int, hasta: int) -> Iterator[tuple[int, int]]:
+        """Pares (clave, posición) con desde <= clave <= hasta, ordenados por clave y posición."""
+        for clave in self.claves[bisect.bisect_left(self.claves, desde):bisect.bisect_right(self.claves, hasta)]:
+            for posicion in self.posiciones[clave]:
+                yield clave, posicion
+
+
+def claveCumpleaños(fecha: date) -> int:
+    return fecha.month * 100 + fecha.day
+
+
+def fechaCumpleaños(nacimiento: date, año: int) -> date:
+    """Día en que se celebra el cumpleaños en ese año; los nacidos un 29 de febrero lo celebran el 28 si no es bisiesto."""
+    if nacimiento.month == 2 and nacimiento.day == 29 and not calendar.isleap(año):
+        return date(año, 2, 28)
+    return nacimiento.replace(year=año)
+
+
+def edad(nacimiento: date, fecha: date) -> int:
+    return fecha.year - nacimiento.year - (fecha < fechaCumpleaños(nacimiento, fecha.year))
+
+
+def _nacidoHace(fecha: date, años: int) -> date:
+    """Última fecha de nacimiento con la que en fecha ya se cumplen esos años (con la misma regla del 29 de febrero)."""
+    año = fecha.year - años
+    if año < date.min.year:
+        return date.min
+    if (fecha.month, fecha.day) == (2, 29) and not calendar.isleap(año):
+        return date(año, 2, 28)
+    if (fecha.month, fecha.day) == (2, 28) and not calendar.isleap(fecha.year) and calendar.isleap(año):
+        return date(año, 2, 29)
+    return fecha.replace(year=año)
+
+
+def tramosCumpleaños(desde: date, dias: int) -> List[tuple[int, int, int]]:
+    """
+    Los días [desde, desde + dias] como tramos (año, claveDesde, claveHasta) de
+    claves MMDD, partidos en el cambio de año. En un año no bisiesto el tramo
+    que termina el 28 de febrero incluye también el 0229.
+    """
+    dias = min(max(dias, 0), 365)
+    hasta = desde + timedelta(days=dias)
+    tramos = []
+    inicio = desde
+    while inicio <= hasta:
+        fin = min(hasta, date(inicio.year, 12, 31))
+        claveFin = claveCumpleaños(fin)
+        if claveFin == 228 and not calendar.isleap(fin.year):
+            claveFin = 229
+        tramos.append((inicio.year, claveCumpleaños(inicio), claveFin))
+        inicio = fin + timedelta(days=1)
+    return tramos
+
+
+class ContactoDuplicado(ValueError):
+    """Se intentó agregar un contacto que ya existe (mismo correo, teléfono o nombre y fecha)."""
+
+    def __init__(self, existente: Contacto):
+        super().__init__(f"El contacto ya existe: {existente.toString()}")
+        self.existente = existente
+
+
+class ListaContactos:
+    """
+    Contactos en orden de inserción con índices por prefijo, correo, teléfono y (difuso=True) trigramas.
+    Los mismos índices detectan duplicados al agregar.
+    """
+
+    POLITICAS = ("rechazar", "fusionar", "permitir")
+
+    def __init__(self, difuso: bool = False, duplicados: str = "rechazar"):
+        if duplicados not in self.POLITICAS:
+            raise ValueError(f"Política de duplicados desconocida: {duplicados}")
+        self.duplicados = duplicados
+        self.difuso = difuso
+        self._reiniciarIndices()
+
+    def _reiniciarIndices(self):
         self.lista: List[Contacto] = []
+        self.indiceNombres = IndicePrefijos()
+        self.indiceCorreos: dict[str, list[int]] = {}
+        self.indiceTelefonos: dict[str, list[int]] = {}
+        self.indiceNombreFecha: dict[tuple[str, int], list[int]] = {}
+        self.indiceTrigramas: Optional[IndiceTrigramas] = IndiceTrigramas() if self.difuso else None
+        # Cumpleaños (MMDD) y fecha de nacimiento (toordinal), para consultas por rango
+        self.indiceCumpleaños = IndiceFechas()
+        self.indiceNacimientos = IndiceFechas()
+
+    def __len__(self) -> int:
+        return len(self.lista)
+
+    def _palabras(self, contacto: Contacto) -> set[str]:
+        # Cada palabra de nombres y apellidos es una clave: "Pérez Gómez" se encuentra por "gomez"
+        return {sys.intern(p) for p in (normalizar(contacto.nombres) + " " + normalizar(contacto.apellidos)).split()}
+
+    @staticmethod
+    def _claveNombre(contacto: Contacto) -> tuple[str, int]:
+        nombre = " ".join((normalizar(contacto.nombres) + " " + normalizar(contacto.apellidos)).split())
+        return nombre, contacto.fechaNacimiento.toordinal() if contacto.fechaNacimiento else 0
+
+    def _indexar(self, contacto: Contacto, posicion: int, conNombres: bool = True):
+        if conNombres:
+            for palabra in self._palabras(contacto):
+                self.indiceNombres.agregar(palabra, posicion)
+        if contacto.fechaNacimiento:
+            self._indexarFecha(contacto.fechaNacimiento, posicion)
+        correo, telefono = normalizar(contacto.correo), soloDigitos(contacto.telefono)
+        if correo:
+            self.indiceCorreos.setdefault(correo, []).append(posicion)
+        if telefono:
+            self.indiceTelefonos.setdefault(telefono, []).append(posicion)
+        self.indiceNombreFecha.setdefault(self._claveNombre(contacto), []).append(posicion)
+        if self.indiceTrigramas is not None:
+            self.indiceTrigramas.agregar(f"{normalizar(contacto.nombres)} {normalizar(contacto.apellidos)}", posicion)
 
-    def agregarContacto(self, contacto: Contacto):
+    def _indexarFecha(self, fecha: date, posicion: int):
+        self.indiceCumpleaños.agregar(claveCumpleaños(fecha), posicion)
+        self.indiceNacimientos.agregar(fecha.toordinal(), posicion)
+
+    # --- Duplicados ---
+    def buscarDuplicado(self, contacto: Contacto) -> Optional[int]:
+        """Posición de un contacto ya guardado con la misma clave, o None. O(1)."""
+        for indice, clave in ((self.indiceCorreos, normalizar(contacto.correo)),
+                              (self.indiceTelefonos, soloDigitos(contacto.telefono)),
+                              (self.indiceNombreFecha, self._claveNombre(contacto))):
+            if clave:
+                posiciones = indice.get(clave)
+                if posiciones:
+                    return posiciones[0]
+        return None
+
+    def _fusionar(self, posicion: int, nuevo: Contacto) -> Contacto:
+        """Completa los campos vacíos del contacto guardado con los del nuevo."""
+        existente = self.lista[posicion]
+        for campo in Contacto.__slots__:
+            if not getattr(existente, campo) and getattr(nuevo, campo):
+                setattr(existente, campo, getattr(nuevo, campo))
+                if campo == "correo":
+                    self.indiceCorreos.setdefault(normalizar(existente.correo), []).append(posicion)
+                elif campo == "telefono":
+                    self.indiceTelefonos.setdefault(soloDigitos(existente.telefono), []).append(posicion)
+                elif campo == "fechaNacimiento":
+                    self._indexarFecha(existente.fechaNacimiento, posicion)
+        return existente
+
+    def _resolverDuplicado(self, contacto: Contacto, politica: str) -> Optional[Contacto]:
+        """Contacto que queda guardado si es un duplicado (o lanza ContactoDuplicado); None si es nuevo."""
+        if politica == "permitir":
+            return None
+        posicion = self.buscarDuplicado(contacto)
+        if posicion is None:
+            return None
+        if politica == "rechazar":
+            raise ContactoDuplicado(self.lista[posicion])
+        return self._fusionar(posicion, contacto)
+
+    def agregarContacto(self, contacto: Contacto, duplicados: Optional[str] = None) -> Contacto:
+        """Agrega el contacto y lo retorna; si era un duplicado fusionado, retorna el existente."""
+        existente = self._resolverDuplicado(contacto, duplicados or self.duplicados)
+        if existente is not None:
+            return existente
         self.lista.append(contacto)
+        self._indexar(contacto, len(self.lista) - 1)
+        return contacto
+
+    def agregarContactos(self, contactos: Iterable[Contacto], duplicados: Optional[str] = None) -> List[Contacto]:
+        """
+        Alta en bloque (importaciones): el índice de nombres se ordena una sola vez
+        al final. Retorna los contactos rechazados por duplicados (no lanza error).
+        """
+        politica = duplicados or self.duplicados
+        rechazados = []
+        pares = []
+        for contacto in contactos:
+            try:
+                if self._resolverDuplicado(contacto, politica) is not None:
+                    continue
+            except ContactoDuplicado:
+                rechazados.append(contacto)
+                continue
+            pos = len(self.lista)
+            self.lista.append(contacto)
+            pares += [(palabra, pos) for palabra in self._palabras(contacto)]
+            self._indexar(contacto, pos, conNombres=False)
+        self.indiceNombres.agregarBloque(pares)
+        return rechazados
+
+    def buscarDuplicados(self, similitud: Optional[float] = None) -> List[List[int]]:
+        """
+        Grupos de posiciones del mismo contacto: union-find sobre los índices por clave y,
+        con similitud, trigramas solo dentro de cada bloque de igual fecha e inicial del apellido.
+        """
+        padre = array("i", range(len(self.lista)))
+
+        def raiz(i: int) -> int:
+            while padre[i] != i:
+                padre[i] = padre[padre[i]]
+                i = padre[i]
+            return i
+
+        def unir(a: int, b: int):
+            a, b = raiz(a), raiz(b)
+            if a != b:
+                padre[max(a, b)] = min(a, b)
+
+        for indice in (self.indiceCorreos, self.indiceTelefonos, self.indiceNombreFecha):
+            for posiciones in indice.values():
+                for pos in posiciones[1:]:
+                    unir(posiciones[0], pos)
+
+        if similitud is not None:
+            # Un representante por cada nombre+fecha distinto (los iguales ya están unidos)
+            bloques: dict[tuple[int, str], list[tuple[int, set[str]]]] = {}
+            for (nombre, fecha), posiciones in self.indiceNombreFecha.items():
+                inicial = normalizar(self.lista[posiciones[0]].apellidos)[:1]
+                bloques.setdefault((fecha, inicial), []).append((posiciones[0], IndiceTrigramas.trigramas(nombre)))
+            for bloque in bloques.values():
+                for i, (a, gruposA) in enumerate(bloque):
+                    for b, gruposB in bloque[i + 1:]:
+                        comunes = len(gruposA & gruposB)
+                        if comunes / (len(gruposA) + len(gruposB) - comunes) >= similitud:
+                            unir(a, b)
+
+        # La raíz de cada grupo es su posición más baja: el contacto más antiguo
+        grupos: dict[int, list[int]] = {}
+        for pos in range(len(self.lista)):
+            r = raiz(pos)
+            if r != pos:
+                grupos.setdefault(r, [r]).append(pos)
+        return list(grupos.values())
+
+    def deduplicar(self, similitud: Optional[float] = None) -> int:
+        """Fusiona cada grupo de duplicados en su primer contacto y reconstruye los índices. Retorna cuántos se quitaron."""
+        grupos = self.buscarDuplicados(similitud)
+        if not grupos:
+            return 0
+        quitar = set()
+        for grupo in grupos:
+            for pos in grupo[1:]:
+                self._fusionar(grupo[0], self.lista[pos])
+                quitar.add(pos)
+        quedan = [c for pos, c in enumerate(self.lista) if pos not in quitar]
+        self._reiniciarIndices()
+        self.agregarContactos(quedan, duplicados="permitir")
+        return len(quitar)
+
+    def obtenerContacto(self, i: int) -> Contacto:
+        return self.lista[i]
+
+    def contactos(self) -> Iterator[Contacto]:
+        """Recorre los contactos sin copiar la lista."""
+        return iter(self.lista)
+
+    def pagina(self, desde: int, cantidad: int) -> List[Contacto]:
+        return self.lista[desde:desde + cantidad]
 
     def obtenerTodos(self) -> List[Contacto]:
+        # Copia completa; para recorrer o paginar usar contactos() u obtenerContacto()
         return list(self.lista)
 
+    # --- Cumpleaños y edades ---
+    def proximosCumpleaños(self, dias: int = 7, desde: Optional[date] = None) -> List[tuple[date, Contacto]]:
+        """
+        (fecha de celebración, contacto) de quienes cumplen años entre desde
+        (hoy si no se da) y desde + dias, en orden de fecha. O(log n + k).
+        """
+        desde = desde or date.today()
+        resultado = []
+        for año, claveDesde, claveHasta in tramosCumpleaños(desde, dias):
+            for _, pos in self.indiceCumpleaños.rango(claveDesde, claveHasta):
+                contacto = self.lista[pos]
+                resultado.append((fechaCumpleaños(contacto.fechaNacimiento, año), contacto))
+        return resultado
+
+    def buscarPorEdad(self, minima: int, maxima: int, fecha: Optional[date] = None) -> List[Contacto]:
+        """Contactos con edad entre minima y maxima (inclusive) a la fecha dada (hoy si no se da), del mayor al menor."""
+        fecha = fecha or date.today()
+        if minima > maxima or minima < 0:
+            return []
+        desde = _nacidoHace(fecha, maxima + 1).toordinal() + 1
+        hasta = _nacidoHace(fecha, minima).toordinal()
+        return [self.lista[pos] for _, pos in self.indiceNacimientos.rango(desde, hasta)]
+
+    # --- Búsquedas ---
+    def buscarPrefijo(self, texto: str, k: int = 10) -> List[Contacto]:
+        """
+        Contactos con alguna palabra de nombres/apellidos que empiece por la primera
+        palabra del texto y que contengan prefijos de las demás palabras.
+        """
+        palabras = normalizar(texto).split()
+        if not palabras:
+            return []
+        resultado, vistas = [], set()
+        for pos in self.indiceNombres.buscar(palabras[0]):
+            if pos in vistas:
+                continue
+            vistas.add(pos)
+            contacto = self.lista[pos]
+            if len(palabras) > 1:
+                propias = (normalizar(contacto.nombres) + " " + normalizar(contacto.apellidos)).split()
+                if not all(any(p.startswith(q) for p in propias) for q in palabras[1:]):
+                    continue
+            resultado.append(contacto)
+            if len(resultado) == k:
+                break
+        return resultado
+
+    def buscarCorreo(self, correo: str) -> List[Contacto]:
+        return [self.lista[i] for i in self.indiceCorreos.get(normalizar(correo), ())]
+
+    def buscarTelefono(self, telefono: str) -> List[Contacto]:
+        return [self.lista[i] for i in self.indiceTelefonos.get(soloDigitos(telefono), ())]
+
+    def buscarDifuso(self, texto: str, k: int = 10) -> List[Contacto]:
+        """Los k contactos con nombre más parecido (tolera errores de escritura)."""
+        if self.indiceTrigramas is None:
+            raise ValueError("La lista no se creó con búsqueda aproximada (difuso=True).")
+        texto = normalizar(texto)
+        grupos = IndiceTrigramas.trigramas(texto)
+        # Los candidatos salen del índice; el puntaje exacto solo se calcula para ellos
+        puntajes = []
+        for pos in self.indiceTrigramas.candidatos(texto, max(k * 10, 100)):
+            c = self.lista[pos]
+            nombre = f"{normalizar(c.nombres)} {normalizar(c.apellidos)}"
+            puntajes.append((self.indiceTrigramas.puntaje(grupos, nombre), -pos))
+        return [self.lista[-pos] for _, pos in heapq.nlargest(k, puntajes)]
+
+    def buscar(self, texto: str, k: int = 10) -> List[Contacto]:
+        """Búsqueda para el cuadro de texto: correo, teléfono o nombre según lo escrito."""
+        texto = texto.strip()
+        if not texto:
+            return []
+        if "@" in texto:
+            return self.buscarCorreo(texto)[:k]
+        if esTelefono(texto):
+            return self.buscarTelefono(texto)[:k]
+        resultado = self.buscarPrefijo(texto, k)
+        if len(resultado) < k and self.indiceTrigramas is not None:
+            # Completa con parecidos cuando el prefijo no alcanza
+            ya = {id(c) for c in resultado}
+            resultado += [c for c in self.buscarDifuso(texto, k) if id(c) not in ya][:k - len(resultado)]
+        return resultado
+
+
+class AlmacenContactos:
+    """
+    Misma interfaz de ListaContactos sobre SQLite: las consultas van a disco por índices,
+    así la libreta puede ser más grande que la RAM. No tiene búsqueda aproximada.
+    """
+
+    TAMAÑO_BLOQUE = 1000
+    CAMPOS = ("nombres", "apellidos", "fechaNacimiento", "direccion", "telefono", "correo")
+    COLUMNAS = ", ".join(CAMPOS)
+
+    def __init__(self, ruta: str, duplicados: str = "rechazar", loteCommit: int = 256):
+        if duplicados not in ListaContactos.POLITICAS:
+            raise ValueError(f"Política de duplicados desconocida: {duplicados}")
+        self.ruta = ruta
+        self.duplicados = duplicados
+        self.loteCommit = loteCommit
+        self.pendientes = 0
+        self.conexion = sqlite3.connect(ruta)
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        # Con WAL, NORMAL no arriesga la base ante un corte; a lo sumo pierde el último lote
+        self.conexion.execute("PRAGMA synchronous=NORMAL")
+        self.conexion.executescript("""
+            CREATE TABLE IF NOT EXISTS contactos (
+                id INTEGER PRIMARY KEY,
+                nombres TEXT NOT NULL, apellidos TEXT NOT NULL, fechaNacimiento TEXT,
+                direccion TEXT, telefono TEXT, correo TEXT,
+                correoNorm TEXT, telefonoNorm TEXT, nombreNorm TEXT, fechaOrdinal INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS palabras (
+                palabra TEXT NOT NULL, contacto INTEGER NOT NULL,
+                PRIMARY KEY (palabra, contacto)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS contactosCorreo ON contactos (correoNorm);
+            CREATE INDEX IF NOT EXISTS contactosTelefono ON contactos (telefonoNorm);
+            CREATE INDEX IF NOT EXISTS contactosNombreFecha ON contactos (nombreNorm, fechaOrdinal);
+            CREATE INDEX IF NOT EXISTS contactosNacimiento ON contactos (fechaOrdinal);
+            CREATE INDEX IF NOT EXISTS contactosCumpleanos ON contactos (substr(fechaNacimiento, 6));
+        """)
+        # Los id son 1..n sin huecos: la posición i es el id i + 1
+        self.cantidad = self.conexion.execute("SELECT COALESCE(MAX(id), 0) FROM contactos").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.cantidad
+
+    @staticmethod
+    def _aContacto(fila) -> Contacto:
+        nombres, apellidos, fecha, direccion, telefono, correo = fila
+        return Contacto(nombres, apellidos, parsearFecha(fecha) if fecha else None, direccion, telefono, correo)
+
+    # --- Altas ---
+    def _insertar(self, contacto: Contacto):
+        # El id sale de la base y no del contador: otra conexión pudo agregar contactos.
+        # Si algo falla se deshace solo lo que escribió esta alta y el contador no
+        # avanza (id 1..n sin huecos); un SAVEPOINT por alta sería varias veces más lento.
+        identificador = self.conexion.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM contactos").fetchone()[0]
+        nombre, fecha = ListaContactos._claveNombre(contacto)
+        palabras = [(palabra, identificador) for palabra in set(nombre.split())]
+        self.conexion.execute(
+            f"INSERT INTO contactos (id, {self.COLUMNAS}, correoNorm, telefonoNorm, nombreNorm, fechaOrdinal) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (identificador, contacto.nombres, contacto.apellidos,
+             contacto.fechaNacimiento.isoformat() if contacto.fechaNacimiento else None,
+             contacto.direccion, contacto.telefono, contacto.correo,
+             normalizar(contacto.correo) or None, soloDigitos(contacto.telefono) or None, nombre, fecha))
+        # Si ese INSERT falla no hay nada que deshacer; desde aquí el id es de esta alta
+        try:
+            self.conexion.executemany("INSERT OR IGNORE INTO palabras VALUES (?, ?)", palabras)
+        except BaseException:
+            self.conexion.executemany("DELETE FROM palabras WHERE palabra = ? AND contacto = ?", palabras)
+            self.conexion.execute("DELETE FROM contactos WHERE id = ?", (identificador,))
+            raise
+        self.cantidad = identificador
+
+    def buscarDuplicado(self, contacto: Contacto) -> Optional[int]:
+        """Posición de un contacto ya guardado con la misma clave, o None (consultas por índice)."""
+        nombre, fecha = ListaContactos._claveNombre(contacto)
+        for consulta, parametros in (("correoNorm = ?", (normalizar(contacto.correo),)),
+                                     ("telefonoNorm = ?", (soloDigitos(contacto.telefono),)),
+                                     ("nombreNorm = ? AND fechaOrdinal = ?", (nombre, fecha))):
+            if not parametros[0]:
+                continue
+            fila = self.conexion.execute(f"SELECT id FROM contactos WHERE {consulta} ORDER BY id LIMIT 1",
+                                         parametros).fetchone()
+            if fila is not None:
+                return fila[0] - 1
+        return None
+
+    def _fusionar(self, posicion: int, nuevo: Contacto) -> Contacto:
+        existente = self.obtenerContacto(posicion)
+        for campo in Contacto.__slots__:
+            if not getattr(existente, campo) and getattr(nuevo, campo):
+                setattr(existente, campo, getattr(nuevo, campo))
+        self.conexion.execute(
+            "UPDATE contactos SET fechaNacimiento = ?, direccion = ?, telefono = ?, correo = ?, telefonoNorm = ?, "
+            "correoNorm = ?, fechaOrdinal = ? WHERE id = ?",
+            (existente.fechaNacimiento.isoformat() if existente.fechaNacimiento else None,
+             existente.direccion, existente.telefono, existente.correo, soloDigitos(existente.telefono) or None,
+             normalizar(existente.correo) or None, ListaContactos._claveNombre(existente)[1], posicion + 1))
+        return existente
+
+    def _resolverDuplicado(self, contacto: Contacto, politica: str) -> Optional[Contacto]:
+        if politica == "permitir":
+            return None
+        posicion = self.buscarDuplicado(contacto)
+        if posicion is None:
+            return None
+        if politica == "rechazar":
+            raise ContactoDuplicado(self.obtenerContacto(posicion))
+        return self._fusionar(posicion, contacto)
+
+    def _contarCambio(self, cantidad: int = 1):
+        self.pendientes += cantidad
+        if self.pendientes >= self.loteCommit:
+            self.sincronizar()
+
+    def agregarContacto(self, contacto: Contacto, duplicados: Optional[str] = None) -> Contacto:
+        existente = self._resolverDuplicado(contacto, duplicados or self.duplicados)
+        if existente is not None:
+            self._contarCambio()
+            return existente
+        self._insertar(contacto)
+        self._contarCambio()
+        return contacto
+
+    def agregarContactos(self, contactos: Iterable[Contacto], duplicados: Optional[str] = None) -> List[Contacto]:
+        """Alta en bloque en una sola transacción; retorna los rechazados por duplicados."""
+        politica = duplicados or self.duplicados
+        rechazados = []
+        for contacto in contactos:
+            try:
+                if self._resolverDuplicado(contacto, politica) is None:
+                    self._insertar(contacto)
+            except ContactoDuplicado:
+                rechazados.append(contacto)
+        self.sincronizar()
+        return rechazados
+
+    def sincronizar(self):
+        """Confirma en disco las altas pendientes."""
+        self.conexion.commit()
+        self.pendientes = 0
+
+    def cerrar(self):
+        self.sincronizar()
+        self.conexion.close()
+
+    # --- Lectura ---
+    def obtenerContacto(self, i: int) -> Contacto:
+        fila = self.conexion.execute(f"SELECT {self.COLUMNAS} FROM contactos WHERE id = ?", (i + 1,)).fetchone()
+        if fila is None:
+            raise IndexError(i)
+        return self._aContacto(fila)
+
+    def pagina(self, desde: int, cantidad: int) -> List[Contacto]:
+        """Contactos de las posiciones [desde, desde + cantidad); va directo por el id, sin OFFSET."""
+        filas = self.conexion.execute(f"SELECT {self.COLUMNAS} FROM contactos WHERE id > ? ORDER BY id LIMIT ?",
+                                      (desde, cantidad)).fetchall()
+        return [self._aContacto(f) for f in filas]
+
+    def contactos(self, desde: int = 0) -> Iterator[Contacto]:
+        """Recorre los contactos leyendo de a TAMAÑO_BLOQUE filas, sin cargar la libreta completa."""
+        while True:
+            bloque = self.pagina(desde, self.TAMAÑO_BLOQUE)
+            if not bloque:
+                return
+            desde += len(bloque)
+            yield from bloque
+
+    def obtenerTodos(self) -> List[Contacto]:
+        # Carga todo en memoria; para libretas grandes usar contactos()
+        return list(self.contactos())
+
+    # --- Cumpleaños y edades ---
+    def proximosCumpleaños(self, dias: int = 7, desde: Optional[date] = None) -> List[tuple[date, Contacto]]:
+        desde = desde or date.today()
+        resultado = []
+        for año, claveDesde, claveHasta in tramosCumpleaños(desde, dias):
+            filas = self.conexion.execute(
+                f"SELECT {self.COLUMNAS} FROM contactos WHERE substr(fechaNacimiento, 6) BETWEEN ? AND ? "
+                "ORDER BY substr(fechaNacimiento, 6), id",
+                (f"{claveDesde // 100:02d}-{claveDesde % 100:02d}", f"{claveHasta // 100:02d}-{claveHasta % 100:02d}"))
+            for fila in filas:
+                contacto = self._aContacto(fila)
+                resultado.append((fechaCumpleaños(contacto.fechaNacimiento, año), contacto))
+        return resultado
+
+    def buscarPorEdad(self, minima: int, maxima: int, fecha: Optional[date] = None) -> List[Contacto]:
+        fecha = fecha or date.today()
+        if minima > maxima or minima < 0:
+            return []
+        filas = self.conexion.execute(
+            f"SELECT {self.COLUMNAS} FROM contactos WHERE fechaOrdinal BETWEEN ? AND ? ORDER BY fechaOrdinal, id",
+            (_nacidoHace(fecha, maxima + 1).toordinal() + 1, _nacidoHace(fecha, minima).toordinal()))
+        return [self._aContacto(fila) for fila in filas]
+
+    # --- Búsquedas ---
+    def _porCampo(self, campo: str, valor: str, k: Optional[int] = None) -> List[Contacto]:
+        if not valor:
+            return []
+        filas = self.conexion.execute(f"SELECT {self.COLUMNAS} FROM contactos WHERE {campo} = ? ORDER BY id LIMIT ?",
+                                      (valor, -1 if k is None else k)).fetchall()
+        return [self._aContacto(f) for f in filas]
+
+    def buscarCorreo(self, correo: str) -> List[Contacto]:
+        return self._porCampo("correoNorm", normalizar(correo))
+
+    def buscarTelefono(self, telefono: str) -> List[Contacto]:
+        return self._porCampo("telefonoNorm", soloDigitos(telefono))
+
+    def buscarPrefijo(self, texto: str, k: int = 10) -> List[Contacto]:
+        """Igual que en ListaContactos: la primera palabra por índice y las demás como prefijos."""
+        palabras = normalizar(texto).split()
+        if not palabras:
+            return []
+        resultado = []
+        cursor = self.conexion.execute(
+            f"SELECT c.id, c.nombreNorm, {', '.join('c.' + campo for campo in self.CAMPOS)} "
+            "FROM palabras p JOIN contactos c ON c.id = p.contacto "
+            "WHERE p.palabra >= ? AND p.palabra < ? ORDER BY p.palabra, p.contacto",
+            (palabras[0], palabras[0] + "\uffff"))
+        vistas = set()
+        for fila in cursor:
+            if fila[0] in vistas:
+                continue
+            vistas.add(fila[0])
+            propias = fila[1].split()
+            if all(any(p.startswith(q) for p in propias) for q in palabras[1:]):
+                resultado.append(self._aContacto(fila[2:]))
+                if len(resultado) == k:
+                    break
+        return resultado
+
+    def buscar(self, texto: str, k: int = 10) -> List[Contacto]:
+        texto = texto.strip()
+        if not texto:
+            return []
+        if "@" in texto:
+            return self.buscarCorreo(texto)[:k]
+        if esTelefono(texto):
+            return self.buscarTelefono(texto)[:k]
+        return self.buscarPrefijo(texto, k)
+
+
+# ==========================
+# Importación y exportación (CSV, JSON Lines, vCard)
+# ==========================
+# Todo se procesa por bloques con generadores: la memoria no depende del tamaño
+# del archivo. La conversión de cada bloque (validar, crear los Contacto) es una
+# función de módulo para poder repartirla entre procesos. Los valores se guardan
+# tal como vienen, espacios incluidos, para que exportar e importar no los cambie.
+
+CAMPOS_CONTACTO = ("nombres", "apellidos", "fechaNacimiento", "direccion", "telefono", "correo")
+FORMATOS = {".csv": "csv", ".jsonl": "jsonl", ".json": "jsonl", ".vcf": "vcard", ".vcard": "vcard"}
+
+
+def formatoDeRuta(ruta: str, formato: Optional[str] = None) -> str:
+    if formato is not None:
+        if formato not in FORMATOS.values():
+            raise ValueError(f"Formato desconocido: {formato}")
+        return formato
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension not in FORMATOS:
+        raise ValueError(f"No se reconoce el formato de {os.path.basename(ruta)} (use .csv, .jsonl o .vcf)")
+    return FORMATOS[extension]
+
+
+# --- vCard (RFC 6350): escape de texto y líneas plegadas ---
+def _escaparVCard(texto: str) -> str:
+    # \r también se escapa para que "a\r\nb" vuelva igual al importarlo aquí; \\r no es del
+    # estándar y otros lectores de vCard lo mostrarán tal cual
+    return (texto.replace("\\", "\\\\").replace("\r", "\\r").replace("\n", "\\n")
+            .replace(",", "\\,").replace(";", "\\;"))
+
+
+_ESCAPES_VCARD = {"n": "\n", "N": "\n", "r": "\r"}
+
+
+def _dividirVCard(valor: str, separador: str = ";") -> List[str]:
+    """Separa por el separador sin escape y quita los escapes de cada parte."""
+    if "\\" not in valor:
+        return valor.split(separador)
+    partes, actual, i = [], [], 0
+    while i < len(valor):
+        c = valor[i]
+        if c == "\\" and i + 1 < len(valor):
+            siguiente = valor[i + 1]
+            actual.append(_ESCAPES_VCARD.get(siguiente, siguiente))
+            i += 2
+            continue
+        if c == separador:
+            partes.append("".join(actual))
+            actual = []
+        else:
+            actual.append(c)
+        i += 1
+    partes.append("".join(actual))
+    return partes
+
+
+def _plegar(linea: str) -> str:
+    # El límite es de 75 octetos en UTF-8 (la continuación lleva un espacio delante),
+    # sin partir un carácter de varios bytes
+    if len(linea) <= 18 or len(linea.encode("utf-8")) <= 75:
+        return linea + "\r\n"
+    trozos, inicio, octetos, limite = [], 0, 0, 75
+    for i, c in enumerate(linea):
+        tamaño = len(c.encode("utf-8"))
+        if octetos + tamaño > limite:
+            trozos.append(linea[inicio:i])
+            inicio, octetos, limite = i, 0, 74
+        octetos += tamaño
+    trozos.append(linea[inicio:])
+    return "\r\n ".join(trozos) + "\r\n"
+
+
+def _tarjetaAContacto(lineas: List[str]) -> dict:
+    registro = dict.fromkeys(CAMPOS_CONTACTO, "")
+    for linea in lineas:
+        nombre, _, valor = linea.partition(":")
+        propiedad = nombre.split(";")[0].upper()
+        if "." in propiedad:
+            propiedad = propiedad.split(".", 1)[1]  # grupos: item1.TEL
+        if propiedad == "N":
+            partes = _dividirVCard(valor) + ["", ""]
+            registro["apellidos"], registro["nombres"] = partes[0], partes[1]
+        elif propiedad == "BDAY":
+            valor = valor.strip()
+            if len(valor) == 8 and valor.isdigit():
+                valor = f"{valor[:4]}-{valor[4:6]}-{valor[6:]}"
+            registro["fechaNacimiento"] = valor
+        elif propiedad == "ADR" and not registro["direccion"]:
+            partes = _dividirVCard(valor)
+            # La dirección se guarda en la calle; de otras libretas se unen las partes no vacías
+            registro["direccion"] = partes[2] if len(partes) == 7 and not any(partes[:2] + partes[3:]) \
+                else ", ".join(p for p in partes if p)
+        elif propiedad == "TEL" and not registro["telefono"]:
+            registro["telefono"] = _dividirVCard(valor)[0]
+        elif propiedad == "EMAIL" and not registro["correo"]:
+            registro["correo"] = _dividirVCard(valor)[0]
+    return registro
+
+
+# --- Lectores: bloques de (línea, dato crudo) ---
+def _bloquesCSV(f, tamaño: int) -> Iterator[tuple[list, Optional[list[int]]]]:
+    lector = csv.reader(f)
+    encabezado = next(lector, None)
+    if encabezado is None:
+        return
+    nombres = [n.strip() for n in encabezado]
+    faltantes = [c for c in CAMPOS_CONTACTO if c not in nombres]
+    if faltantes:
+        raise ValueError(f"Faltan columnas en el archivo: {', '.join(faltantes)}")
+    orden = [nombres.index(c) for c in CAMPOS_CONTACTO]
+    while True:
+        bloque = []
+        for fila in itertools.islice(lector, tamaño):
+            bloque.append((lector.line_num, fila))
+        if not bloque:
+            return
+        yield bloque, orden
+
+
+def _bloquesJSONL(f, tamaño: int) -> Iterator[tuple[list, None]]:
+    numerado = ((n, linea) for n, linea in enumerate(f, 1) if linea.strip())
+    while True:
+        bloque = list(itertools.islice(numerado, tamaño))
+        if not bloque:
+            return
+        yield bloque, None
+
+
+def _tarjetas(f) -> Iterator[tuple[int, List[str]]]:
+    """Cada vCard como (línea de BEGIN, propiedades ya desplegadas)."""
+    tarjeta: Optional[List[str]] = None
+    inicio = 0
+    for n, linea in enumerate(f, 1):
+        linea = linea.rstrip("\r\n")
+        if linea[:1] in (" ", "\t") and tarjeta:
+            tarjeta[-1] += linea[1:]
+        elif linea.upper() == "BEGIN:VCARD":
+            tarjeta, inicio = [], n
+        elif linea.upper() == "END:VCARD":
+            if tarjeta is not None:
+                yield inicio, tarjeta
+            tarjeta = None
+        elif tarjeta is not None and linea:
+            tarjeta.append(linea)
+
+
+def _bloquesVCard(f, tamaño: int) -> Iterator[tuple[list, None]]:
+    tarjetas = _tarjetas(f)
+    while True:
+        bloque = list(itertools.islice(tarjetas, tamaño))
+        if not bloque:
+            return
+        yield bloque, None
+
+
+LECTORES = {"csv": _bloquesCSV, "jsonl": _bloquesJSONL, "vcard": _bloquesVCard}
+
+
+def _crearContacto(nombres: str, apellidos: str, fecha: str, direccion: str, telefono: str, correo: str) -> Contacto:
+    if not nombres.strip() or not apellidos.strip():
+        raise ValueError("Nombres o apellidos vacíos")
+    # Sin fecha es válido: AlmacenContactos guarda contactos sin fecha de nacimiento y se exportan así
+    return Contacto(nombres, apellidos, parsearFecha(fecha) if fecha.strip() else None, direccion, telefono, correo)
+
+
+def _valores(registro: dict) -> list[str]:
+    return ["" if registro.get(campo) is None else str(registro[campo]) for campo in CAMPOS_CONTACTO]
+
+
+def convertirBloque(formato: str, bloque: list, orden: Optional[list[int]] = None
+                    ) -> tuple[List[Contacto], List[int], List[tuple[int, str]]]:
+    """
+    Convierte un bloque crudo en contactos válidos, sus números de línea y los
+    errores (línea, motivo). Se ejecuta en el proceso principal o en el pool.
+    """
+    contactos, lineas, errores = [], [], []
+    for linea, crudo in bloque:
+        try:
+            if formato == "csv":
+                try:
+                    valores = [crudo[k] for k in orden]
+                except IndexError:
+                    raise ValueError(f"Faltan columnas: la fila tiene {len(crudo)}") from None
+            elif formato == "jsonl":
+                try:
+                    registro = json.loads(crudo)
+                except ValueError:
+                    raise ValueError("Línea que no es JSON válido") from None
+                if not isinstance(registro, dict):
+                    raise ValueError("Se esperaba un objeto JSON")
+                valores = _valores(registro)
+            else:
+                valores = _valores(_tarjetaAContacto(crudo))
+            contactos.append(_crearContacto(*valores))
+            lineas.append(linea)
+        except ErrorFecha as e:
+            errores.append((linea, f"Fecha de nacimiento: {e}"))
+        except ValueError as e:
+            errores.append((linea, str(e)))
+    return contactos, lineas, errores
+
+
+class ResultadoCarga:
+    """Resumen de una importación: contactos agregados, duplicados y filas rechazadas (línea, motivo)."""
+
+    def __init__(self):
+        self.cargados = 0
+        self.duplicados = 0
+        self.errores: list[tuple[int, str]] = []
+
+
+class CargadorContactos:
+    """Importa CSV, JSON Lines o vCard por bloques; con procesos > 0 los bloques se convierten en un pool."""
+
+    def __init__(self, lista, tamañoBloque: int = 10_000, procesos: int = 0):
+        self.lista = lista
+        self.tamañoBloque = tamañoBloque
+        self.procesos = procesos
+
+    def cargar(self, ruta: str, formato: Optional[str] = None, encoding: str = "utf-8-sig") -> ResultadoCarga:
+        # utf-8-sig: ignora el BOM que agregan Excel y algunas libretas de direcciones
+        formato = formatoDeRuta(ruta, formato)
+        resultado = ResultadoCarga()
+        with open(ruta, newline="" if formato == "csv" else None, encoding=encoding) as f:
+            bloques = LECTORES[formato](f, self.tamañoBloque)
+            if self.procesos > 0:
+                convertidos = self._convertirEnPool(formato, bloques)
+            else:
+                convertidos = (convertirBloque(formato, bloque, orden) for bloque, orden in bloques)
+            for contactos, lineas, errores in convertidos:
+                self._agregar(contactos, lineas, errores, resultado)
+        resultado.errores.sort()
+        return resultado
+
+    def _convertirEnPool(self, formato: str, bloques) -> Iterator[tuple]:
+        # Se mantienen como máximo 2 bloques por proceso en vuelo y se respetan el orden del archivo
+        with concurrent.futures.ProcessPoolExecutor(self.procesos) as pool:
+            enVuelo = collections.deque()
+            for bloque, orden in bloques:
+                enVuelo.append(pool.submit(convertirBloque, formato, bloque, orden))
+                if len(enVuelo) >= 2 * self.procesos:
+                    yield enVuelo.popleft().result()
+            while enVuelo:
+                yield enVuelo.popleft().result()
+
+    def _agregar(self, contactos: List[Contacto], lineas: List[int], errores: list, resultado: ResultadoCarga):
+        resultado.errores.extend(errores)
+        if not contactos:
+            return
+        rechazados = {id(c) for c in self.lista.agregarContactos(contactos)}
+        if rechazados:
+            for linea, c in zip(lineas, contactos):
+                if id(c) in rechazados:
+                    resultado.errores.append((linea, "Contacto duplicado"))
+        resultado.duplicados += len(rechazados)
+        resultado.cargados += len(contactos) - len(rechazados)
+
+
+# --- Escritores: generan el texto de cada contacto ---
+def _registro(c: Contacto) -> dict:
+    return {"nombres": c.nombres, "apellidos": c.apellidos,
+            "fechaNacimiento": c.fechaNacimiento.isoformat() if c.fechaNacimiento else "",
+            "direccion": c.direccion, "telefono": c.telefono, "correo": c.correo}
+
+
+def textoJSONL(contactos: Iterable[Contacto]) -> Iterator[str]:
+    for c in contactos:
+        yield json.dumps(_registro(c), ensure_ascii=False) + "\n"
+
+
+def textoVCard(contactos: Iterable[Contacto]) -> Iterator[str]:
+    for c in contactos:
+        r = _registro(c)
+        lineas = ["BEGIN:VCARD", "VERSION:3.0",
+                  f"N:{_escaparVCard(r['apellidos'])};{_escaparVCard(r['nombres'])};;;",
+                  f"FN:{_escaparVCard(r['nombres'] + ' ' + r['apellidos'])}"]
+        if r["fechaNacimiento"]:
+            lineas.append(f"BDAY:{r['fechaNacimiento']}")
+        if r["direccion"]:
+            lineas.append(f"ADR;TYPE=HOME:;;{_escaparVCard(r['direccion'])};;;;")
+        if r["telefono"]:
+            lineas.append(f"TEL;TYPE=CELL:{_escaparVCard(r['telefono'])}")
+        if r["correo"]:
+            lineas.append(f"EMAIL;TYPE=INTERNET:{_escaparVCard(r['correo'])}")
+        lineas.append("END:VCARD")
+        yield "".join(map(_plegar, lineas))
+
+
+def exportarContactos(contactos: Iterable[Contacto], ruta: str, formato: Optional[str] = None,
+                      tamañoBuffer: int = 1 << 20) -> int:
+    """Escribe los contactos (p. ej. lista.contactos()) sin armar el archivo en memoria. Retorna cuántos."""
+    formato = formatoDeRuta(ruta, formato)
+    escritos = 0
+    with open(ruta, "w", newline="", encoding="utf-8", buffering=tamañoBuffer) as f:
+        if formato == "csv":
+            escritor = csv.writer(f)
+            escritor.writerow(CAMPOS_CONTACTO)
+            for c in contactos:
+                escritor.writerow(_registro(c).values())
+                escritos += 1
+        else:
+            generador = textoJSONL if formato == "jsonl" else textoVCard
+            for texto in generador(contactos):
+                f.write(texto)
+                escritos += 1
+    return escritos
+
+
+class PaginasContactos:
+    """
+    Textos (toString) de una lista de contactos, leídos por páginas solo cuando
+    se van a mostrar y guardados en una caché LRU con un máximo de páginas.
+    La fuente es ListaContactos, AlmacenContactos o una lista simple.
+    """
+
+    def __init__(self, fuente, tamañoPagina: int = 100, maxPaginas: int = 50):
+        self.fuente = fuente
+        self.tamañoPagina = tamañoPagina
+        self.maxPaginas = maxPaginas
+        self.paginas: collections.OrderedDict[int, List[str]] = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.fuente)
+
+    def _pagina(self, numero: int) -> List[str]:
+        textos = self.paginas.get(numero)
+        if textos is not None:
+            self.paginas.move_to_end(numero)
+            return textos
+        desde = numero * self.tamañoPagina
+        if isinstance(self.fuente, list):
+            contactos = self.fuente[desde:desde + self.tamañoPagina]
+        else:
+            contactos = self.fuente.pagina(desde, self.tamañoPagina)
+        textos = self.paginas[numero] = [c.toString() for c in contactos]
+        if len(self.paginas) > self.maxPaginas:
+            self.paginas.popitem(last=False)
+        return textos
+
+    def texto(self, i: int) -> str:
+        return self._pagina(i // self.tamañoPagina)[i % self.tamañoPagina]
+
+    def textos(self, desde: int, cantidad: int) -> List[str]:
+        hasta = min(desde + cantidad, len(self))
+        return [self.texto(i) for i in range(desde, hasta)]
+
+    def invalidar(self, i: Optional[int] = None):
+        """Descarta la página del contacto i (o todas) para volver a formatearla."""
+        if i is None:
+            self.paginas.clear()
+        else:
+            self.paginas.pop(i // self.tamañoPagina, None)
+
+
+_CALENDARIO = calendar.Calendar(firstweekday=0)
+
+
+@lru_cache(maxsize=240)
+def semanasMes(año: int, mes: int) -> tuple[tuple[int, ...], ...]:
+    """Días del mes por semana (0 = fuera del mes), siempre 6 semanas para una rejilla fija de 6x7."""
+    semanas = [tuple(s) for s in _CALENDARIO.monthdayscalendar(año, mes)]
+    semanas += [(0,) * 7] * (6 - len(semanas))
+    return tuple(semanas)
+
 
 class DatePicker(tk.Frame):
     """
@@ -53,6 +1137,7 @@ class DatePicker(tk.Frame):
     def __init__(self, master=None):
         super().__init__(master)
         self.selectedDate: Optional[date] = None
+        self._top: Optional[tk.Toplevel] = None
 
         self.entryVar = tk.StringVar()
         self.entry = tk.Entry(self, textvariable=self.entryVar)
@@ -62,20 +1147,29 @@ class DatePicker(tk.Frame):
         self.columnconfigure(0, weight=1)
 
     def _openCalendar(self):
-        top = tk.Toplevel(self)
-        top.title("Seleccionar fecha")
-        top.resizable(False, False)
-
         now = self.selectedDate or date.today()
         self._calYear = now.year
         self._calMonth = now.month
+        if self._top is None or not self._top.winfo_exists():
+            self._buildCalendar()
+        else:
+            self._top.deiconify()
+            self._top.lift()
+        self._renderMonth()
+
+    def _buildCalendar(self):
+        top = tk.Toplevel(self)
+        top.title("Seleccionar fecha")
+        top.resizable(False, False)
+        # Cerrar solo la oculta: se reutiliza en la próxima apertura
+        top.protocol("WM_DELETE_WINDOW", top.withdraw)
 
         header = tk.Frame(top, padx=6, pady=6)
         header.pack(fill="x")
         self.lblTitle = tk.Label(header, text="", font=("Segoe UI", 10, "bold"))
         self.lblTitle.pack(side="left", padx=6)
-        tk.Button(header, text="◀", command=lambda: self._shiftMonth(-1, top)).pack(side="right")
-        tk.Button(header, text="▶", command=lambda: self._shiftMonth(+1, top)).pack(side="right")
+        tk.Button(header, text="◀", command=lambda: self._shiftMonth(-1)).pack(side="right")
+        tk.Button(header, text="▶", command=lambda: self._shiftMonth(+1)).pack(side="right")
 
         body = tk.Frame(top, padx=6, pady=6)
         body.pack(fill="both")
@@ -83,10 +1177,19 @@ class DatePicker(tk.Frame):
         for j, wd in enumerate(weekdays):
             tk.Label(body, text=wd, font=("Segoe UI", 9, "bold")).grid(row=0, column=j, padx=3, pady=3)
 
+        # Rejilla fija: cada botón lee su día del mes mostrado (self._dias) al pulsarse
+        self._dias: list[int] = [0] * 42
+        self._textosDias: list[Optional[str]] = [None] * 42
+        self._botonesDias = []
+        for k in range(42):
+            b = tk.Button(body, text="", width=3, command=lambda k=k: self._onDia(k))
+            b.grid(row=1 + k // 7, column=k % 7, padx=2, pady=2)
+            self._botonesDias.append(b)
+
+        self._top = top
         self._body = body
-        self._renderMonth(top)
 
-    def _shiftMonth(self, delta: int, top: tk.Toplevel):
+    def _shiftMonth(self, delta: int):
         m = self._calMonth + delta
         y = self._calYear
         if m < 1:
@@ -95,45 +1198,37 @@ class DatePicker(tk.Frame):
             m = 1; y += 1
         self._calMonth = m
         self._calYear = y
-        self._renderMonth(top)
+        self._renderMonth()
 
-    def _renderMonth(self, top: tk.Toplevel):
+    def _renderMonth(self):
         monthName = calendar.month_name[self._calMonth]
         self.lblTitle.config(text=f"{monthName} {self._calYear}")
 
-        # Limpia filas de días, conserva encabezado (row 0)
-        for w in self._body.grid_slaves():
-            info = w.grid_info()
-            if info["row"] != 0:
-                w.destroy()
-
-        cal = calendar.Calendar(firstweekday=0)
-        row = 1
-        for week in cal.monthdayscalendar(self._calYear, self._calMonth):
-            col = 0
+        k = 0
+        for week in semanasMes(self._calYear, self._calMonth):
             for day in week:
-                if day == 0:
-                    tk.Label(self._body, text="").grid(row=row, column=col, padx=3, pady=3)
-                else:
-                    d = date(self._calYear, self._calMonth, day)
-                    tk.Button(self._body, text=str(day), width=3,
-                              command=lambda dd=d, t=top: self._selectDate(dd, t)).grid(row=row, column=col, padx=2, pady=2)
-                col += 1
-            row += 1
-
-    def _selectDate(self, d: date, top: tk.Toplevel):
+                self._dias[k] = day
+                texto = str(day) if day else ""
+                # Solo se toca el botón si cambia lo que muestra
+                if texto != self._textosDias[k]:
+                    self._textosDias[k] = texto
+                    if day:
+                        self._botonesDias[k].config(text=texto, state="normal", relief="raised")
+                    else:
+                        self._botonesDias[k].config(text="", state="disabled", relief="flat")
+                k += 1
+
+    def _onDia(self, k: int):
+        if self._dias[k]:
+            self._selectDate(date(self._calYear, self._calMonth, self._dias[k]))
+
+    def _selectDate(self, d: date):
         self.selectedDate = d
         self.entryVar.set(d.strftime("%Y-%m-%d"))
-        top.destroy()
+        self._top.withdraw()
 
     def getValue(self) -> Optional[date]:
-        txt = (self.entryVar.get() or "").strip()
-        if not txt:
-            return None
-        try:
-            return datetime.strptime(txt, "%Y-%m-%d").date()
-        except Exception:
-            return None
+        return parsearFechaOpcional(self.entryVar.get())
 
     def setValue(self, d: Optional[date]):
         self.selectedDate = d
@@ -141,15 +1236,32 @@ class DatePicker(tk.Frame):
 
 
 
-class VentanaContacto(tk.Tk):
+class VentanaContacto(DesplazamientoVirtual, tk.Tk):
 
-    def __init__(self):
+    # La lista inferior es virtual: el Listbox solo tiene las filas visibles y los
+    # textos se piden por páginas a PaginasContactos al desplazarse
+    FILAS_VISIBLES = 6
+    RESULTADOS_BUSQUEDA = 50
+    # Milisegundos sin teclear antes de buscar
+    ESPERA_BUSQUEDA = 150
+
+    def __init__(self, listaContactos=None):
         super().__init__()
         self.title("Detalles del contacto")
-        self.geometry("600x330")
+        self.geometry("600x360")
         self.resizable(False, False)
 
-        self.listaContactos = ListaContactos()
+        # ListaContactos en memoria o AlmacenContactos en disco (misma interfaz)
+        self.listaContactos = listaContactos if listaContactos is not None else ListaContactos(difuso=True)
+        self.busquedaPendiente = None
+
+        # Menú Archivo: importación y exportación masiva
+        barraMenu = tk.Menu(self)
+        menuArchivo = tk.Menu(barraMenu, tearoff=0)
+        menuArchivo.add_command(label="Importar contactos...", command=self._accionImportar)
+        menuArchivo.add_command(label="Exportar contactos...", command=self._accionExportar)
+        barraMenu.add_cascade(label="Archivo", menu=menuArchivo)
+        self.config(menu=barraMenu)
 
         # Frame principal (simula GridPane con borde estilo CSS)
         grid = tk.Frame(self, bd=2, relief="solid")
@@ -189,14 +1301,36 @@ class VentanaContacto(tk.Tk):
         bottom.pack(fill="both", expand=True)
         tk.Label(bottom, text="Contactos agregados:").pack(anchor="w")
 
+        # Búsqueda mientras se escribe: nombre, apellido, correo o teléfono
+        filaBusqueda = tk.Frame(bottom)
+        filaBusqueda.pack(fill="x", pady=(0, 4))
+        tk.Label(filaBusqueda, text="Buscar:").pack(side="left")
+        self.busquedaVar = tk.StringVar()
+        self.campoBusqueda = tk.Entry(filaBusqueda, textvariable=self.busquedaVar)
+        self.campoBusqueda.pack(side="left", fill="x", expand=True, padx=6)
+        self.busquedaVar.trace_add("write", self._onBusqueda)
+
         listFrame = tk.Frame(bottom)
         listFrame.pack(fill="both", expand=True)
-        self.listaVisual = tk.Listbox(listFrame, height=6)
-        scrollY = tk.Scrollbar(listFrame, orient="vertical", command=self.listaVisual.yview)
-        self.listaVisual.configure(yscrollcommand=scrollY.set)
+        self.listaVisual = tk.Listbox(listFrame, height=self.FILAS_VISIBLES)
+        self.barra = ttk.Scrollbar(listFrame, orient="vertical", command=self._onScroll)
 
         self.listaVisual.pack(side="left", fill="both", expand=True)
-        scrollY.pack(side="right", fill="y")
+        self.barra.pack(side="right", fill="y")
+        self._enlazarRueda(self.listaVisual)
+
+        # Contactos guardados de sesiones anteriores: solo se leen los que se ven
+        self.desde = 0
+        self.paginasTodos = PaginasContactos(self.listaContactos)
+        self.visibles = self.paginasTodos
+        self._pintar()
+        if isinstance(self.listaContactos, AlmacenContactos):
+            self.after(1000, self._sincronizar)
+
+    def _sincronizar(self):
+        # Confirma en disco las altas de un lote que quedó incompleto
+        self.listaContactos.sincronizar()
+        self.after(1000, self._sincronizar)
 
     def mostrarDatos(self):
      
@@ -215,12 +1349,21 @@ class VentanaContacto(tk.Tk):
             messagebox.showinfo("Mensaje", "Error en ingreso de datos\nSeleccione una fecha válida (YYYY-MM-DD).", parent=self)
             return
 
-        # Crear y guardar
+        # Crear y guardar (un doble clic o un contacto repetido no se agrega dos veces)
         contacto = Contacto(a, b, c, d, e, f)
-        self.listaContactos.agregarContacto(contacto)
+        try:
+            guardado = self.listaContactos.agregarContacto(contacto)
+        except ContactoDuplicado as dup:
+            messagebox.showinfo("Mensaje", f"El contacto ya existe\n{dup.existente.toString()}", parent=self)
+            return
 
-        # Añadir a lista visual
-        self.listaVisual.insert(tk.END, contacto.toString())
+        # Solo cambia la última página (o todas si el contacto se fusionó con otro)
+        self.paginasTodos.invalidar(len(self.listaContactos) - 1 if guardado is contacto else None)
+        if self.busquedaVar.get().strip():
+            # Hay una búsqueda activa: se repite con el nuevo contacto
+            self._mostrarBusqueda()
+        else:
+            self._moverA(self._maxDesde(), forzar=True)
 
         # Limpiar campos
         self.campoNombres.delete(0, tk.END)
@@ -230,13 +1373,76 @@ class VentanaContacto(tk.Tk):
         self.campoTelefono.delete(0, tk.END)
         self.campoCorreo.delete(0, tk.END)
 
+    TIPOS_ARCHIVO = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("vCard", "*.vcf")]
+
+    def _accionImportar(self):
+        ruta = filedialog.askopenfilename(title="Selecciona el archivo de contactos",
+                                          filetypes=self.TIPOS_ARCHIVO, parent=self)
+        if not ruta:
+            return
+        try:
+            resultado = CargadorContactos(self.listaContactos).cargar(ruta)
+        except Exception as e:
+            messagebox.showerror("Error", f"Ocurrió un error al importar el archivo:\n{e}", parent=self)
+            return
+        self.paginasTodos.invalidar()
+        if self.busquedaVar.get().strip():
+            self._mostrarBusqueda()
+        else:
+            self._moverA(self._maxDesde(), forzar=True)
+        mensaje = f"Se importaron {resultado.cargados} contactos"
+        if resultado.errores:
+            detalle = "\n".join(f"Línea {linea}: {motivo}" for linea, motivo in resultado.errores[:10])
+            mensaje += f"\n{len(resultado.errores)} registros con errores:\n{detalle}"
+        messagebox.showinfo("Mensaje", mensaje, parent=self)
+
+    def _accionExportar(self):
+        ruta = filedialog.asksaveasfilename(title="Exportar contactos", defaultextension=".csv",
+                                            filetypes=self.TIPOS_ARCHIVO, parent=self)
+        if not ruta:
+            return
+        try:
+            escritos = exportarContactos(self.listaContactos.contactos(), ruta)
+        except Exception as e:
+            messagebox.showerror("Error", f"Ocurrió un error al exportar:\n{e}", parent=self)
+            return
+        messagebox.showinfo("Mensaje", f"Se exportaron {escritos} contactos a {os.path.basename(ruta)}", parent=self)
+
+    def _onBusqueda(self, *args):
+        if self.busquedaPendiente is not None:
+            self.after_cancel(self.busquedaPendiente)
+        self.busquedaPendiente = self.after(self.ESPERA_BUSQUEDA, self._mostrarBusqueda)
+
+    def _mostrarBusqueda(self):
+        self.busquedaPendiente = None
+        texto = self.busquedaVar.get()
+        if texto.strip():
+            self.visibles = PaginasContactos(self.listaContactos.buscar(texto, self.RESULTADOS_BUSQUEDA))
+        else:
+            self.visibles = self.paginasTodos
+        self._moverA(0, forzar=True)
+
+    # --- Lista virtual ---
+    def _totalFilas(self) -> int:
+        return len(self.visibles)
+
+    def _pintarFilas(self):
+        self.listaVisual.delete(0, tk.END)
+        for texto in self.visibles.textos(self.desde, self.FILAS_VISIBLES):
+            self.listaVisual.insert(tk.END, texto)
+
 
 
 class Principal:
     @staticmethod
     def main():
-        app = VentanaContacto()
-        app.mainloop()
+        ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "contactos.db")
+        almacen = AlmacenContactos(ruta)
+        try:
+            app = VentanaContacto(almacen)
+            app.mainloop()
+        finally:
+            almacen.cerrar()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Lectura de fechas YYYY-MM-DD compartida por los ejercicios: más rápida que strptime,
+acepta mes y día sin cero y guarda en caché los textos repetidos.
+"""
+
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+
+FORMATO = "YYYY-MM-DD"
+# Mismo rango que aceptaba strptime con %Y-%m-%d
+_PATRON = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
+
+class ErrorFecha(ValueError):
+    """Base de los errores de fecha; texto es lo que se intentó leer."""
+
+    def __init__(self, mensaje: str, texto: Optional[str] = None):
+        super().__init__(mensaje)
+        self.texto = texto
+
+
+class FechaVacia(ErrorFecha):
+    def __init__(self):
+        super().__init__("No se ingresó la fecha", "")
+
+
+class FormatoFechaInvalido(ErrorFecha):
+    def __init__(self, texto: str):
+        super().__init__("La fecha no está en el formato solicitado", texto)
+
+
+class FechaInexistente(ErrorFecha):
+    """El formato es correcto pero la fecha no existe en el calendario (ej. 2023-02-29)."""
+
+    def __init__(self, texto: str):
+        super().__init__(f"La fecha {texto} no existe", texto)
+
+
+@lru_cache(maxsize=4096)
+def _parsear(texto: str) -> date:
+    # Camino rápido: exactamente YYYY-MM-DD con dígitos ASCII
+    if len(texto) == 10 and texto[4] == "-" and texto[7] == "-" and texto.replace("-", "").isdigit() \
+            and texto.isascii():
+        try:
+            return date.fromisoformat(texto)
+        except ValueError:
+            raise FechaInexistente(texto) from None
+    coincidencia = _PATRON.fullmatch(texto)
+    if coincidencia is None:
+        raise FormatoFechaInvalido(texto)
+    try:
+        return date(*map(int, coincidencia.groups()))
+    except ValueError:
+        raise FechaInexistente(texto) from None
+
+
+def parsearFecha(texto: Optional[str]) -> date:
+    """Convierte YYYY-MM-DD (se ignoran espacios alrededor) en date o lanza un ErrorFecha."""
+    if texto is None:
+        raise FechaVacia()
+    texto = texto.strip()
+    if not texto:
+        raise FechaVacia()
+    return _parsear(texto)
+
+
+def parsearFechaOpcional(texto: Optional[str]) -> Optional[date]:
+    """Como parsearFecha, pero retorna None si el texto está vacío o no es una fecha válida."""
+    try:
+        return parsearFecha(texto)
+    except ErrorFecha:
+        return None
+
+
+def infoCache():
+    return _parsear.cache_info()
+
+
+def limpiarCache():
+    _parsear.cache_clear()
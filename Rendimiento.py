@@ -0,0 +1,695 @@
+# -*- coding: utf-8 -*-
+"""
+Mediciones de rendimiento de los tres ejercicios, sin interfaz gráfica.
+
+Uso:
+    python Rendimiento.py tiempos [--grupo nomina] [--max-n 1000000] [--json resultados.json]
+    python Rendimiento.py tiempos --comparar base.json [--tolerancia 0.2]
+    python Rendimiento.py memoria [--n 100000]
+    python Rendimiento.py estres [--hilos 1 2 4 8]
+"""
+
+import argparse
+import atexit
+import calendar
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+from datetime import date, datetime, timedelta
+from typing import Callable
+
+from Ejercicio1 import Empleado, ListaEmpleados, TipoCargo, TipoGenero, CARGOS, GENEROS
+from Ejercicio2 import Huesped, Habitacion, Hotel, Tarifario
+from Ejercicio3 import (AlmacenContactos, CargadorContactos, Contacto, DatePicker, ListaContactos, PaginasContactos,
+                        edad, exportarContactos, fechaCumpleaños, semanasMes)
+from Fechas import limpiarCache, parsearFecha
+
+
+TAMAÑOS = (1_000, 10_000, 100_000, 1_000_000)
+
+
+# ==========================
+# Memoria por registro
+# ==========================
+
+def _conDict(clase: type) -> type:
+    """
+    Copia de la clase sin __slots__ (la versión 'antes'): mismos métodos, pero los
+    atributos vuelven al __dict__ de cada instancia. Una subclase sin __slots__ no
+    sirve de comparación, porque los atributos seguirían en los slots heredados.
+    """
+    quitar = {"__slots__", "__dict__", "__weakref__", *clase.__slots__}
+    return type(clase.__name__, clase.__bases__, {k: v for k, v in vars(clase).items() if k not in quitar})
+
+
+def _bytesPorRegistro(fabrica, n: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    registros = [fabrica() for _ in range(n)]
+    fin = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del registros
+    # Se descuenta el puntero que ocupa cada registro dentro de la lista
+    return (fin - inicio) / n - 8
+
+
+def medirMemoria(n: int = 100_000) -> list[dict]:
+    """Bytes por registro de cada clase de dominio, con __dict__ y con __slots__."""
+    nacimiento = date(1990, 1, 1)
+    fabricas = {
+        Empleado: lambda c: c("Ana", "Pérez", TipoCargo.OPERATIVO, TipoGenero.FEMENINO, 50_000.0, 30, 0.0, 4_000.0, 4_000.0),
+        Huesped: lambda c: c("Ana", "Pérez", 123456),
+        Habitacion: lambda c: c(101, True, 120_000),
+        Contacto: lambda c: c("Ana", "Pérez", nacimiento, "Calle 1 # 2-3", "3001234567", "ana@correo.com"),
+    }
+    resultados = []
+    for clase, fabrica in fabricas.items():
+        claseDict = _conDict(clase)
+        antes = _bytesPorRegistro(lambda: fabrica(claseDict), n)
+        despues = _bytesPorRegistro(lambda: fabrica(clase), n)
+        resultados.append({"clase": clase.__name__, "n": n,
+                           "bytesConDict": round(antes, 1), "bytesConSlots": round(despues, 1)})
+    return resultados
+
+
+# ==========================
+# Datos de prueba
+# ==========================
+
+def crearEmpleados(n: int, columnar: bool = False) -> ListaEmpleados:
+    lista = ListaEmpleados(columnar=columnar)
+    for i in range(n):
+        lista.agregarEmpleado(Empleado(f"Nombre{i}", f"Apellido{i}", CARGOS[i % len(CARGOS)],
+                                       GENEROS[i % len(GENEROS)], 40_000.0 + i % 1000, 1 + i % 30,
+                                       (i % 7) * 10_000.0, 4_000.0, 4_000.0))
+    return lista
+
+
+def crearContactos(n: int) -> list[Contacto]:
+    base = date(1950, 1, 1)
+    return [Contacto(f"Nombre{i}", f"Apellido{i}", base + timedelta(days=i % 20_000),
+                     f"Calle {i % 200} # {i % 90}-{i % 50}", f"300{i:07d}", f"contacto{i}@correo.com")
+            for i in range(n)]
+
+
+# ==========================
+# Rutas críticas
+# ==========================
+# Cada medición recibe n y retorna la función a cronometrar (la preparación no se mide).
+
+def _nomina(metodo: str, columnar: bool) -> Callable[[int], Callable[[], object]]:
+    def preparar(n: int):
+        return getattr(crearEmpleados(n, columnar), metodo)
+    return preparar
+
+
+def _hotelBuscarOcupada(n: int):
+    hotel = Hotel.porPisos(n)
+    numeros = [hotel.listaHabitaciones[k].getNumeroHabitacion() for k in (0, n // 2, n - 1)]
+    return lambda: [hotel.buscarHabitacionOcupada(k) for k in numeros]
+
+
+def _hotelBuscarFechaIngreso(n: int):
+    hotel = Hotel.porPisos(n)
+    for hab in hotel.listaHabitaciones[::2]:
+        huesped = Huesped("Ana", "Pérez", hab.getNumeroHabitacion())
+        huesped.setFechaIngreso(date(2024, 1, 1))
+        hab.setHuesped(huesped)
+        hab.setDisponible(False)
+    numeros = [hotel.listaHabitaciones[k].getNumeroHabitacion() for k in (0, n // 2, n - 2)]
+    return lambda: [hotel.buscarFechaIngresoHabitacion(k) for k in numeros]
+
+
+def _hotelCicloIngresoSalida(n: int):
+    hotel = Hotel.porPisos(n)
+    numeros = [hotel.listaHabitaciones[(k * 7919) % n].getNumeroHabitacion() for k in range(100)]
+
+    def ciclo():
+        # Igual que VentanaIngreso._onAceptar y VentanaSalida._onRegistrarSalida
+        for numero in numeros:
+            hab = hotel.getHabitacion(numero)
+            huesped = Huesped("Ana", "Pérez", numero)
+            huesped.setFechaIngreso(date(2024, 1, 1))
+            hab.setHuesped(huesped)
+            hab.setDisponible(False)
+        for numero in numeros:
+            hab = hotel.getHabitacion(numero)
+            hab.setHuesped(None)
+            hab.setDisponible(True)
+    return ciclo
+
+
+def _hotelOcupadoMitad(n: int) -> Hotel:
+    hotel = Hotel.porPisos(n)
+    for k in range(0, n, 2):
+        hotel.listaHabitaciones[k].setDisponible(False)
+    return hotel
+
+
+def _hotelContarLibres(n: int):
+    hotel = _hotelOcupadoMitad(n)
+    return lambda: (hotel.contarLibres(), hotel.contarLibres(160_000))
+
+
+def _hotelPrimeraLibre(n: int):
+    hotel = _hotelOcupadoMitad(n)
+    return lambda: (hotel.primeraLibre(), hotel.primeraLibre(160_000))
+
+
+def _hotelSiguientesLibres(n: int):
+    hotel = _hotelOcupadoMitad(n)
+    return lambda: hotel.siguientesLibres(10, 160_000)
+
+
+def _hotelAsignarEnRafaga(n: int):
+    hotel = Hotel.porPisos(n)
+
+    def rafaga():
+        # 100 ingresos seguidos tomando siempre la primera habitación libre, luego se liberan
+        asignadas = []
+        for _ in range(100):
+            hab = hotel.primeraLibre()
+            hab.setDisponible(False)
+            asignadas.append(hab)
+        for hab in asignadas:
+            hab.setDisponible(True)
+    return rafaga
+
+
+def _hotelConReservas(n: int) -> Hotel:
+    # Un año de reservas por habitación: estadías de 1 a 7 noches separadas por 0 a 3 días
+    hotel = Hotel.porPisos(n)
+    huesped = Huesped("Ana", "Pérez", 1)
+    for k, hab in enumerate(hotel.listaHabitaciones):
+        dia = date(2025, 1, 1) + timedelta(days=k % 4)
+        while dia.year == 2025:
+            noches = 1 + (k + dia.day) % 7
+            hotel.reservar(hab.getNumeroHabitacion(), huesped, dia, dia + timedelta(days=noches))
+            dia += timedelta(days=noches + (k + dia.month) % 4)
+    return hotel
+
+
+def _hotelBuscarDisponiblesEntre(n: int):
+    hotel = _hotelConReservas(n)
+    return lambda: hotel.buscarDisponiblesEntre(date(2025, 7, 10), date(2025, 7, 13))
+
+
+def _hotelIndicadoresMes(n: int):
+    # n estadías terminadas durante 2025 en un hotel de 1.000 habitaciones
+    hotel = Hotel.porPisos(1_000)
+    habitaciones = hotel.listaHabitaciones
+    inicio = date(2025, 1, 1).toordinal()
+    for k in range(n):
+        hab = habitaciones[k % len(habitaciones)]
+        ingreso = date.fromordinal(inicio + (k * 37) % 360)
+        noches = 1 + k % 6
+        hotel.historial.registrar(hab.getNumeroHabitacion(), ingreso, ingreso + timedelta(days=noches),
+                                  hab.getPrecioDia(), noches * hab.getPrecioDia())
+    return lambda: hotel.indicadores(date(2025, 1, 1), date(2026, 1, 1), "mes", porPrecio=True)
+
+
+def _contactosAgregar(n: int):
+    contactos = crearContactos(n)
+
+    def agregar():
+        lista = ListaContactos()
+        for c in contactos:
+            lista.agregarContacto(c)
+    return agregar
+
+
+def _contactosObtenerTodos(n: int):
+    lista = ListaContactos()
+    for c in crearContactos(n):
+        lista.agregarContacto(c)
+    return lista.obtenerTodos
+
+
+def _contactosBuscar(texto: str, difuso: bool = False):
+    def preparar(n: int):
+        lista = ListaContactos(difuso=difuso)
+        lista.agregarContactos(crearContactos(n))
+        return lambda: lista.buscar(texto, 10)
+    return preparar
+
+
+def _contactosDeduplicar(n: int):
+    # Un 10 % de los contactos se repite con otro formato de correo, teléfono o nombre
+    contactos = crearContactos(n)
+    for k in range(0, n, 10):
+        c = contactos[k]
+        contactos.append(Contacto(c.nombres.upper(), c.apellidos, c.fechaNacimiento, "",
+                                  f"({c.telefono[:3]}) {c.telefono[3:]}" if k % 20 else "", c.correo.upper() if k % 20 == 0 else ""))
+
+    def deduplicar():
+        # deduplicar cambia la lista, así que cada repetición la carga de nuevo (se mide también)
+        lista = ListaContactos(duplicados="permitir")
+        lista.agregarContactos(contactos)
+        return lista.deduplicar()
+    return deduplicar
+
+
+def _directorioTemporal() -> str:
+    # Se borra al terminar el proceso
+    directorio = tempfile.mkdtemp(prefix="contactos")
+    atexit.register(shutil.rmtree, directorio, True)
+    return directorio
+
+
+def _almacen(n: int) -> AlmacenContactos:
+    directorio = _directorioTemporal()
+    almacen = AlmacenContactos(os.path.join(directorio, "contactos.db"))
+    almacen.agregarContactos(crearContactos(n), duplicados="permitir")
+    return almacen
+
+
+def _almacenBuscar(texto: str):
+    def preparar(n: int):
+        almacen = _almacen(n)
+        return lambda: almacen.buscar(texto, 10)
+    return preparar
+
+
+def _almacenRecorrer(n: int):
+    almacen = _almacen(n)
+    return lambda: sum(1 for _ in almacen.contactos())
+
+
+def _exportar(extension: str):
+    def preparar(n: int):
+        contactos = crearContactos(n)
+        ruta = os.path.join(_directorioTemporal(), "contactos" + extension)
+        return lambda: exportarContactos(contactos, ruta)
+    return preparar
+
+
+def _importar(extension: str, procesos: int = 0):
+    def preparar(n: int):
+        ruta = os.path.join(_directorioTemporal(), "contactos" + extension)
+        exportarContactos(crearContactos(n), ruta)
+        return lambda: CargadorContactos(ListaContactos(duplicados="permitir"), procesos=procesos).cargar(ruta)
+    return preparar
+
+
+# Fecha fija para que las consultas de cumpleaños y edades sean comparables entre corridas
+FECHA_CONSULTA = date(2024, 2, 26)
+
+
+def _cumpleañosRecorriendo(n: int):
+    # Lo que había antes del índice: revisar toda la lista
+    lista = ListaContactos(duplicados="permitir")
+    lista.agregarContactos(crearContactos(n))
+    hasta = FECHA_CONSULTA + timedelta(days=7)
+
+    def recorrer():
+        resultado = []
+        for c in lista.contactos():
+            for año in (FECHA_CONSULTA.year, hasta.year):
+                fecha = fechaCumpleaños(c.fechaNacimiento, año)
+                if FECHA_CONSULTA <= fecha <= hasta:
+                    resultado.append((fecha, c))
+        return resultado
+    return recorrer
+
+
+def _cumpleañosIndice(n: int):
+    lista = ListaContactos(duplicados="permitir")
+    lista.agregarContactos(crearContactos(n))
+    return lambda: lista.proximosCumpleaños(7, FECHA_CONSULTA)
+
+
+def _edadRecorriendo(n: int):
+    lista = ListaContactos(duplicados="permitir")
+    lista.agregarContactos(crearContactos(n))
+    return lambda: [c for c in lista.contactos() if 30 <= edad(c.fechaNacimiento, FECHA_CONSULTA) <= 34]
+
+
+def _edadIndice(n: int):
+    lista = ListaContactos(duplicados="permitir")
+    lista.agregarContactos(crearContactos(n))
+    return lambda: lista.buscarPorEdad(30, 34, FECHA_CONSULTA)
+
+
+def _almacenCumpleaños(n: int):
+    almacen = _almacen(n)
+    return lambda: almacen.proximosCumpleaños(7, FECHA_CONSULTA)
+
+
+def _contactosDesplazar(n: int):
+    # Lo que pide la lista virtual de VentanaContacto: 6 filas visibles en 1.000 saltos por la libreta
+    lista = ListaContactos(duplicados="permitir")
+    lista.agregarContactos(crearContactos(n))
+    paginas = PaginasContactos(lista)
+    saltos = [(k * 7919) % n for k in range(1_000)]
+    return lambda: [paginas.textos(i, 6) for i in saltos]
+
+
+def _contactosToString(n: int):
+    contactos = crearContactos(n)
+    return lambda: [c.toString() for c in contactos]
+
+
+def crearTarifario() -> Tarifario:
+    tarifario = Tarifario(date(2025, 1, 1), date(2027, 1, 1))
+    tarifario.setFinDeSemana(1.25)
+    tarifario.agregarTemporada(date(2025, 6, 15), date(2025, 8, 15), 1.3)
+    tarifario.agregarTemporada(date(2025, 12, 15), date(2026, 1, 15), 1.5)
+    tarifario.setDescuentoDuracion(7, 0.1)
+    return tarifario
+
+
+def _estadias(n: int) -> tuple[list[float], list[int], list[int]]:
+    inicio = date(2025, 1, 1).toordinal()
+    ingresos = [inicio + (k * 37) % 700 for k in range(n)]
+    return ([120_000 if k % 2 else 160_000 for k in range(n)], ingresos,
+            [i + 1 + k % 14 for k, i in enumerate(ingresos)])
+
+
+def _tarifasUnoAUno(n: int):
+    tarifario = crearTarifario()
+    estadias = [(t, date.fromordinal(i), date.fromordinal(s)) for t, i, s in zip(*_estadias(n))]
+    return lambda: [tarifario.precioEstadia(t, i, s) for t, i, s in estadias]
+
+
+def _tarifasEnBloque(n: int):
+    tarifario = crearTarifario()
+    tipos, ingresos, salidas = _estadias(n)
+
+    def repreciar():
+        # Cambio de tarifas: se invalidan las tablas y se recotiza todo
+        tarifario.setFinDeSemana(1.25)
+        return tarifario.precioEstadias(tipos, ingresos, salidas)
+    return repreciar
+
+
+_RAIZ_TK = []
+
+
+def _raizTk():
+    """Ventana raíz oculta para medir widgets; None si no hay pantalla disponible."""
+    if not _RAIZ_TK:
+        try:
+            import tkinter as tk
+            raiz = tk.Tk()
+            raiz.withdraw()
+            _RAIZ_TK.append(raiz)
+        except Exception:
+            _RAIZ_TK.append(None)
+    return _RAIZ_TK[0]
+
+
+def _meses(n: int) -> list[tuple[int, int]]:
+    # n cambios de mes recorriendo 10 años, como al navegar rápido con ◀ ▶
+    return [(2020 + (k % 120) // 12, 1 + k % 12) for k in range(n)]
+
+
+def _calendarioSinCache(n: int):
+    meses = _meses(n)
+    return lambda: [calendar.Calendar(firstweekday=0).monthdayscalendar(a, m) for a, m in meses]
+
+
+def _calendarioConCache(n: int):
+    meses = _meses(n)
+    return lambda: [semanasMes(a, m) for a, m in meses]
+
+
+def _datePickerNavegar(n: int):
+    raiz = _raizTk()
+    if raiz is None:
+        return None
+    selector = DatePicker(raiz)
+    selector._openCalendar()
+    selector._top.withdraw()
+
+    def navegar():
+        for _ in range(n):
+            selector._shiftMonth(+1)
+        raiz.update_idletasks()
+    return navegar
+
+
+def _datePickerRecrear(n: int):
+    # Camino anterior: destruir y crear los botones del mes en cada cambio
+    import tkinter as tk
+    raiz = _raizTk()
+    if raiz is None:
+        return None
+    cuerpo = tk.Frame(tk.Toplevel(raiz))
+    meses = _meses(n)
+
+    def navegar():
+        for año, mes in meses:
+            for w in cuerpo.grid_slaves():
+                if w.grid_info()["row"] != 0:
+                    w.destroy()
+            for fila, semana in enumerate(calendar.Calendar(firstweekday=0).monthdayscalendar(año, mes), 1):
+                for col, dia in enumerate(semana):
+                    if dia == 0:
+                        tk.Label(cuerpo, text="").grid(row=fila, column=col)
+                    else:
+                        tk.Button(cuerpo, text=str(dia), width=3, command=lambda: None).grid(row=fila, column=col)
+        raiz.update_idletasks()
+    return navegar
+
+
+def _textosFechas(n: int, distintas: int) -> list[str]:
+    base = date(2000, 1, 1).toordinal()
+    return [date.fromordinal(base + (k * 7919) % distintas).isoformat() for k in range(n)]
+
+
+def _fechasStrptime(distintas: int):
+    # Camino anterior de las ventanas: datetime.strptime en cada envío
+    def preparar(n: int):
+        textos = _textosFechas(n, distintas)
+        return lambda: [datetime.strptime(t, "%Y-%m-%d").date() for t in textos]
+    return preparar
+
+
+def _fechasParsear(distintas: int):
+    def preparar(n: int):
+        textos = _textosFechas(n, distintas)
+
+        def parsear():
+            limpiarCache()
+            return [parsearFecha(t) for t in textos]
+        return parsear
+    return preparar
+
+
+# (grupo, nombre, preparar, tamaños)
+MEDICIONES = [
+    ("nomina", "calcularTotalNomina[lista]", _nomina("calcularTotalNomina", False), TAMAÑOS),
+    ("nomina", "calcularTotalNomina[columnar]", _nomina("calcularTotalNomina", True), TAMAÑOS),
+    ("nomina", "obtenerMatriz[lista]", _nomina("obtenerMatriz", False), TAMAÑOS),
+    ("nomina", "obtenerMatriz[columnar]", _nomina("obtenerMatriz", True), TAMAÑOS),
+    ("nomina", "convertirTexto[lista]", _nomina("convertirTexto", False), TAMAÑOS),
+    ("nomina", "convertirTexto[columnar]", _nomina("convertirTexto", True), TAMAÑOS),
+    ("hotel", "buscarHabitacionOcupada", _hotelBuscarOcupada, (100, 1_000, 10_000, 100_000)),
+    ("hotel", "buscarFechaIngresoHabitacion", _hotelBuscarFechaIngreso, (100, 1_000, 10_000, 100_000)),
+    ("hotel", "cicloIngresoSalida[100]", _hotelCicloIngresoSalida, (100, 1_000, 10_000, 100_000)),
+    ("hotel", "contarLibres", _hotelContarLibres, (1_000, 10_000, 100_000)),
+    ("hotel", "primeraLibre", _hotelPrimeraLibre, (1_000, 10_000, 100_000)),
+    ("hotel", "siguientesLibres[10]", _hotelSiguientesLibres, (1_000, 10_000, 100_000)),
+    ("hotel", "asignarEnRafaga[100]", _hotelAsignarEnRafaga, (1_000, 10_000, 100_000)),
+    ("hotel", "buscarDisponiblesEntre[1 año]", _hotelBuscarDisponiblesEntre, (100, 1_000, 10_000)),
+    ("hotel", "indicadores[mes, porPrecio]", _hotelIndicadoresMes, (10_000, 100_000, 1_000_000)),
+    ("tarifas", "precioEstadia[uno a uno]", _tarifasUnoAUno, TAMAÑOS),
+    ("tarifas", "precioEstadias[bloque]", _tarifasEnBloque, TAMAÑOS),
+    ("datepicker", "monthdayscalendar[sin caché]", _calendarioSinCache, (12, 120, 1_200)),
+    ("datepicker", "semanasMes[caché]", _calendarioConCache, (12, 120, 1_200)),
+    ("datepicker", "navegar[recrear widgets]", _datePickerRecrear, (12, 120, 1_200)),
+    ("datepicker", "navegar[reutilizar widgets]", _datePickerNavegar, (12, 120, 1_200)),
+    ("fechas", "strptime[365 distintas]", _fechasStrptime(365), TAMAÑOS),
+    ("fechas", "parsearFecha[365 distintas]", _fechasParsear(365), TAMAÑOS),
+    ("fechas", "strptime[todas distintas]", _fechasStrptime(10**6), TAMAÑOS),
+    ("fechas", "parsearFecha[todas distintas]", _fechasParsear(10**6), TAMAÑOS),
+    ("contactos", "agregarContacto", _contactosAgregar, TAMAÑOS),
+    ("contactos", "obtenerTodos", _contactosObtenerTodos, TAMAÑOS),
+    ("contactos", "toString", _contactosToString, TAMAÑOS),
+    ("contactos", "buscar[prefijo]", _contactosBuscar("nombre12 apellido1"), TAMAÑOS),
+    ("contactos", "buscar[correo]", _contactosBuscar("contacto77@correo.com"), TAMAÑOS),
+    ("contactos", "deduplicar[10 %]", _contactosDeduplicar, TAMAÑOS),
+    ("contactos", "buscar[difuso]", _contactosBuscar("nmbre1234 apelido1234", difuso=True), TAMAÑOS),
+    ("contactos", "PaginasContactos[desplazar]", _contactosDesplazar, TAMAÑOS),
+    ("contactos", "almacen.buscar[prefijo]", _almacenBuscar("nombre12 apellido1"), TAMAÑOS),
+    ("contactos", "almacen.buscar[correo]", _almacenBuscar("contacto77@correo.com"), TAMAÑOS),
+    ("contactos", "almacen.contactos[recorrer]", _almacenRecorrer, TAMAÑOS),
+    ("cumpleaños", "próximos 7 días[recorrer]", _cumpleañosRecorriendo, TAMAÑOS),
+    ("cumpleaños", "proximosCumpleaños[7 días]", _cumpleañosIndice, TAMAÑOS),
+    ("cumpleaños", "edad 30-34[recorrer]", _edadRecorriendo, TAMAÑOS),
+    ("cumpleaños", "buscarPorEdad[30-34]", _edadIndice, TAMAÑOS),
+    ("cumpleaños", "almacen.proximosCumpleaños[7 días]", _almacenCumpleaños, TAMAÑOS),
+    ("archivos", "exportar[csv]", _exportar(".csv"), TAMAÑOS),
+    ("archivos", "exportar[jsonl]", _exportar(".jsonl"), TAMAÑOS),
+    ("archivos", "exportar[vcard]", _exportar(".vcf"), TAMAÑOS),
+    ("archivos", "importar[csv]", _importar(".csv"), TAMAÑOS),
+    ("archivos", "importar[jsonl]", _importar(".jsonl"), TAMAÑOS),
+    ("archivos", "importar[vcard]", _importar(".vcf"), TAMAÑOS),
+    ("archivos", "importar[vcard, 4 procesos]", _importar(".vcf", procesos=4), TAMAÑOS),
+]
+
+
+def medirTiempos(grupos=None, maxN: int = 100_000, repeticiones: int = 5) -> list[dict]:
+    """Mejor tiempo (en segundos) de cada ruta crítica para cada tamaño hasta maxN."""
+    resultados = []
+    for grupo, nombre, preparar, tamaños in MEDICIONES:
+        if grupos and grupo not in grupos:
+            continue
+        for n in tamaños:
+            if n > maxN:
+                continue
+            funcion = preparar(n)
+            if funcion is None:
+                # Medición que no aplica en este entorno (p. ej. widgets sin pantalla)
+                continue
+            # Con entradas grandes se repite menos para no alargar la corrida
+            r = repeticiones if n <= 100_000 else max(1, repeticiones // 2)
+            tiempos = timeit.Timer(funcion).repeat(repeat=r, number=1)
+            resultados.append({"grupo": grupo, "medicion": nombre, "n": n,
+                               "mejor": min(tiempos), "mediana": sorted(tiempos)[len(tiempos) // 2],
+                               "repeticiones": r})
+            del funcion
+            gc.collect()
+    return resultados
+
+
+def compararConBase(resultados: list[dict], base: list[dict], tolerancia: float) -> list[dict]:
+    """Mediciones cuyo mejor tiempo empeoró más que la tolerancia respecto a la base."""
+    anteriores = {(r["medicion"], r["n"]): r["mejor"] for r in base}
+    regresiones = []
+    for r in resultados:
+        anterior = anteriores.get((r["medicion"], r["n"]))
+        if anterior and r["mejor"] > anterior * (1 + tolerancia):
+            regresiones.append({**r, "anterior": anterior, "razon": r["mejor"] / anterior})
+    return regresiones
+
+
+# ==========================
+# Estrés concurrente del hotel
+# ==========================
+
+def estresConcurrencia(hilos=(1, 2, 4, 8), habitaciones: int = 200, operacionesPorHilo: int = 20_000) -> list[dict]:
+    """
+    Varios hilos compiten por las mismas habitaciones con registrarIngreso y
+    registrarSalida. Un registro propio de ocupantes (con su propio candado)
+    detecta si alguna habitación llegó a tener dos huéspedes a la vez.
+    """
+    resultados = []
+    for cantidadHilos in hilos:
+        hotel = Hotel.porPisos(habitaciones)
+        numeros = [h.getNumeroHabitacion() for h in hotel.listaHabitaciones]
+        ocupantes: dict[int, int] = {}
+        candadoOcupantes = threading.Lock()
+        contadores = {"ingresos": 0, "rechazos": 0, "dobles": 0}
+        barrera = threading.Barrier(cantidadHilos + 1)
+
+        def trabajar(idHilo: int):
+            aleatorio = random.Random(idHilo)
+            propias = []
+            ingresos = rechazos = dobles = 0
+            barrera.wait()
+            for _ in range(operacionesPorHilo):
+                if propias and aleatorio.random() < 0.5:
+                    numero = propias.pop(aleatorio.randrange(len(propias)))
+                    with candadoOcupantes:
+                        del ocupantes[numero]
+                    hotel.registrarSalida(numero, date(2025, 1, 2))
+                    continue
+                numero = aleatorio.choice(numeros)
+                huesped = Huesped("Hilo", str(idHilo), idHilo)
+                huesped.setFechaIngreso(date(2025, 1, 1))
+                if hotel.registrarIngreso(numero, huesped):
+                    ingresos += 1
+                    propias.append(numero)
+                    with candadoOcupantes:
+                        if numero in ocupantes:
+                            dobles += 1
+                        ocupantes[numero] = idHilo
+                else:
+                    rechazos += 1
+            with candadoOcupantes:
+                contadores["ingresos"] += ingresos
+                contadores["rechazos"] += rechazos
+                contadores["dobles"] += dobles
+
+        trabajadores = [threading.Thread(target=trabajar, args=(k,)) for k in range(cantidadHilos)]
+        for t in trabajadores:
+            t.start()
+        barrera.wait()
+        inicio = time.perf_counter()
+        for t in trabajadores:
+            t.join()
+        segundos = time.perf_counter() - inicio
+        operaciones = cantidadHilos * operacionesPorHilo
+        resultados.append({"hilos": cantidadHilos, "operaciones": operaciones, "segundos": segundos,
+                           "operacionesPorSegundo": operaciones / segundos, **contadores,
+                           "ocupadasAlFinal": habitaciones - hotel.contarLibres(),
+                           "ocupadasEsperadas": len(ocupantes)})
+    return resultados
+
+
+def _entorno() -> dict:
+    return {"fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0], "plataforma": platform.platform()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mediciones de rendimiento de los ejercicios")
+    parser.add_argument("medicion", choices=["tiempos", "memoria", "estres"])
+    parser.add_argument("--n", type=int, default=100_000, help="cantidad de registros (memoria)")
+    parser.add_argument("--grupo", action="append", choices=sorted({m[0] for m in MEDICIONES}),
+                        help="limita los tiempos a uno o más grupos")
+    parser.add_argument("--max-n", type=int, default=100_000, help="tamaño máximo a medir (tiempos)")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--hilos", type=int, nargs="+", default=[1, 2, 4, 8], help="hilos a probar (estres)")
+    parser.add_argument("--json", help="guarda los resultados en este archivo")
+    parser.add_argument("--comparar", help="archivo JSON de una corrida anterior")
+    parser.add_argument("--tolerancia", type=float, default=0.2,
+                        help="empeoramiento relativo permitido al comparar (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.medicion == "memoria":
+        resultados = medirMemoria(args.n)
+        print(f"{'Clase':<12}{'con __dict__':>14}{'con __slots__':>15}")
+        for r in resultados:
+            print(f"{r['clase']:<12}{r['bytesConDict']:>12.1f} B{r['bytesConSlots']:>13.1f} B")
+    elif args.medicion == "estres":
+        resultados = estresConcurrencia(args.hilos)
+        for r in resultados:
+            print(f"{r['hilos']:>3} hilos {r['operacionesPorSegundo']:>12,.0f} op/s  ingresos={r['ingresos']} "
+                  f"rechazos={r['rechazos']} dobles={r['dobles']} "
+                  f"ocupadas={r['ocupadasAlFinal']}/{r['ocupadasEsperadas']}")
+        if any(r["dobles"] or r["ocupadasAlFinal"] != r["ocupadasEsperadas"] for r in resultados):
+            sys.exit(1)
+    else:
+        resultados = medirTiempos(args.grupo, args.max_n, args.repeticiones)
+        for r in resultados:
+            print(f"{r['grupo']:<11}{r['medicion']:<36}{r['n']:>10}{r['mejor'] * 1000:>12.4f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"entorno": _entorno(), "medicion": args.medicion, "resultados": resultados},
+                      f, ensure_ascii=False, indent=2)
+
+    if args.comparar and args.medicion == "tiempos":
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)["resultados"]
+        regresiones = compararConBase(resultados, base, args.tolerancia)
+        for r in regresiones:
+            print(f"REGRESIÓN {r['medicion']} n={r['n']}: {r['anterior'] * 1000:.3f} ms -> "
+                  f"{r['mejor'] * 1000:.3f} ms (x{r['razon']:.2f})")
+        sys.exit(1 if regresiones else 0)
+
+
+if __name__ == "__main__":
+    main()
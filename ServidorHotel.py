@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+"""
+Servicio de recepción del hotel (Ejercicio 2) sin interfaz gráfica.
+
+Expone un único Hotel sobre un socket local (TCP o Unix) para que varias
+terminales y quioscos compartan el mismo estado. Protocolo de líneas JSON:
+cada solicitud es un objeto en una línea y cada respuesta también.
+
+    -> {"id": 1, "op": "ingreso", "nombres": "Ana", "apellidos": "Ruiz", "documento": 123}
+    <- {"id": 1, "ok": true, "resultado": {"habitacion": 1}}
+    <- {"id": 2, "ok": false, "error": "La habitación 99 no existe."}
+
+Operaciones: ping, consultar, libres, ingreso, cuenta, salida.
+Las fechas van en formato YYYY-MM-DD.
+
+Con persistencia, ingreso y salida corren en un único hilo escritor para que el
+fsync no detenga a las demás conexiones.
+
+Uso:
+    python ServidorHotel.py servir [--host 127.0.0.1] [--puerto 8765] [--unix ruta] [--habitaciones 200] [--datos dir]
+    python ServidorHotel.py carga [--puerto 8765 | --unix ruta | --local] [--conexiones 16] [--solicitudes 2000]
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import itertools
+import json
+import time
+from datetime import date
+from typing import Optional
+
+from Ejercicio2 import Huesped, Hotel, PersistenciaHotel
+from Fechas import ErrorFecha, parsearFecha
+
+
+# Tamaño máximo de una línea de solicitud (bytes)
+LIMITE_LINEA = 64 * 1024
+
+
+def _fecha(solicitud: dict, campo: str, defecto: Optional[date] = None) -> date:
+    valor = solicitud.get(campo)
+    if valor is None:
+        if defecto is None:
+            raise ValueError(f"Falta el campo {campo}.")
+        return defecto
+    if not isinstance(valor, str):
+        raise ValueError(f"El campo {campo} debe ser un texto YYYY-MM-DD.")
+    try:
+        return parsearFecha(valor)
+    except ErrorFecha as e:
+        raise ValueError(f"{campo}: {e}.") from None
+
+
+def _numero(solicitud: dict, campo: str = "habitacion") -> int:
+    valor = solicitud.get(campo)
+    if not isinstance(valor, int) or isinstance(valor, bool):
+        raise ValueError(f"El campo {campo} debe ser un número entero.")
+    return valor
+
+
+def _precio(solicitud: dict) -> Optional[float]:
+    valor = solicitud.get("precio")
+    if valor is None:
+        return None
+    if not isinstance(valor, (int, float)) or isinstance(valor, bool):
+        raise ValueError("El campo precio debe ser un número o null.")
+    return valor
+
+
+def _texto(solicitud: dict, campo: str) -> str:
+    valor = solicitud.get(campo)
+    if not isinstance(valor, str) or not valor.strip():
+        raise ValueError(f"Campo nulo: {campo} debe ser un texto no vacío.")
+    return valor.strip()
+
+
+class ServidorHotel:
+    """Atiende las solicitudes en el bucle de asyncio; con persistencia, las escrituras van al hilo escritor."""
+
+    ESCRITURAS = ("ingreso", "salida")
+
+    def __init__(self, hotel: Hotel, persistencia: Optional[PersistenciaHotel] = None):
+        self.hotel = hotel
+        self.persistencia = persistencia
+        self.conexiones = 0
+        self.atendidas = 0
+        # Un solo hilo: los cambios llegan al registro en el mismo orden en que se atendieron
+        self.escritor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="escritor") \
+            if persistencia is not None else None
+        self.operaciones = {
+            "ping": self._opPing,
+            "consultar": self._opConsultar,
+            "libres": self._opLibres,
+            "ingreso": self._opIngreso,
+            "cuenta": self._opCuenta,
+            "salida": self._opSalida,
+        }
+
+    # --- Operaciones ---
+    def _opPing(self, solicitud: dict) -> dict:
+        return {"habitaciones": len(self.hotel.listaHabitaciones)}
+
+    def _opConsultar(self, solicitud: dict) -> dict:
+        hab = self.hotel.getHabitacion(_numero(solicitud))
+        huesped = hab.getHuesped()
+        return {
+            "habitacion": hab.getNumeroHabitacion(),
+            "disponible": hab.getDisponible(),
+            "precioDia": hab.getPrecioDia(),
+            "huesped": None if huesped is None else {
+                "nombres": huesped.nombres,
+                "apellidos": huesped.apellidos,
+                "documento": huesped.documentoIdentidad,
+                "fechaIngreso": None if huesped.getFechaIngreso() is None else huesped.getFechaIngreso().isoformat(),
+            },
+        }
+
+    def _opLibres(self, solicitud: dict) -> dict:
+        precio = _precio(solicitud)
+        primera = self.hotel.primeraLibre(precio)
+        return {
+            "cantidad": self.hotel.contarLibres(precio),
+            "primera": None if primera is None else primera.getNumeroHabitacion(),
+        }
+
+    def _opIngreso(self, solicitud: dict) -> dict:
+        nombres = _texto(solicitud, "nombres")
+        apellidos = _texto(solicitud, "apellidos")
+        documento = _numero(solicitud, "documento")
+        huesped = Huesped(nombres, apellidos, documento)
+        huesped.setFechaIngreso(_fecha(solicitud, "fechaIngreso", date.today()))
+        if "habitacion" in solicitud:
+            numero = _numero(solicitud)
+            if not self.hotel.registrarIngreso(numero, huesped):
+                raise ValueError(f"La habitación {numero} está ocupada.")
+            return {"habitacion": numero}
+        hab = self.hotel.asignarPrimeraLibre(huesped, _precio(solicitud))
+        if hab is None:
+            raise ValueError("No hay habitaciones libres.")
+        return {"habitacion": hab.getNumeroHabitacion()}
+
+    def _opCuenta(self, solicitud: dict) -> dict:
+        dias, total = self.hotel.calcularCuenta(_numero(solicitud), _fecha(solicitud, "fechaSalida", date.today()))
+        return {"dias": dias, "total": total}
+
+    def _opSalida(self, solicitud: dict) -> dict:
+        numero = _numero(solicitud)
+        fechaSalida = _fecha(solicitud, "fechaSalida", date.today())
+        # Misma validación que la ventana de salida antes de liberar la habitación
+        self.hotel.calcularCuenta(numero, fechaSalida)
+        return {"total": self.hotel.registrarSalida(numero, fechaSalida)}
+
+    # --- Protocolo ---
+    @staticmethod
+    def _leer(linea: bytes) -> tuple[Optional[dict], Optional[dict]]:
+        """(solicitud, None) o (None, respuesta de error) si la línea no es un objeto JSON."""
+        try:
+            solicitud = json.loads(linea)
+        except ValueError:
+            return None, {"id": None, "ok": False, "error": "Solicitud no es JSON válido."}
+        if not isinstance(solicitud, dict):
+            return None, {"id": None, "ok": False, "error": "La solicitud debe ser un objeto JSON."}
+        return solicitud, None
+
+    def _ejecutar(self, solicitud: dict) -> dict:
+        ident = solicitud.get("id")
+        try:
+            operacion = self.operaciones.get(solicitud.get("op"))
+        except TypeError:
+            operacion = None  # op no hashable (lista, objeto)
+        if operacion is None:
+            return {"id": ident, "ok": False, "error": f"Operación desconocida: {solicitud.get('op')!r}."}
+        try:
+            return {"id": ident, "ok": True, "resultado": operacion(solicitud)}
+        except ValueError as e:
+            return {"id": ident, "ok": False, "error": str(e)}
+        except Exception as e:
+            # Una solicitud mal formada no debe cortar la conexión: siempre hay respuesta
+            return {"id": ident, "ok": False, "error": f"Error interno: {type(e).__name__}: {e}"}
+
+    def procesar(self, linea: bytes) -> dict:
+        """Convierte una línea de solicitud en el diccionario de respuesta."""
+        solicitud, error = self._leer(linea)
+        return error if solicitud is None else self._ejecutar(solicitud)
+
+    async def responder(self, linea: bytes) -> dict:
+        """Como procesar, pero las escrituras con persistencia corren en el hilo escritor."""
+        solicitud, error = self._leer(linea)
+        if solicitud is None:
+            return error
+        if self.escritor is not None and solicitud.get("op") in self.ESCRITURAS:
+            return await asyncio.get_running_loop().run_in_executor(self.escritor, self._ejecutar, solicitud)
+        return self._ejecutar(solicitud)
+
+    async def atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.conexiones += 1
+        try:
+            while True:
+                try:
+                    linea = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(b'{"id": null, "ok": false, "error": "Linea demasiado larga."}\n')
+                    break
+                except ConnectionError:
+                    break
+                if not linea:
+                    break
+                if not linea.strip():
+                    continue
+                respuesta = await self.responder(linea)
+                self.atendidas += 1
+                writer.write(json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n")
+                # Solo espera si el cliente no está leyendo (búfer de salida lleno)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.conexiones -= 1
+            writer.close()
+
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 8765,
+                      unix: Optional[str] = None) -> asyncio.AbstractServer:
+        if unix:
+            return await asyncio.start_unix_server(self.atender, path=unix, limit=LIMITE_LINEA)
+        return await asyncio.start_server(self.atender, host, puerto, limit=LIMITE_LINEA)
+
+    async def _sincronizarPeriodicamente(self):
+        # El registro de cambios se baja a disco en lotes; esto cubre los ratos sin tráfico
+        while True:
+            await asyncio.sleep(1.0)
+            await asyncio.get_running_loop().run_in_executor(self.escritor, self.persistencia.sincronizar)
+
+    async def servir(self, host: str = "127.0.0.1", puerto: int = 8765, unix: Optional[str] = None):
+        servidor = await self.iniciar(host, puerto, unix)
+        tarea = asyncio.create_task(self._sincronizarPeriodicamente()) if self.persistencia else None
+        direcciones = ", ".join(str(s.getsockname()) for s in servidor.sockets)
+        print(f"Recepción atendiendo en {direcciones} ({len(self.hotel.listaHabitaciones)} habitaciones)")
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            if tarea is not None:
+                tarea.cancel()
+            if self.escritor is not None:
+                # Termina las escrituras ya aceptadas antes de que se cierre la persistencia
+                self.escritor.shutdown(wait=True)
+
+
+class ClienteHotel:
+    """Cliente mínimo del protocolo: una solicitud a la vez por conexión."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.ids = itertools.count(1)
+
+    @classmethod
+    async def conectar(cls, host: str = "127.0.0.1", puerto: int = 8765, unix: Optional[str] = None) -> "ClienteHotel":
+        if unix:
+            reader, writer = await asyncio.open_unix_connection(unix, limit=LIMITE_LINEA)
+        else:
+            reader, writer = await asyncio.open_connection(host, puerto, limit=LIMITE_LINEA)
+        return cls(reader, writer)
+
+    async def solicitar(self, op: str, **datos) -> dict:
+        datos["id"] = next(self.ids)
+        datos["op"] = op
+        self.writer.write(json.dumps(datos).encode("utf-8") + b"\n")
+        linea = await self.reader.readline()
+        if not linea:
+            raise ConnectionError("El servidor cerró la conexión.")
+        return json.loads(linea)
+
+    async def cerrar(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+# ==========================
+# Generador de carga
+# ==========================
+async def _sesionCarga(cliente: ClienteHotel, solicitudes: int, documento: int,
+                       latencias: list[float], errores: list[str]):
+    """Repite el ciclo de un cliente real: ingreso, consulta, cuenta y salida."""
+    hechas = 0
+    reloj = time.perf_counter
+    numero = None
+    while hechas < solicitudes:
+        if numero is None:
+            op, datos = "ingreso", {"nombres": "Carga", "apellidos": "Prueba", "documento": documento,
+                                    "fechaIngreso": "2024-01-01"}
+        else:
+            paso = hechas % 4
+            if paso == 1:
+                op, datos = "consultar", {"habitacion": numero}
+            elif paso == 2:
+                op, datos = "cuenta", {"habitacion": numero, "fechaSalida": "2024-01-04"}
+            else:
+                op, datos = "salida", {"habitacion": numero, "fechaSalida": "2024-01-04"}
+        inicio = reloj()
+        respuesta = await cliente.solicitar(op, **datos)
+        latencias.append(reloj() - inicio)
+        hechas += 1
+        if not respuesta["ok"]:
+            errores.append(respuesta["error"])
+            numero = None
+        elif op == "ingreso":
+            numero = respuesta["resultado"]["habitacion"]
+        elif op == "salida":
+            numero = None
+
+
+def _percentil(ordenados: list[float], p: float) -> float:
+    if not ordenados:
+        return 0.0
+    return ordenados[min(len(ordenados) - 1, int(p * len(ordenados)))]
+
+
+async def generarCarga(conexiones: int, solicitudes: int, host: str = "127.0.0.1", puerto: int = 8765,
+                       unix: Optional[str] = None) -> dict:
+    """Abre varias conexiones concurrentes y mide solicitudes por segundo y latencias."""
+    clientes = [await ClienteHotel.conectar(host, puerto, unix) for _ in range(conexiones)]
+    latencias: list[float] = []
+    errores: list[str] = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(_sesionCarga(c, solicitudes, 1000 + i, latencias, errores)
+                           for i, c in enumerate(clientes)))
+    duracion = time.perf_counter() - inicio
+    for c in clientes:
+        await c.cerrar()
+    latencias.sort()
+    return {
+        "conexiones": conexiones,
+        "solicitudes": len(latencias),
+        "errores": len(errores),
+        "segundos": duracion,
+        "solicitudesPorSegundo": len(latencias) / duracion if duracion else 0.0,
+        "p50_ms": _percentil(latencias, 0.50) * 1000,
+        "p99_ms": _percentil(latencias, 0.99) * 1000,
+        "max_ms": (latencias[-1] if latencias else 0.0) * 1000,
+    }
+
+
+async def _cargaLocal(args) -> dict:
+    # Servidor y cliente en el mismo proceso: útil para comparar cambios, no para cifras absolutas
+    servidor = ServidorHotel(Hotel.porPisos(args.habitaciones or args.conexiones))
+    socket = await servidor.iniciar(args.host, 0)
+    puerto = socket.sockets[0].getsockname()[1]
+    try:
+        return await generarCarga(args.conexiones, args.solicitudes, args.host, puerto)
+    finally:
+        socket.close()
+        await socket.wait_closed()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio de recepción del hotel")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    pServir = sub.add_parser("servir", help="atender terminales y quioscos")
+    pCarga = sub.add_parser("carga", help="medir solicitudes por segundo y latencia p99")
+    for p in (pServir, pCarga):
+        p.add_argument("--host", default="127.0.0.1")
+        p.add_argument("--puerto", type=int, default=8765)
+        p.add_argument("--unix", help="ruta de un socket Unix en lugar de TCP")
+        p.add_argument("--habitaciones", type=int, help="tamaño del hotel (por defecto las 10 originales)")
+    pServir.add_argument("--datos", help="directorio para guardar el estado (PersistenciaHotel)")
+    pCarga.add_argument("--conexiones", type=int, default=16)
+    pCarga.add_argument("--solicitudes", type=int, default=2000, help="solicitudes por conexión")
+    pCarga.add_argument("--local", action="store_true", help="levantar el servidor en este mismo proceso")
+    pCarga.add_argument("--json", help="guardar el resultado en este archivo")
+    args = parser.parse_args(argv)
+
+    if args.comando == "servir":
+        hotel = Hotel() if args.habitaciones is None else Hotel.porPisos(args.habitaciones)
+        persistencia = PersistenciaHotel(hotel, args.datos) if args.datos else None
+        try:
+            asyncio.run(ServidorHotel(hotel, persistencia).servir(args.host, args.puerto, args.unix))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if persistencia is not None:
+                persistencia.cerrar()
+    else:
+        if args.local:
+            resultado = asyncio.run(_cargaLocal(args))
+        else:
+            resultado = asyncio.run(generarCarga(args.conexiones, args.solicitudes,
+                                                 args.host, args.puerto, args.unix))
+        print(f"{resultado['solicitudes']} solicitudes en {resultado['segundos']:.2f} s "
+              f"({resultado['conexiones']} conexiones, {resultado['errores']} errores)")
+        print(f"{resultado['solicitudesPorSegundo']:,.0f} sol/s  "
+              f"p50 {resultado['p50_ms']:.2f} ms  p99 {resultado['p99_ms']:.2f} ms  máx {resultado['max_ms']:.2f} ms")
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(resultado, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from types import SimpleNamespace
+
+from Desplazamiento import DesplazamientoVirtual
+
+
+class BarraFalsa:
+    def set(self, primero, ultimo):
+        self.posicion = (primero, ultimo)
+
+
+class ListaFalsa(DesplazamientoVirtual):
+    """Ventana mínima sin Tk: guarda lo que se pintó."""
+
+    FILAS_VISIBLES = 4
+
+    def __init__(self, total: int):
+        self.total = total
+        self.desde = 0
+        self.barra = BarraFalsa()
+        self.pintadas = 0
+        self.filas = []
+        self._pintar()
+
+    def _totalFilas(self) -> int:
+        return self.total
+
+    def _pintarFilas(self):
+        self.pintadas += 1
+        self.filas = list(range(self.desde, min(self.total, self.desde + self.FILAS_VISIBLES)))
+
+
+class PruebaDesplazamientoVirtual(unittest.TestCase):
+
+    def testLimites(self):
+        v = ListaFalsa(10)
+        v._moverA(-5)
+        self.assertEqual(v.desde, 0)
+        v._moverA(100)
+        self.assertEqual(v.desde, 6)
+        self.assertEqual(v.filas, [6, 7, 8, 9])
+        self.assertEqual(v.barra.posicion, (0.6, 1.0))
+
+    def testSoloRepintaSiCambia(self):
+        v = ListaFalsa(10)
+        antes = v.pintadas
+        v._moverA(0)
+        self.assertEqual(v.pintadas, antes)
+        v._moverA(0, forzar=True)
+        self.assertEqual(v.pintadas, antes + 1)
+
+    def testBarraYRueda(self):
+        v = ListaFalsa(100)
+        v._onScroll("moveto", "0.5")
+        self.assertEqual(v.desde, 50)
+        v._onScroll("scroll", "1", "pages")
+        self.assertEqual(v.desde, 54)
+        v._onScroll("scroll", "-1", "units")
+        self.assertEqual(v.desde, 53)
+        self.assertEqual(v._onRueda(SimpleNamespace(num=4, delta=0)), "break")
+        self.assertEqual(v.desde, 52)
+        v._onRueda(SimpleNamespace(num=5, delta=0))
+        v._onRueda(SimpleNamespace(num=0, delta=-120))
+        self.assertEqual(v.desde, 54)
+
+    def testListaVacia(self):
+        v = ListaFalsa(0)
+        v._onScroll("moveto", "0.7")
+        self.assertEqual(v.desde, 0)
+        self.assertEqual(v.filas, [])
+        self.assertEqual(v.barra.posicion, (0.0, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
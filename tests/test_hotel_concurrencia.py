@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import random
+import sys
+import threading
+import unittest
+from datetime import date
+
+from Ejercicio2 import Hotel, Huesped
+
+
+class PruebaHotelConcurrente(unittest.TestCase):
+    """Varios hilos sobre un mismo Hotel: nunca dos huéspedes en una habitación."""
+
+    HILOS = 8
+    OPERACIONES = 3_000
+
+    def setUp(self):
+        # Cambios de hilo muy frecuentes para que las carreras aparezcan en pocas operaciones
+        self.intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.intervalo)
+
+    def _estresar(self, hotel: Hotel):
+        numeros = [h.getNumeroHabitacion() for h in hotel.listaHabitaciones]
+        precios = sorted(hotel.libresPorPrecio)
+        ocupantes: dict[int, Huesped] = {}
+        candadoOcupantes = threading.Lock()
+        dobles = []
+        errores = []
+        barrera = threading.Barrier(self.HILOS)
+
+        def ocupar(numero: int, huesped: Huesped, propias: list):
+            with candadoOcupantes:
+                if numero in ocupantes:
+                    dobles.append(numero)
+                ocupantes[numero] = huesped
+            propias.append(numero)
+
+        def trabajar(idHilo: int):
+            try:
+                aleatorio = random.Random(idHilo)
+                propias = []
+                barrera.wait()
+                for k in range(self.OPERACIONES):
+                    huesped = Huesped("Hilo", str(idHilo), idHilo * self.OPERACIONES + k)
+                    huesped.setFechaIngreso(date(2025, 1, 1))
+                    opcion = aleatorio.random()
+                    if propias and opcion < 0.4:
+                        numero = propias.pop(aleatorio.randrange(len(propias)))
+                        with candadoOcupantes:
+                            ocupantes.pop(numero, None)
+                        hotel.registrarSalida(numero, date(2025, 1, 3))
+                    elif opcion < 0.7:
+                        hab = hotel.asignarPrimeraLibre(huesped, aleatorio.choice(precios + [None]))
+                        if hab is not None:
+                            ocupar(hab.getNumeroHabitacion(), huesped, propias)
+                    else:
+                        numero = aleatorio.choice(numeros)
+                        if hotel.registrarIngreso(numero, huesped):
+                            ocupar(numero, huesped, propias)
+            except Exception as e:  # se revisa en el hilo principal
+                errores.append(e)
+
+        trabajadores = [threading.Thread(target=trabajar, args=(k,)) for k in range(self.HILOS)]
+        for t in trabajadores:
+            t.start()
+        for t in trabajadores:
+            t.join()
+        return ocupantes, dobles, errores
+
+    def _revisarMapas(self, hotel: Hotel):
+        for posicion, hab in enumerate(hotel.listaHabitaciones):
+            bit = 1 << posicion
+            self.assertEqual(bool(hotel.libres & bit), hab.getDisponible(), hab.getNumeroHabitacion())
+            for precio, mapa in hotel.libresPorPrecio.items():
+                esperado = hab.getDisponible() and hab.getPrecioDia() == precio
+                self.assertEqual(bool(mapa & bit), esperado, (hab.getNumeroHabitacion(), precio))
+        self.assertEqual(hotel.libres >> len(hotel.listaHabitaciones), 0)
+        self.assertEqual(hotel.contarLibres(),
+                         sum(h.getDisponible() for h in hotel.listaHabitaciones))
+
+    def _probar(self, hotel: Hotel):
+        ocupantes, dobles, errores = self._estresar(hotel)
+        self.assertEqual(dobles, [])
+        self.assertEqual(errores, [])
+        # Cada habitación ocupada tiene exactamente al huésped que la ganó, y ninguna otra lo está
+        for hab in hotel.listaHabitaciones:
+            numero = hab.getNumeroHabitacion()
+            if numero in ocupantes:
+                self.assertFalse(hab.getDisponible(), numero)
+                self.assertIs(hab.getHuesped(), ocupantes[numero])
+            else:
+                self.assertTrue(hab.getDisponible(), numero)
+                self.assertIsNone(hab.getHuesped(), numero)
+        self._revisarMapas(hotel)
+
+    def testPocasHabitaciones(self):
+        # Muchos hilos por habitación: la contienda es máxima
+        self._probar(Hotel())
+
+    def testMuchasHabitaciones(self):
+        # Más de 64 habitaciones: varias comparten franja de candado y el mapa pasa de una palabra
+        self._probar(Hotel.porPisos(150))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import random
+import unittest
+from unittest import mock
+
+import Ejercicio1
+from Ejercicio1 import CARGOS, GENEROS, ColumnasEmpleados, Empleado, ListaEmpleados
+
+
+def empleadoAleatorio(aleatorio: random.Random) -> Empleado:
+    return Empleado("Nombre", "Apellidos", aleatorio.choice(CARGOS), aleatorio.choice(GENEROS),
+                    aleatorio.uniform(30_000, 200_000), aleatorio.randint(0, 31),
+                    aleatorio.uniform(0, 500_000), aleatorio.uniform(0, 200_000), aleatorio.uniform(0, 200_000))
+
+
+class PruebaTotalesIncrementales(unittest.TestCase):
+    """Los totales mantenidos en cada cambio deben coincidir con un recálculo completo."""
+
+    def _operar(self, lista: ListaEmpleados, operaciones: int = 800, semilla: int = 7):
+        # Con verificarConsistencia=True cada operación compara contra el recálculo y lanza ValueError si difiere
+        aleatorio = random.Random(semilla)
+        for _ in range(operaciones):
+            opcion = aleatorio.random()
+            if len(lista) and opcion < 0.25:
+                lista.eliminarEmpleado(aleatorio.randrange(len(lista)))
+            elif len(lista) and opcion < 0.5:
+                lista.actualizarEmpleado(aleatorio.randrange(len(lista)), empleadoAleatorio(aleatorio))
+            elif opcion < 0.55:
+                bloque = ColumnasEmpleados()
+                for _ in range(aleatorio.randint(0, 50)):
+                    bloque.agregar(empleadoAleatorio(aleatorio))
+                lista.agregarBloque(bloque)
+            else:
+                lista.agregarEmpleado(empleadoAleatorio(aleatorio))
+
+    def _compararConRecalculo(self, lista: ListaEmpleados):
+        total, cargos, generos = lista.totalNomina, dict(lista.subtotalesCargo), dict(lista.subtotalesGenero)
+        lista.recalcularTotales()
+        self.assertAlmostEqual(total, lista.totalNomina, delta=1e-6 * max(1.0, abs(lista.totalNomina)))
+        for c in CARGOS:
+            self.assertAlmostEqual(cargos[c], lista.subtotalesCargo[c], delta=1e-6 * max(1.0, abs(lista.subtotalesCargo[c])))
+        for g in GENEROS:
+            self.assertAlmostEqual(generos[g], lista.subtotalesGenero[g], delta=1e-6 * max(1.0, abs(lista.subtotalesGenero[g])))
+        self.assertAlmostEqual(lista.totalNomina, sum(lista.calcularNominas()),
+                               delta=1e-6 * max(1.0, abs(lista.totalNomina)))
+
+    def testListaDeObjetos(self):
+        lista = ListaEmpleados(verificarConsistencia=True)
+        self._operar(lista)
+        self._compararConRecalculo(lista)
+
+    def testColumnar(self):
+        lista = ListaEmpleados(columnar=True, verificarConsistencia=True)
+        self._operar(lista)
+        self._compararConRecalculo(lista)
+
+    def testBloqueSinNumpy(self):
+        # agregarBloque tiene un camino alterno con la librería estándar
+        with mock.patch.object(Ejercicio1, "np", None):
+            for columnar in (False, True):
+                lista = ListaEmpleados(columnar=columnar, verificarConsistencia=True)
+                self._operar(lista, operaciones=500)
+                self._compararConRecalculo(lista)
+
+    def testVaciarReiniciaTotales(self):
+        lista = ListaEmpleados(verificarConsistencia=True)
+        self._operar(lista, operaciones=300)
+        while len(lista):
+            lista.eliminarEmpleado(len(lista) - 1)
+        self.assertEqual(lista.totalNomina, 0.0)
+        self.assertEqual(set(lista.subtotalesCargo.values()), {0.0})
+        self.assertEqual(set(lista.subtotalesGenero.values()), {0.0})
+
+    def testCambioDirectoNoActualizaTotales(self):
+        # Asignar atributos de un Empleado ya agregado no pasa por los totales:
+        # verificarTotales lo detecta y recalcularTotales los repara.
+        lista = ListaEmpleados()
+        e = Empleado("Ana", "Pérez", CARGOS[0], GENEROS[0], 100.0, 10, 0.0, 0.0, 0.0)
+        lista.agregarEmpleado(e)
+        e.diasTrabajados = 20
+        with self.assertRaises(ValueError):
+            lista.verificarTotales()
+        lista.recalcularTotales()
+        self.assertEqual(lista.calcularTotalNomina(), 2000.0)
+        # La forma correcta de cambiar un empleado es reemplazarlo
+        lista.actualizarEmpleado(0, Empleado("Ana", "Pérez", CARGOS[0], GENEROS[0], 100.0, 30, 0.0, 0.0, 0.0))
+        self.assertEqual(lista.calcularTotalNomina(), 3000.0)
+        lista.verificarTotales()
+
+if __name__ == "__main__":
+    unittest.main()